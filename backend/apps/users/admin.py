@@ -1,7 +1,7 @@
 from django.contrib import admin
 from .models import (
     User, Category, Expense, ChildrenContribution,
-    Milestone, UserMilestone, UserResponse
+    Milestone, UserMilestone, UserResponse, OutboundEmail
 )
 
 @admin.register(User)
@@ -37,11 +37,11 @@ class CategoryAdmin(admin.ModelAdmin):
 @admin.register(Expense)
 class ExpenseAdmin(admin.ModelAdmin):
     list_display = [
-        'expense_date', 'user_id', 'category_id', 'amount', 'created_at'
+        'expense_id', 'expense_date', 'user_id', 'category_id', 'amount', 'created_at'
     ]
     list_filter = ['category_id', 'created_at']
     search_fields = ['user_id__username', 'category_id__name']
-    readonly_fields = ['created_at']
+    readonly_fields = ['expense_id', 'created_at']
     date_hierarchy = 'expense_date'
     ordering = ['-expense_date']
 
@@ -138,4 +138,16 @@ class UserResponseAdmin(admin.ModelAdmin):
         ('Home Ownership', {
             'fields': ('bought_home', 'pay_off_home', 'mortgage_remaining')
         }),
-    )
\ No newline at end of file
+    )
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = [
+        'email_id', 'recipient', 'subject', 'status', 'attempts',
+        'next_attempt_at', 'created_at', 'sent_at'
+    ]
+    list_filter = ['status', 'created_at']
+    search_fields = ['recipient', 'subject']
+    readonly_fields = ['email_id', 'created_at', 'sent_at', 'last_error']
+    ordering = ['-created_at']
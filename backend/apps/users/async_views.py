@@ -0,0 +1,144 @@
+# backend/apps/users/async_views.py
+"""
+Async versions of the dashboard and milestones-status endpoints.
+
+Served concurrently when the project runs under ASGI (config/asgi.py).
+Django's a*() ORM methods all run on one shared thread, so they would still
+execute one after another. Independent queries therefore run through
+sync_to_async(thread_sensitive=False) on the event loop's thread pool. Each
+pool thread keeps its own database connection between calls, subject to
+CONN_MAX_AGE like a request thread, so a dashboard does not pay a
+connection setup per query.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import close_old_connections
+from django.http import JsonResponse
+from rest_framework.exceptions import AuthenticationFailed
+
+from .authentication import ClaimsJWTAuthentication
+from .caching import (
+    cache_timeout,
+    milestone_cache_key,
+    milestone_validators,
+    user_cache_key,
+    user_payload_validators,
+)
+from .conditional import not_modified, set_validators
+from .milestone_logic import (
+    build_milestone_status,
+    get_latest_response_with_user,
+    get_milestone_category_totals,
+    missing_response_status,
+)
+from .services import get_month_spend
+from .views import build_dashboard_payload, get_recent_expenses
+
+
+def _concurrent(func):
+    """Run a blocking ORM function on a pool thread, with that thread's DB connection."""
+    def call(*args, **kwargs):
+        # What request_started / request_finished do for a request thread:
+        # drop the connection only if it is broken or older than CONN_MAX_AGE
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+    return sync_to_async(call, thread_sensitive=False)
+
+
+async def _authenticate(request):
+    """Return the JWT-authenticated user, or None."""
+    try:
+        result = await sync_to_async(ClaimsJWTAuthentication().authenticate)(request)
+    except AuthenticationFailed:
+        return None
+    return result[0] if result else None
+
+
+def _unauthorized():
+    return JsonResponse(
+        {"detail": "Authentication credentials were not provided."},
+        status=401,
+    )
+
+
+async def evaluate_milestones_async(user_id):
+    """evaluate_milestones() with its two queries issued concurrently."""
+    key = await sync_to_async(milestone_cache_key)(user_id)
+    data = await cache.aget(key)
+    if data is not None:
+        return data
+
+    latest_response, totals = await asyncio.gather(
+        _concurrent(get_latest_response_with_user)(user_id),
+        _concurrent(get_milestone_category_totals)(user_id),
+    )
+    if not latest_response:
+        data = await _concurrent(missing_response_status)(user_id)
+    else:
+        data = build_milestone_status(latest_response, totals)
+    await cache.aset(key, data, cache_timeout())
+    return data
+
+
+async def dashboard(request):
+    """
+    GET /api/async/users/dashboard/
+    Same payload, cache and ETag / Last-Modified as /api/users/dashboard/.
+    """
+    if request.method != "GET":
+        return JsonResponse({"detail": f'Method "{request.method}" not allowed.'}, status=405)
+
+    user = await _authenticate(request)
+    if user is None:
+        return _unauthorized()
+
+    etag, last_modified = await sync_to_async(user_payload_validators)("dashboard", user.user_id)
+    response = not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+
+    key = await sync_to_async(user_cache_key)("dashboard", user.user_id)
+    data = await cache.aget(key)
+    if data is None:
+        # The token user only carries its claims: salary and total_balance
+        # need the full row, loaded alongside the other queries.
+        try:
+            profile, recent_expenses, monthly_expenses, milestone_status = await asyncio.gather(
+                _concurrent(user.load)(),
+                _concurrent(get_recent_expenses)(user),
+                _concurrent(get_month_spend)(user),
+                evaluate_milestones_async(user.user_id),
+            )
+        except AuthenticationFailed:
+            return _unauthorized()  # the user was deleted or deactivated
+        data = build_dashboard_payload(profile, recent_expenses, monthly_expenses, milestone_status)
+        await cache.aset(key, data, cache_timeout())
+    return set_validators(JsonResponse(data), etag, last_modified)
+
+
+async def milestones_status(request):
+    """
+    GET /api/async/user-responses/milestones-status/?user_id=X
+    Same payload and ETag / Last-Modified as /api/user-responses/milestones-status/.
+    """
+    if request.method != "GET":
+        return JsonResponse({"detail": f'Method "{request.method}" not allowed.'}, status=405)
+
+    if await _authenticate(request) is None:
+        return _unauthorized()
+
+    user_id = request.GET.get("user_id")
+    etag = last_modified = None
+    if user_id:
+        etag, last_modified = await sync_to_async(milestone_validators)(user_id)
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+
+    data = await evaluate_milestones_async(user_id)
+    return set_validators(JsonResponse(data), etag, last_modified)
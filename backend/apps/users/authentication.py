@@ -0,0 +1,158 @@
+# backend/apps/users/authentication.py
+import threading
+import time
+
+from django.conf import settings
+from django.db.models import Max
+from django.utils.functional import SimpleLazyObject, empty
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import TokenRevocation, User
+
+
+class TokenAccessRegistry:
+    """
+    Process-local view of which users' tokens must be refused: inactive
+    users and users whose tokens were revoked, i.e. every token issued
+    before the revocation (password change, deletion).
+
+    Signals update this process immediately and record revocations in the
+    TokenRevocation table. Both sets are reloaded from the database every
+    TOKEN_ACCESS_TTL seconds, which bounds how long another worker keeps
+    accepting a token, whatever the cache backend.
+    """
+
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+        self._inactive = None
+        self._revoked = {}
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def _expired(self) -> bool:
+        return self.ttl is not None and time.monotonic() - self._loaded_at > self.ttl
+
+    def _load(self):
+        if self._inactive is not None and not self._expired():
+            return self._inactive, self._revoked
+
+        with self._lock:
+            if self._inactive is None or self._expired():
+                self._inactive = set(User.objects.filter(is_active=False).values_list("user_id", flat=True))
+                self._prune()
+                revoked = self._stored_revocations()
+                for user_id, revoked_at in self._revoked.items():
+                    revoked[user_id] = max(revoked_at, revoked.get(user_id, revoked_at))
+                self._revoked = revoked
+                self._loaded_at = time.monotonic()
+            return self._inactive, self._revoked
+
+    @staticmethod
+    def _oldest() -> int:
+        # Tokens issued before this have expired anyway
+        return int(time.time() - api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+
+    def _prune(self):
+        oldest = self._oldest()
+        self._revoked = {user_id: at for user_id, at in self._revoked.items() if at >= oldest}
+
+    def _stored_revocations(self) -> dict:
+        """Latest unexpired revocation per user, recorded by any worker."""
+        rows = (
+            TokenRevocation.objects.filter(revoked_at__gte=self._oldest())
+            .values("user_id")
+            .annotate(revoked_at=Max("revoked_at"))
+            .values_list("user_id", "revoked_at")
+        )
+        return dict(rows)
+
+    def allows(self, user_id, issued_at) -> bool:
+        inactive, revoked = self._load()
+        if user_id in inactive:
+            return False
+        revoked_at = revoked.get(user_id)
+        return revoked_at is None or (issued_at is not None and issued_at >= revoked_at)
+
+    def set_active(self, user_id, is_active: bool) -> None:
+        inactive = self._inactive
+        if inactive is None:
+            return  # not loaded yet: the next load reads the database
+        if is_active:
+            inactive.discard(user_id)
+        else:
+            inactive.add(user_id)
+
+    def revoke(self, user_id) -> None:
+        """Refuse every token of this user issued before now."""
+        revoked_at = int(time.time())
+        # Same transaction as the password change / deletion that caused it
+        TokenRevocation.objects.filter(revoked_at__lt=self._oldest()).delete()
+        TokenRevocation.objects.create(user_id=user_id, revoked_at=revoked_at)
+        with self._lock:
+            self._revoked[user_id] = revoked_at
+            self._prune()
+
+
+token_access = TokenAccessRegistry(ttl=getattr(settings, "TOKEN_ACCESS_TTL", 60))
+
+
+class ClaimsUser(SimpleLazyObject):
+    """
+    The request user, built from the access token claims (user_id, email)
+    without a query. Any other attribute - salary, total_balance, passing
+    the user to the ORM, isinstance() - loads the full User row once.
+    """
+
+    def __init__(self, user_id, email=None):
+        super().__init__(lambda: _load_user(user_id))
+        # Set on the proxy itself, so reading them never triggers the load
+        self.__dict__.update(
+            user_id=user_id,
+            pk=user_id,
+            is_active=True,
+            is_authenticated=True,
+            is_anonymous=False,
+        )
+        if email is not None:
+            self.__dict__["email"] = email
+
+    def __bool__(self):
+        # IsAuthenticated checks bool(request.user); the proxy would load for it
+        return True
+
+    def load(self):
+        """The full User row, fetched on first use."""
+        if self._wrapped is empty:
+            self._setup()
+        return self._wrapped
+
+
+def _load_user(user_id):
+    try:
+        user = User.objects.get(user_id=user_id)
+    except User.DoesNotExist:
+        raise AuthenticationFailed("User not found", code="user_not_found")
+    if not user.is_active:
+        raise AuthenticationFailed("User is inactive", code="user_inactive")
+    return user
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication without the per-request User lookup: the user comes
+    from the token claims (see ClaimsUser), checked against token_access
+    for deactivated users and revoked tokens.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        if not token_access.allows(user_id, validated_token.get("iat")):
+            raise AuthenticationFailed("User is inactive or the token was revoked", code="token_revoked")
+        return ClaimsUser(user_id, validated_token.get("email"))
@@ -0,0 +1,148 @@
+# backend/apps/users/caching.py
+import hashlib
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+GLOBAL_VERSION_KEY = "pfm:version:global"
+
+
+def _user_version_key(user_id) -> str:
+    return f"pfm:version:user:{user_id}"
+
+
+def _initial_version() -> int:
+    # Millisecond clock: if a version key expires or is evicted, its replacement
+    # starts above any value the old key could have reached.
+    return int(time.time() * 1000)
+
+
+def _milestone_version_key(user_id) -> str:
+    return f"pfm:version:milestones:{user_id}"
+
+
+def _modified_key(version_key: str) -> str:
+    return f"{version_key}:modified"
+
+
+def _get_versions(keys: list) -> tuple:
+    """Current values of the version keys, in one cache round trip."""
+    versions = cache.get_many(keys)
+
+    missing = {key: _initial_version() for key in keys if key not in versions}
+    for key, value in missing.items():
+        # add() keeps a value another process set in the meantime
+        cache.add(key, value, timeout=cache_timeout())
+        versions[key] = cache.get(key, value)
+
+    return tuple(versions[key] for key in keys)
+
+
+def get_data_versions(user_id) -> tuple:
+    """(global version, user version) in one cache round trip."""
+    return _get_versions([GLOBAL_VERSION_KEY, _user_version_key(user_id)])
+
+
+def _bump(key: str) -> None:
+    # Once the write is committed: bumped inside the transaction, a
+    # concurrent request could cache the pre-commit rows under the new
+    # version. Outside a transaction on_commit runs immediately.
+    transaction.on_commit(lambda: _bump_now(key))
+
+
+def _bump_now(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_version(), timeout=cache_timeout())
+    # Rounded up, so a write never looks older than a response it follows
+    cache.set(_modified_key(key), math.ceil(time.time()), timeout=cache_timeout())
+
+
+def _get_last_modified(keys: list) -> int:
+    """
+    Latest bump of the version keys, in epoch seconds. A stamp that was
+    evicted (or never written) restarts at "now": too recent is safe,
+    too old would let clients keep stale data.
+    """
+    modified_keys = [_modified_key(key) for key in keys]
+    stamps = cache.get_many(modified_keys)
+    for key in modified_keys:
+        if key not in stamps:
+            cache.add(key, math.ceil(time.time()), timeout=cache_timeout())
+            stamps[key] = cache.get(key, math.ceil(time.time()))
+    return max(stamps.values())
+
+
+def bump_user_data_version(user_id) -> None:
+    """Invalidate every cached payload derived from this user's data."""
+    _bump(_user_version_key(user_id))
+
+
+def bump_user_milestone_version(user_id) -> None:
+    """
+    Invalidate the user's cached milestone status. Only bumped by writes
+    that feed the baby steps, so e.g. a Groceries expense keeps it.
+    """
+    _bump(_milestone_version_key(user_id))
+
+
+def bump_global_data_version() -> None:
+    """Invalidate cached payloads for all users (e.g. a category was renamed)."""
+    _bump(GLOBAL_VERSION_KEY)
+
+
+def user_cache_key(name: str, user_id, *parts) -> str:
+    """
+    Cache key for a per-user payload. It embeds the current data versions
+    and month, so writes and month boundaries make old entries unreachable.
+    """
+    global_version, user_version = get_data_versions(user_id)
+    suffix = ":".join(str(part) for part in parts)
+    month = timezone.now().date().strftime("%Y-%m")
+    return f"pfm:{name}:{user_id}:{global_version}.{user_version}:{month}:{suffix}"
+
+
+def milestone_cache_key(user_id) -> str:
+    """Cache key for a user's milestone status (see bump_user_milestone_version)."""
+    global_version, milestone_version = _get_versions(
+        [GLOBAL_VERSION_KEY, _milestone_version_key(user_id)]
+    )
+    return f"pfm:milestones:{user_id}:{global_version}.{milestone_version}"
+
+
+def _month_start() -> int:
+    """Start of the current month in epoch seconds; payloads roll over then."""
+    # Same clock as the month in user_cache_key
+    start = timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    return int(start.timestamp())
+
+
+def _etag(cache_key: str) -> str:
+    return '"%s"' % hashlib.md5(cache_key.encode()).hexdigest()
+
+
+def user_payload_validators(name: str, user_id, *parts) -> tuple:
+    """
+    (ETag, Last-Modified epoch seconds) for a per-user payload. Both change
+    exactly when user_cache_key(name, user_id, *parts) does, so a client
+    revalidating them costs cache reads only, no database queries.
+    """
+    key = user_cache_key(name, user_id, *parts)
+    last_modified = _get_last_modified([GLOBAL_VERSION_KEY, _user_version_key(user_id)])
+    return _etag(key), max(last_modified, _month_start())
+
+
+def milestone_validators(user_id) -> tuple:
+    """(ETag, Last-Modified epoch seconds) for a user's milestone status."""
+    key = milestone_cache_key(user_id)
+    last_modified = _get_last_modified([GLOBAL_VERSION_KEY, _milestone_version_key(user_id)])
+    return _etag(key), last_modified
+
+
+def cache_timeout() -> int:
+    return getattr(settings, "USER_PAYLOAD_CACHE_TIMEOUT", 300)
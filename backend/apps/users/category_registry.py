@@ -0,0 +1,70 @@
+# backend/apps/users/category_registry.py
+import threading
+import time
+
+from django.conf import settings
+
+from .models import Category
+
+
+class CategoryRegistry:
+    """
+    Process-local, case-insensitive map of category name -> category_id.
+
+    Loaded from the database on first use and dropped by the Category
+    post_save / post_delete signals. Signals only reach the current
+    process, so other workers also reload the map every `ttl` seconds
+    (renames, deletions) and on a lookup miss, at most once per
+    `miss_reload_interval` seconds (categories created elsewhere).
+    """
+
+    def __init__(self, ttl=60, miss_reload_interval=1.0):
+        self.ttl = ttl
+        self.miss_reload_interval = miss_reload_interval
+        self._ids = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def _expired(self) -> bool:
+        return self.ttl is not None and time.monotonic() - self._loaded_at > self.ttl
+
+    def _load(self) -> dict:
+        ids = self._ids
+        if ids is not None and not self._expired():
+            return ids
+
+        with self._lock:
+            if self._ids is None or self._expired():
+                self._ids = {
+                    name.casefold(): category_id
+                    for category_id, name in Category.objects.values_list("category_id", "name")
+                }
+                self._loaded_at = time.monotonic()
+            return self._ids
+
+    def _lookup(self, names) -> dict:
+        """The map, reloaded first if it lacks one of `names` and may be stale."""
+        ids = self._load()
+        if all(name.casefold() in ids for name in names):
+            return ids
+        with self._lock:
+            if self._ids is ids and time.monotonic() - self._loaded_at >= self.miss_reload_interval:
+                self._ids = None
+        return self._load()
+
+    def get_id(self, name: str):
+        """category_id for `name` (case-insensitive), or None if it does not exist."""
+        return self._lookup([name]).get(name.casefold())
+
+    def get_ids(self, names) -> dict:
+        """{name: category_id} for the given names that exist."""
+        names = list(names)
+        ids = self._lookup(names)
+        return {name: ids[name.casefold()] for name in names if name.casefold() in ids}
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._ids = None
+
+
+category_registry = CategoryRegistry(ttl=getattr(settings, "CATEGORY_REGISTRY_TTL", 60))
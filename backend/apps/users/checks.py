@@ -0,0 +1,22 @@
+# backend/apps/users/checks.py
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+
+@register(Tags.caches, deploy=True)
+def check_conditional_get_cache(app_configs, **kwargs):
+    """304 responses are only correct if every worker sees the same version keys."""
+    backend = settings.CACHES["default"]["BACKEND"]
+    if settings.CONDITIONAL_GET and backend in settings.PROCESS_LOCAL_CACHE_BACKENDS:
+        return [
+            Warning(
+                "CONDITIONAL_GET is enabled with a process-local cache (%s)." % backend,
+                hint=(
+                    "With more than one worker, a worker that did not see a write keeps "
+                    "answering 304 Not Modified until its version keys expire. Point "
+                    "CACHE_BACKEND at a shared cache (e.g. Redis) or set CONDITIONAL_GET=False."
+                ),
+                id="users.W001",
+            )
+        ]
+    return []
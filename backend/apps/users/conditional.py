@@ -0,0 +1,48 @@
+# backend/apps/users/conditional.py
+"""
+Conditional GET for the polled read endpoints.
+
+The validators (ETag, Last-Modified) come from the same cache version
+stamps the payload caches use, so a poll whose data did not change is
+answered 304 Not Modified before any aggregation query runs. Disabled
+unless settings.CONDITIONAL_GET (which needs a cache shared by all workers).
+"""
+from functools import wraps
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def set_validators(response, etag, last_modified):
+    """Attach ETag / Last-Modified to a successful response."""
+    if etag and settings.CONDITIONAL_GET and 200 <= response.status_code < 300:
+        response.headers.setdefault("ETag", etag)
+        response.headers.setdefault("Last-Modified", http_date(last_modified))
+    return response
+
+
+def not_modified(request, etag, last_modified):
+    """The 304 (or 412) response the request's preconditions call for, or None."""
+    if not etag or not settings.CONDITIONAL_GET:
+        return None
+    return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+
+def conditional(validators):
+    """
+    Decorator for viewset actions. `validators(request)` returns
+    (etag, last_modified epoch seconds), or (None, None) to skip the check,
+    e.g. for an anonymous request the action itself will reject.
+    """
+    def decorator(action_method):
+        @wraps(action_method)
+        def wrapper(self, request, *args, **kwargs):
+            etag, last_modified = validators(request)
+            response = not_modified(request, etag, last_modified)
+            if response is not None:
+                return response
+            response = action_method(self, request, *args, **kwargs)
+            return set_validators(response, etag, last_modified)
+        return wrapper
+    return decorator
@@ -0,0 +1,120 @@
+# backend/apps/users/email_outbox.py
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+
+def queue_email(subject: str, message: str, recipient: str, from_email: str = None) -> OutboundEmail:
+    """
+    Store an email in the outbox instead of sending it inline.
+    The send_queued_emails worker delivers it later.
+    """
+    return OutboundEmail.objects.create(
+        subject=subject[:255],
+        body=message,
+        from_email=from_email or getattr(settings, "DEFAULT_FROM_EMAIL", "") or "",
+        recipient=recipient,
+    )
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff: base delay doubled for every failed attempt."""
+    base = getattr(settings, "EMAIL_OUTBOX_RETRY_DELAY", 60)
+    return timedelta(seconds=base * (2 ** (attempts - 1)))
+
+
+def _claim_batch(batch_size: int) -> list:
+    """
+    Claim up to `batch_size` due emails for this worker and commit. Claimed
+    rows are 'sending' until the claim expires (EMAIL_OUTBOX_CLAIM_TIMEOUT),
+    so a worker that dies mid-batch only delays its emails.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        batch = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(status__in=["pending", "sending"], next_attempt_at__lte=now)
+            .order_by("next_attempt_at", "email_id")[:batch_size]
+        )
+        if batch:
+            claimed_until = now + timedelta(seconds=getattr(settings, "EMAIL_OUTBOX_CLAIM_TIMEOUT", 300))
+            OutboundEmail.objects.filter(pk__in=[email.pk for email in batch]).update(
+                status="sending", next_attempt_at=claimed_until
+            )
+    return batch
+
+
+def send_queued_emails(batch_size: int = None, max_attempts: int = None) -> dict:
+    """
+    Deliver one batch of due outbox emails over a single SMTP connection.
+    The batch is claimed in a short transaction and sent after it commits,
+    so no row lock is held while talking to the SMTP server.
+    Failed messages are retried with exponential backoff and marked
+    'failed' after `max_attempts`. Returns counts of sent / retried / failed.
+    """
+    batch_size = batch_size or getattr(settings, "EMAIL_OUTBOX_BATCH_SIZE", 50)
+    max_attempts = max_attempts or getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 5)
+    counts = {"sent": 0, "retried": 0, "failed": 0}
+
+    batch = _claim_batch(batch_size)
+    if not batch:
+        return counts
+
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as exc:
+        # Server unreachable: push the whole batch back.
+        logger.exception("Could not open email connection")
+        for email in batch:
+            counts[_record_failure(email, exc, max_attempts)] += 1
+        return counts
+
+    try:
+        for email in batch:
+            message = EmailMessage(
+                subject=email.subject,
+                body=email.body,
+                from_email=email.from_email or None,
+                to=[email.recipient],
+                connection=connection,
+            )
+            try:
+                message.send()
+            except Exception as exc:
+                logger.warning("Failed to send email %s: %s", email.email_id, exc)
+                counts[_record_failure(email, exc, max_attempts)] += 1
+                continue
+
+            email.status = "sent"
+            email.attempts += 1
+            email.sent_at = timezone.now()
+            email.last_error = ""
+            email.save(update_fields=["status", "attempts", "sent_at", "last_error"])
+            counts["sent"] += 1
+    finally:
+        connection.close()
+
+    return counts
+
+
+def _record_failure(email: OutboundEmail, exc: Exception, max_attempts: int) -> str:
+    email.attempts += 1
+    email.last_error = str(exc)
+    if email.attempts >= max_attempts:
+        email.status = "failed"
+        outcome = "failed"
+    else:
+        email.status = "pending"
+        email.next_attempt_at = timezone.now() + _retry_delay(email.attempts)
+        outcome = "retried"
+    email.save(update_fields=["status", "attempts", "last_error", "next_attempt_at"])
+    return outcome
@@ -0,0 +1,135 @@
+# apps/users/management/commands/benchmark_endpoints.py
+import json
+import math
+import random
+import time
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+
+from apps.users.models import Category, Expense
+from apps.users.testing import access_token
+
+from .generate_synthetic_data import synthetic_users
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the hot endpoints against the generate_synthetic_data users and "
+        "report p50/p95/p99 latency and query counts as JSON"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--prefix", default="synthetic", help="Prefix the dataset was generated with")
+        parser.add_argument("--password", default="synthetic-pass", help="Password the dataset was generated with")
+        parser.add_argument("--users", type=int, default=20, help="Number of users to sample")
+        parser.add_argument("--iterations", type=int, default=5, help="Requests per endpoint per sampled user")
+        parser.add_argument("--cold", action="store_true", help="Clear the cache before every request")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--output", help="Also write the JSON report to this file")
+
+    def handle(self, *args, **options):
+        users = list(synthetic_users(options["prefix"]).order_by("user_id"))
+        if not users:
+            raise CommandError(
+                f"No users with prefix '{options['prefix']}'. Run generate_synthetic_data first."
+            )
+        rng = random.Random(options["seed"])
+        sample = rng.sample(users, min(options["users"], len(users)))
+        category_ids = list(Category.objects.values_list("category_id", flat=True))
+
+        # Allows the test client host and swaps in the locmem email backend
+        setup_test_environment()
+        created = []
+        try:
+            samples = self._run(sample, category_ids, created, options)
+        finally:
+            # Remove the benchmark's own expenses (signals keep MonthlySpend in sync)
+            for expense in Expense.objects.filter(expense_id__in=created):
+                expense.delete()
+            teardown_test_environment()
+
+        report = {
+            "database": connection.vendor,
+            "users_sampled": len(sample),
+            "iterations": options["iterations"],
+            "cold_cache": options["cold"],
+            "endpoints": {name: self._summarize(runs) for name, runs in samples.items()},
+        }
+        output = json.dumps(report, indent=2)
+        self.stdout.write(output)
+        if options["output"]:
+            with open(options["output"], "w") as fh:
+                fh.write(output + "\n")
+            self.stdout.write(self.style.SUCCESS(f"Report written to {options['output']}"))
+
+    def _endpoints(self, user, category_ids, rng, options, iteration):
+        """(name, method, path, payload) for one sampled user."""
+        # Expenses are unique per (user, date, category): create on dates far
+        # outside the generated window so inserts never collide.
+        create_date = date(2000, 1, 1) + timedelta(days=iteration)
+        return [
+            ("login", "post", "/api/users/login/", {
+                "email": user.email, "password": options["password"],
+            }),
+            ("dashboard", "get", "/api/users/dashboard/", None),
+            ("monthly_summary", "get", "/api/expenses/monthly-summary/", None),
+            ("expense_list", "get", "/api/expenses/", None),
+            ("expense_create", "post", "/api/expenses/", {
+                "expense_date": create_date.isoformat(),
+                "user_id": user.user_id,
+                "category_id": rng.choice(category_ids),
+                "amount": "12.34",
+            }),
+            ("milestones_status", "get", f"/api/user-responses/milestones-status/?user_id={user.user_id}", None),
+        ]
+
+    def _run(self, sample, category_ids, created, options):
+        rng = random.Random(options["seed"])
+        samples = {}
+        for user in sample:
+            client = Client(HTTP_AUTHORIZATION=f"Bearer {access_token(user)}")
+            for iteration in range(options["iterations"]):
+                endpoints = self._endpoints(user, category_ids, rng, options, iteration)
+                for name, method, path, payload in endpoints:
+                    if options["cold"]:
+                        cache.clear()
+                    request = getattr(client, method)
+                    kwargs = {"data": payload, "content_type": "application/json"} if payload else {}
+
+                    with CaptureQueriesContext(connection) as queries:
+                        start = time.perf_counter()
+                        response = request(path, **kwargs)
+                        elapsed = time.perf_counter() - start
+
+                    if name == "expense_create" and response.status_code == 201:
+                        created.append(response.json()["expense_id"])
+                    samples.setdefault(name, []).append(
+                        (elapsed * 1000, len(queries.captured_queries), response.status_code)
+                    )
+        return samples
+
+    def _summarize(self, runs):
+        times = [ms for ms, _, _ in runs]
+        queries = [count for _, count, _ in runs]
+        return {
+            "requests": len(runs),
+            "errors": sum(1 for _, _, code in runs if code >= 400),
+            "p50_ms": round(percentile(times, 50), 2),
+            "p95_ms": round(percentile(times, 95), 2),
+            "p99_ms": round(percentile(times, 99), 2),
+            "mean_ms": round(sum(times) / len(times), 2),
+            "queries_p50": percentile(queries, 50),
+            "queries_max": max(queries),
+        }
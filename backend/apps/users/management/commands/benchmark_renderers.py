@@ -0,0 +1,88 @@
+# apps/users/management/commands/benchmark_renderers.py
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.middleware.gzip import GZipMiddleware
+from django.utils.text import compress_string
+from rest_framework.renderers import JSONRenderer
+
+from apps.users.milestone_logic import compute_milestone_status
+from apps.users.models import Expense, User, UserMilestone, UserResponse
+from apps.users.renderers import FastJSONRenderer, orjson
+from apps.users.services import default_analytics_range, get_category_analytics
+from apps.users.values_serializers import expense_values, user_milestone_values
+from apps.users.views import UserViewSet
+
+from .benchmark_serialization import best_of
+
+
+def paginated(rows):
+    # Shape of a cursor-paginated list response
+    return {
+        "next": "http://testserver/api/expenses/?cursor=cD0yMDI2LTEwLTE4",
+        "previous": None,
+        "results": rows,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare DRF's JSONRenderer with FastJSONRenderer on real payloads: "
+        "render time, and bytes on the wire with and without gzip"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=500, help="Rows per list page (API_MAX_PAGE_SIZE is 500)")
+        parser.add_argument("--repeat", type=int, default=20, help="Best of N runs")
+
+    def handle(self, *args, **options):
+        payloads = self._payloads(options["rows"])
+        if not payloads:
+            raise CommandError("No data to render. Run generate_synthetic_data first.")
+
+        drf, fast = JSONRenderer(), FastJSONRenderer()
+        report, mismatches = {"orjson": orjson is not None}, []
+        for name, data in payloads.items():
+            drf_ms, drf_body = best_of(lambda: drf.render(data), options["repeat"])
+            fast_ms, fast_body = best_of(lambda: fast.render(data), options["repeat"])
+            if json.loads(drf_body) != json.loads(fast_body):
+                mismatches.append(name)
+
+            start = time.perf_counter()
+            gzipped = compress_string(fast_body, max_random_bytes=GZipMiddleware.max_random_bytes)
+            gzip_ms = (time.perf_counter() - start) * 1000
+
+            report[name] = {
+                "render_ms": {"json_renderer": round(drf_ms, 3), "fast_json_renderer": round(fast_ms, 3)},
+                "render_speedup": round(drf_ms / fast_ms, 2),
+                "identical_bytes": drf_body == fast_body,
+                "bytes": len(fast_body),
+                "gzip_bytes": len(gzipped),
+                "gzip_ratio": round(len(gzipped) / len(fast_body), 3),
+                "gzip_ms": round(gzip_ms, 3),
+            }
+
+        self.stdout.write(json.dumps(report, indent=2))
+        if mismatches:
+            raise CommandError(f"FastJSONRenderer output differs from JSONRenderer for: {', '.join(mismatches)}")
+
+    def _payloads(self, rows):
+        """Response bodies of the large endpoints, as the views build them."""
+        payloads = {}
+
+        expenses = expense_values.project(Expense.objects.order_by("-expense_date", "-created_at")[:rows])
+        if expenses:
+            payloads["expense_list_page"] = paginated(expense_values.serialize(expenses))
+
+        milestones = user_milestone_values.project(UserMilestone.objects.order_by("umid")[:rows])
+        if milestones:
+            payloads["user_milestone_list_page"] = paginated(user_milestone_values.serialize(milestones))
+
+        user = User.objects.filter(user_id__in=UserResponse.objects.values("user_id")).order_by("user_id").first()
+        if user is not None:
+            payloads["dashboard"] = UserViewSet()._build_dashboard(user)
+            payloads["milestones_status"] = compute_milestone_status(user.user_id)
+            date_from, date_to = default_analytics_range("week")
+            payloads["analytics"] = get_category_analytics(user, "week", date_from, date_to)
+        return payloads
@@ -0,0 +1,116 @@
+# apps/users/management/commands/benchmark_serialization.py
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from apps.users.models import ChildrenContribution, Expense, UserMilestone, UserResponse
+from apps.users.serializers import (
+    ChildrenContributionSerializer,
+    ExpenseSerializer,
+    UserMilestoneSerializer,
+    UserResponseSerializer,
+)
+from apps.users.values_serializers import (
+    children_contribution_values,
+    expense_values,
+    user_milestone_values,
+    user_response_values,
+)
+
+
+def best_of(func, repeat):
+    """(fastest run in ms, result of the last run) over `repeat` calls."""
+    best, result = None, None
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        result = func()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def cases():
+    """(name, queryset as the list endpoint builds it, ModelSerializer, ValuesSerializer)."""
+    return [
+        (
+            "expenses",
+            Expense.objects.select_related("user_id", "category_id").order_by("-expense_date", "-created_at"),
+            ExpenseSerializer,
+            expense_values,
+        ),
+        (
+            "user_milestones",
+            UserMilestone.objects.select_related("user_id", "milestone_id").order_by("umid"),
+            UserMilestoneSerializer,
+            user_milestone_values,
+        ),
+        (
+            "user_responses",
+            UserResponse.objects.select_related("user_id").order_by("-submitted_at", "-response_id"),
+            UserResponseSerializer,
+            user_response_values,
+        ),
+        (
+            "children_contributions",
+            ChildrenContribution.objects.select_related("user_id").order_by("-created_at", "-child_id"),
+            ChildrenContributionSerializer,
+            children_contribution_values,
+        ),
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare per-row cost of the ModelSerializer and values() list paths "
+        "and check that both render byte-identical JSON"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10000, help="Rows per list (at most)")
+        parser.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+
+    def handle(self, *args, **options):
+        renderer = JSONRenderer()
+        report, mismatches = {}, []
+
+        for name, queryset, serializer_class, values_serializer in cases():
+            queryset = queryset[:options["rows"]]
+            values_queryset = values_serializer.project(queryset)
+
+            # Fetch and serialize are timed separately, so database sort
+            # cost does not drown out the per-row serialization cost; .all()
+            # clones the queryset so every run really hits the database.
+            model_fetch_ms, instances = best_of(lambda: list(queryset.all()), options["repeat"])
+            values_fetch_ms, rows = best_of(lambda: list(values_queryset.all()), options["repeat"])
+            if not rows:
+                continue
+
+            model_ms, model_body = best_of(
+                lambda: renderer.render(serializer_class(instances, many=True).data), options["repeat"]
+            )
+            values_ms, values_body = best_of(
+                lambda: renderer.render(values_serializer.serialize(rows)), options["repeat"]
+            )
+            if model_body != values_body:
+                mismatches.append(name)
+
+            count = len(rows)
+            report[name] = {
+                "rows": count,
+                "fetch_us_per_row": {
+                    "model_serializer": round(model_fetch_ms * 1000 / count, 2),
+                    "values": round(values_fetch_ms * 1000 / count, 2),
+                },
+                "serialize_us_per_row": {
+                    "model_serializer": round(model_ms * 1000 / count, 2),
+                    "values": round(values_ms * 1000 / count, 2),
+                },
+                "total_speedup": round((model_fetch_ms + model_ms) / (values_fetch_ms + values_ms), 2),
+                "identical_output": model_body == values_body,
+            }
+
+        self.stdout.write(json.dumps(report, indent=2))
+        if mismatches:
+            raise CommandError(f"values() output differs from the ModelSerializer for: {', '.join(mismatches)}")
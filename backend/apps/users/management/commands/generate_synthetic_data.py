@@ -0,0 +1,189 @@
+# apps/users/management/commands/generate_synthetic_data.py
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from apps.users.milestone_logic import MILESTONE_CATEGORIES
+from apps.users.models import (
+    Category, ChildrenContribution, Expense, Milestone, User, UserMilestone, UserResponse,
+)
+from apps.users.services import bulk_create_expenses
+
+# Everyday categories, on top of the ones milestone_logic looks up by name
+EVERYDAY_CATEGORIES = ["Groceries", "Rent", "Transportation", "Utilities", "Dining Out", "Entertainment"]
+
+FIRST_NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie"]
+LAST_NAMES = ["Smith", "Tremblay", "Nguyen", "Martin", "Brown", "Roy", "Wilson", "Lee"]
+
+EMAIL_DOMAIN = "synthetic.example.com"
+
+
+def synthetic_users(prefix):
+    return User.objects.filter(email__startswith=f"{prefix}-", email__endswith=f"@{EMAIL_DOMAIN}")
+
+
+def random_amount(rng, low, high):
+    return Decimal(rng.randint(low * 100, high * 100)) / 100
+
+
+class Command(BaseCommand):
+    help = "Generate synthetic users with expenses, questionnaire answers, children and milestones"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=100, help="Number of users to create")
+        parser.add_argument("--expenses", type=int, default=500, help="Expenses per user")
+        parser.add_argument("--months", type=int, default=12, help="Spread expenses over this many months back")
+        parser.add_argument("--prefix", default="synthetic", help="Email prefix: <prefix>-<n>@" + EMAIL_DOMAIN)
+        parser.add_argument("--password", default="synthetic-pass", help="Password of every generated user")
+        parser.add_argument("--seed", type=int, default=42, help="Random seed, for reproducible datasets")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows per bulk insert")
+        parser.add_argument("--clear", action="store_true", help="Delete previously generated users with this prefix first")
+
+    def handle(self, *args, **options):
+        if options["users"] < 1 or options["expenses"] < 0 or options["months"] < 1:
+            raise CommandError("--users and --months must be positive, --expenses non-negative")
+
+        rng = random.Random(options["seed"])
+        prefix = options["prefix"]
+
+        if options["clear"]:
+            deleted, _ = synthetic_users(prefix).delete()
+            self.stdout.write(f"Deleted {deleted} rows from a previous run.")
+        elif synthetic_users(prefix).exists():
+            raise CommandError(f"Synthetic users with prefix '{prefix}' already exist; use --clear")
+
+        categories = self._ensure_categories()
+        milestones = list(Milestone.objects.order_by("milestone_id"))
+
+        with transaction.atomic():
+            users = self._create_users(rng, options)
+        self.stdout.write(f"Created {len(users)} users.")
+
+        with transaction.atomic():
+            self._create_profiles(rng, users, milestones, options["batch_size"])
+        self.stdout.write("Created questionnaire answers, children and milestones.")
+
+        total = self._create_expenses(rng, users, categories, options)
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {len(users)} users and {total} expenses "
+            f"(login: {prefix}-0@{EMAIL_DOMAIN} / {options['password']})."
+        ))
+
+    def _ensure_categories(self):
+        names = list(MILESTONE_CATEGORIES.values()) + EVERYDAY_CATEGORIES
+        existing = {c.name: c for c in Category.objects.filter(name__in=names)}
+        for name in names:
+            if name not in existing:
+                existing[name] = Category.objects.create(name=name)
+        return existing
+
+    def _create_users(self, rng, options):
+        prefix = options["prefix"]
+        password = make_password(options["password"])  # hash once, share across users
+        users = []
+        for n in range(options["users"]):
+            country = rng.choice(["Canada", "US"])
+            users.append(User(
+                email=f"{prefix}-{n}@{EMAIL_DOMAIN}",
+                password=password,
+                username=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                first_name=rng.choice(FIRST_NAMES),
+                last_name=rng.choice(LAST_NAMES),
+                phone_number="416-555-0100",
+                country=country,
+                province_state="Ontario" if country == "Canada" else "New York",
+                city="Toronto" if country == "Canada" else "Buffalo",
+                postal_code="M5V 2T6" if country == "Canada" else "14201",
+                salary=random_amount(rng, 2500, 12000),
+                total_balance=random_amount(rng, 0, 50000),
+                budget_preference="monthly",
+                email_notification=False,
+            ))
+        User.objects.bulk_create(users, batch_size=options["batch_size"])
+        # MySQL does not return the new primary keys from bulk_create
+        return list(synthetic_users(prefix).order_by("user_id"))
+
+    def _create_profiles(self, rng, users, milestones, batch_size):
+        responses, children, user_milestones = [], [], []
+        now = timezone.now()
+        for user in users:
+            children_count = rng.choice([0, 0, 1, 2, 3])
+            responses.append(UserResponse(
+                user_id=user,
+                salary_confirmed=True,
+                emergency_savings=rng.random() < 0.7,
+                emergency_savings_amount=random_amount(rng, 500, 3000),
+                has_debt=rng.random() < 0.4,
+                debt_amount=random_amount(rng, 0, 20000),
+                full_emergency_fund=rng.random() < 0.5,
+                full_emergency_fund_amount=random_amount(rng, 5000, 20000),
+                retirement_investing=rng.random() < 0.5,
+                retirement_savings_amount=random_amount(rng, 1000, 100000),
+                has_children=children_count > 0,
+                children_count=children_count,
+                bought_home=rng.random() < 0.4,
+                pay_off_home=rng.random() < 0.2,
+                mortgage_remaining=random_amount(rng, 0, 400000),
+            ))
+            for n in range(children_count):
+                children.append(ChildrenContribution(
+                    user_id=user,
+                    child_name=f"Child {n + 1}",
+                    parent_name=user.first_name,
+                    total_contribution_planned=random_amount(rng, 5000, 50000),
+                    has_total_contribution=True,
+                    monthly_contribution=random_amount(rng, 50, 500),
+                ))
+            for milestone in milestones:
+                completed = rng.random() < 0.4
+                user_milestones.append(UserMilestone(
+                    user_id=user,
+                    milestone_id=milestone,
+                    is_completed=completed,
+                    completed_at=now if completed else None,
+                ))
+
+        UserResponse.objects.bulk_create(responses, batch_size=batch_size)
+        ChildrenContribution.objects.bulk_create(children, batch_size=batch_size)
+        UserMilestone.objects.bulk_create(user_milestones, batch_size=batch_size)
+
+    def _create_expenses(self, rng, users, categories, options):
+        """Insert through bulk_create_expenses so MonthlySpend stays in sync."""
+        category_list = list(categories.values())
+        today = date.today()
+        span = options["months"] * 30
+        # Expenses are unique per (user, expense_date, category)
+        slots = span * len(category_list)
+        if options["expenses"] > slots:
+            raise CommandError(
+                f"At most {slots} expenses per user fit in {options['months']} months "
+                f"x {len(category_list)} categories; raise --months"
+            )
+
+        batch, total = [], 0
+        for user in users:
+            for slot in rng.sample(range(slots), options["expenses"]):
+                days_back, category_index = divmod(slot, len(category_list))
+                batch.append(Expense(
+                    user_id=user,
+                    category_id=category_list[category_index],
+                    expense_date=today - timedelta(days=days_back),
+                    amount=random_amount(rng, 1, 300),
+                ))
+                if len(batch) >= options["batch_size"]:
+                    total += self._flush(batch)
+                    batch = []
+        if batch:
+            total += self._flush(batch)
+        return total
+
+    def _flush(self, batch):
+        with transaction.atomic():
+            bulk_create_expenses(batch)
+        self.stdout.write(f"  ... {len(batch)} expenses")
+        return len(batch)
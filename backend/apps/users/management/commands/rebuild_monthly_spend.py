@@ -0,0 +1,28 @@
+# apps/users/management/commands/rebuild_monthly_spend.py
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.users.models import User
+from apps.users.services import rebuild_monthly_spend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the MonthlySpend rollup table from the raw expenses table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            help="Only rebuild the rollup rows of this user",
+        )
+
+    def handle(self, *args, **options):
+        user = None
+        if options["user_id"] is not None:
+            try:
+                user = User.objects.get(user_id=options["user_id"])
+            except User.DoesNotExist:
+                raise CommandError(f"User {options['user_id']} does not exist")
+
+        self.stdout.write("Rebuilding monthly spend rollup...")
+        count = rebuild_monthly_spend(user)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {count} rollup rows."))
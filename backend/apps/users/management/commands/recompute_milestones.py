@@ -0,0 +1,76 @@
+# apps/users/management/commands/recompute_milestones.py
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from apps.users.models import UserResponse
+from apps.users.services import recompute_milestones_for_users
+
+
+def iter_user_id_chunks(chunk_size):
+    """Ids of users with a questionnaire answer, in keyset-paginated chunks."""
+    last = 0
+    while True:
+        chunk = list(
+            UserResponse.objects.filter(user_id__gt=last)
+            .order_by("user_id")
+            .values_list("user_id", flat=True)
+            .distinct()[:chunk_size]
+        )
+        if not chunk:
+            return
+        yield chunk
+        last = chunk[-1]
+
+
+def _recompute_chunk(user_ids):
+    # Runs in a pool worker: never share a connection across processes
+    try:
+        return recompute_milestones_for_users(user_ids)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = "Recompute every user's baby-step milestones in bulk (e.g. nightly)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000, help="Users per batch")
+        parser.add_argument(
+            "--workers", type=int, default=0,
+            help="Process pool size; 0 runs every chunk in this process",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size, workers = options["chunk_size"], options["workers"]
+        if chunk_size < 1 or workers < 0:
+            raise CommandError("--chunk-size must be positive and --workers non-negative")
+
+        start = time.monotonic()
+        evaluated = written = 0
+        chunks = iter_user_id_chunks(chunk_size)
+
+        if workers:
+            # Read every chunk first and close this process's connections,
+            # so forked workers never inherit an open one.
+            chunks = list(chunks)
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as pool:
+                results = pool.map(_recompute_chunk, chunks)
+                for users, rows in results:
+                    evaluated += users
+                    written += rows
+        else:
+            for chunk in chunks:
+                users, rows = recompute_milestones_for_users(chunk)
+                evaluated += users
+                written += rows
+                self.stdout.write(f"  ... {evaluated} users")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Recomputed milestones for {evaluated} users, "
+            f"wrote {written} UserMilestone rows in {time.monotonic() - start:.1f}s."
+        ))
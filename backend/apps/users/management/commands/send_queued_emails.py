@@ -0,0 +1,42 @@
+# apps/users/management/commands/send_queued_emails.py
+import time
+from django.core.management.base import BaseCommand
+
+from apps.users.email_outbox import send_queued_emails
+
+
+class Command(BaseCommand):
+    help = "Deliver queued emails from the email outbox"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, help="Emails sent per SMTP connection")
+        parser.add_argument("--max-attempts", type=int, help="Attempts before an email is marked failed")
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running and poll the outbox instead of exiting when it is empty",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait between polls when the outbox is empty (with --loop)",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            counts = send_queued_emails(
+                batch_size=options["batch_size"],
+                max_attempts=options["max_attempts"],
+            )
+            if any(counts.values()):
+                self.stdout.write(
+                    f"Sent {counts['sent']}, retrying {counts['retried']}, failed {counts['failed']}"
+                )
+                continue
+
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(self.style.SUCCESS("Email outbox drained."))
@@ -0,0 +1,146 @@
+# backend/apps/users/middleware.py
+import contextvars
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+
+logger = logging.getLogger(__name__)
+
+# Metrics of the request being served. contextvars follow the request into
+# sync_to_async / async_to_sync threads, so queries issued from worker
+# threads (e.g. apps/users/async_views.py) are counted too.
+_current_metrics = contextvars.ContextVar("query_metrics", default=None)
+
+
+class QueryMetrics:
+    """Query count, total DB time and slowest statement of one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.slowest_duration = 0.0
+        self.slowest_sql = ""
+
+    def record(self, sql, duration):
+        self.count += 1
+        self.duration += duration
+        if duration > self.slowest_duration:
+            self.slowest_duration = duration
+            self.slowest_sql = sql
+
+
+def _record_query(execute, sql, params, many, context):
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.record(sql, time.perf_counter() - start)
+
+
+def instrument_connection(sender, connection, **kwargs):
+    """connection_created receiver: time every statement on this connection."""
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+class QueryMetricsMiddleware:
+    """
+    Records the SQL query count, total DB time and slowest statement of
+    every request. Works with DEBUG off.
+
+    The numbers are returned in a Server-Timing header and logged. A
+    warning is logged when a view runs more queries than its threshold:
+    QUERY_COUNT_WARNING_THRESHOLDS maps (method, URL name) pairs, e.g.
+    ("GET", "user-dashboard"), to a limit, and other requests use
+    QUERY_COUNT_WARNING_THRESHOLD.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, "QUERY_METRICS_ENABLED", True)
+        self.default_threshold = getattr(settings, "QUERY_COUNT_WARNING_THRESHOLD", None)
+        self.thresholds = getattr(settings, "QUERY_COUNT_WARNING_THRESHOLDS", {})
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.enabled:
+            return self.get_response(request)
+
+        metrics = QueryMetrics()
+        token = _current_metrics.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_metrics.reset(token)
+        self._report(request, response, metrics, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        if not self.enabled:
+            return await self.get_response(request)
+
+        metrics = QueryMetrics()
+        token = _current_metrics.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_metrics.reset(token)
+        self._report(request, response, metrics, time.perf_counter() - start)
+        return response
+
+    def _threshold(self, request):
+        match = getattr(request, "resolver_match", None)
+        if match is None:
+            return self.default_threshold
+        return self.thresholds.get((request.method, match.view_name), self.default_threshold)
+
+    def _report(self, request, response, metrics, elapsed):
+        timing = (
+            f'db;dur={metrics.duration * 1000:.2f};desc="{metrics.count} queries", '
+            f"db-slowest;dur={metrics.slowest_duration * 1000:.2f}, "
+            f"total;dur={elapsed * 1000:.2f}"
+        )
+        existing = response.get("Server-Timing")
+        response["Server-Timing"] = f"{existing}, {timing}" if existing else timing
+
+        logger.info(
+            "%s %s -> %s: %d queries, %.1f ms db, %.1f ms total",
+            request.method, request.path, response.status_code,
+            metrics.count, metrics.duration * 1000, elapsed * 1000,
+        )
+
+        threshold = self._threshold(request)
+        if threshold is not None and metrics.count > threshold:
+            logger.warning(
+                "%s %s ran %d queries (threshold %d). Slowest (%.1f ms): %s",
+                request.method, request.path, metrics.count, threshold,
+                metrics.slowest_duration * 1000, metrics.slowest_sql[:500],
+            )
+
+
+class ThresholdGZipMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware with a configurable size floor (GZIP_MIN_SIZE bytes):
+    small bodies cost more CPU to compress than they save on the wire.
+    Django's own 200-byte floor still applies below that. Streaming
+    responses (the expense export) are always compressed.
+    """
+
+    def process_response(self, request, response):
+        if not response.streaming and len(response.content) < settings.GZIP_MIN_SIZE:
+            return response
+        return super().process_response(request, response)
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.7 on 2026-10-18 07:07
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+
+def backfill_monthly_spend(apps, schema_editor):
+    Expense = apps.get_model('users', 'Expense')
+    MonthlySpend = apps.get_model('users', 'MonthlySpend')
+    grouped = (
+        Expense.objects.annotate(month=TruncMonth('expense_date'))
+        .order_by()
+        .values('user_id', 'month', 'category_id')
+        .annotate(total=Sum('amount'), count=Count('pk'))
+    )
+    MonthlySpend.objects.bulk_create(
+        [
+            MonthlySpend(
+                user_id_id=row['user_id'],
+                month=row['month'],
+                category_id_id=row['category_id'],
+                total_amount=row['total'],
+                expense_count=row['count'],
+            )
+            for row in grouped.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_alter_user_city_alter_user_country_alter_user_email_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlySpend',
+            fields=[
+                ('rollup_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('month', models.DateField()),
+                ('total_amount', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('expense_count', models.IntegerField(default=0)),
+                ('category_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_spend', to='users.category')),
+                ('user_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_spend', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'monthly_spend',
+                'unique_together': {('user_id', 'month', 'category_id')},
+            },
+        ),
+        migrations.RunPython(backfill_monthly_spend, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-18 07:09
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_email_outbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BudgetAlertState',
+            fields=[
+                ('state_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('month', models.DateField()),
+                ('alert_level', models.IntegerField(default=0)),
+                ('notified_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('user_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='budget_alert_states', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'budget_alert_states',
+                'unique_together': {('user_id', 'month')},
+            },
+        ),
+    ]
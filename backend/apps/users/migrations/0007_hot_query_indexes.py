@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-18 07:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_budget_alert_state'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='childrencontribution',
+            index=models.Index(fields=['user_id', 'total_contribution_planned'], name='children_user_plan_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['user_id', 'expense_date', 'created_at'], name='expenses_user_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['user_id', 'category_id', 'amount'], name='expenses_user_cat_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userresponse',
+            index=models.Index(fields=['user_id', '-submitted_at'], name='user_resp_latest_idx'),
+        ),
+    ]
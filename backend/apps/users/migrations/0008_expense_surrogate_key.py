@@ -0,0 +1,70 @@
+# backend/apps/users/migrations/0008_expense_surrogate_key.py
+#
+# Move Expense from expense_date as primary key to a BigAutoField surrogate
+# key, part 1 of 2. This migration is safe to run while the app is serving
+# traffic:
+#
+#   1. Add a nullable expense_id column (instant on MySQL 8).
+#   2. Backfill it in keyset batches (pk > last pk seen), each batch in its
+#      own transaction, so every batch is one short index range read no
+#      matter how far the backfill has got.
+#
+# Rows written behind the keyset cursor while this runs keep a NULL
+# expense_id; 0010_expense_primary_key catches them up and swaps the
+# primary key inside a maintenance window. Run it while the previous
+# release is still serving: the code shipped with these migrations already
+# maps expense_id as the primary key and needs 0010 applied first.
+
+from django.db import migrations, models, transaction
+from django.db.models import Case, Max, Value, When
+
+BATCH_SIZE = 1000
+
+
+def backfill_expense_ids(apps, schema_editor):
+    """Number every row without an expense_id, walking the table in pk order."""
+    Expense = apps.get_model('users', 'Expense')
+    db_alias = schema_editor.connection.alias
+    expenses = Expense.objects.using(db_alias)
+    next_id = (expenses.aggregate(last=Max('expense_id'))['last'] or 0) + 1
+    last_pk = None
+
+    while True:
+        # pk is still expense_date at this point
+        page = expenses.order_by('pk')
+        if last_pk is not None:
+            page = page.filter(pk__gt=last_pk)
+        batch = list(page.values_list('pk', 'expense_id')[:BATCH_SIZE])
+        if not batch:
+            break
+        last_pk = batch[-1][0]
+
+        missing = [pk for pk, expense_id in batch if expense_id is None]
+        if not missing:
+            continue
+        with transaction.atomic(using=db_alias):
+            expenses.filter(pk__in=missing, expense_id__isnull=True).update(
+                expense_id=Case(
+                    *[When(pk=pk, then=Value(next_id + offset)) for offset, pk in enumerate(missing)],
+                    output_field=models.BigIntegerField(),
+                )
+            )
+        next_id += len(missing)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('users', '0007_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='expense',
+            name='expense_id',
+            field=models.BigIntegerField(null=True),
+        ),
+        migrations.RunPython(backfill_expense_ids, migrations.RunPython.noop),
+    ]
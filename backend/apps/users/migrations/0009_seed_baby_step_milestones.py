@@ -0,0 +1,35 @@
+# backend/apps/users/migrations/0009_seed_baby_step_milestones.py
+
+from django.db import migrations
+
+
+# Frozen copy of services.BABY_STEP_TITLES; milestone_id == step number.
+BABY_STEP_TITLES = [
+    "Baby Step 1: Save $1,000 for a starter emergency fund",
+    "Baby Step 2: Pay off all debt (except the house) using the debt snowball",
+    "Baby Step 3: Save 3–6 months of expenses in a fully funded emergency fund",
+    "Baby Step 4: Invest 15% of household income in retirement",
+    "Baby Step 5: Save for your children’s college education",
+    "Baby Step 6: Pay off your home early",
+    "Baby Step 7: Build wealth and give generously",
+]
+
+
+def seed_baby_step_milestones(apps, schema_editor):
+    Milestone = apps.get_model('users', 'Milestone')
+    for step, title in enumerate(BABY_STEP_TITLES, start=1):
+        Milestone.objects.get_or_create(
+            milestone_id=step,
+            defaults={'title': title, 'description': title},
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_expense_surrogate_key'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_baby_step_milestones, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,101 @@
+# backend/apps/users/migrations/0010_expense_primary_key.py
+#
+# Move Expense to the expense_id surrogate key, part 2 of 2.
+#
+# REQUIRES A MAINTENANCE WINDOW: stop writes to the expenses table (put the
+# API in read-only mode or stop the app servers) before running it.
+#
+#   1. Catch-up backfill: number the rows 0008 missed (inserted behind its
+#      keyset cursor). With writes stopped no new NULL rows can appear.
+#   2. Swap the primary key, as its own operation. Making a column
+#      AUTO_INCREMENT cannot be done in place, so on MySQL this is one
+#      ALTER TABLE ... ALGORITHM=COPY, LOCK=SHARED: the table is rebuilt,
+#      reads keep working and writes block until it finishes (roughly the
+#      time to copy the table). MODIFY ... NOT NULL fails the migration
+#      instead of continuing if any row still has no expense_id. Other
+#      backends use the regular AlterField operations.
+#
+# (user_id, expense_date) lookups are served by expenses_user_date_idx.
+#
+# Deploy contract: the application code shipped with this migration maps
+# expense_id as the AutoField primary key, so it cannot serve a table that
+# 0010 has not converted yet. Keep the previous release (expense_date as
+# the primary key) serving while 0008 and 0009 run (`migrate users 0009`),
+# then, in the window: stop writes, run this migration, deploy the new code.
+#
+# Not reversible on MySQL: expense_date is no longer unique once the app
+# has written with the new key.
+
+from importlib import import_module
+
+from django.db import migrations, models
+from django.db.migrations.exceptions import IrreversibleError
+
+# 0008's keyset backfill only numbers rows whose expense_id is still NULL
+backfill_expense_ids = import_module('.0008_expense_surrogate_key', __package__).backfill_expense_ids
+
+
+class SwapPrimaryKey(migrations.SeparateDatabaseAndState):
+    """
+    Apply `operations` to the migration state. On MySQL, run `mysql_sql`
+    against the database instead of the operations' DDL.
+    """
+
+    def __init__(self, operations, mysql_sql):
+        super().__init__(database_operations=operations, state_operations=operations)
+        self.mysql_sql = mysql_sql
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'mysql':
+            for sql in self.mysql_sql:
+                schema_editor.execute(sql)
+            return
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'mysql':
+            raise IrreversibleError('The Expense primary key swap cannot be reversed on MySQL.')
+        # Only works while expense_date is still unique, e.g. a fresh dev database
+        super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+    def describe(self):
+        return 'Swap the Expense primary key from expense_date to expense_id'
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('users', '0009_seed_baby_step_milestones'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_expense_ids, migrations.RunPython.noop),
+        SwapPrimaryKey(
+            operations=[
+                migrations.AlterField(
+                    model_name='expense',
+                    name='expense_date',
+                    field=models.DateField(),
+                ),
+                migrations.AlterField(
+                    model_name='expense',
+                    name='expense_id',
+                    field=models.BigIntegerField(primary_key=True, serialize=False),
+                ),
+                migrations.AlterField(
+                    model_name='expense',
+                    name='expense_id',
+                    field=models.BigAutoField(primary_key=True, serialize=False),
+                ),
+            ],
+            mysql_sql=[
+                "ALTER TABLE expenses "
+                "DROP PRIMARY KEY, "
+                "MODIFY expense_id BIGINT NOT NULL AUTO_INCREMENT, "
+                "ADD PRIMARY KEY (expense_id), "
+                "ALGORITHM=COPY, LOCK=SHARED",
+            ],
+        ),
+    ]
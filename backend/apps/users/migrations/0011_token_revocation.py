@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-18 08:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0010_expense_primary_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TokenRevocation',
+            fields=[
+                ('revocation_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('user_id', models.IntegerField()),
+                ('revoked_at', models.IntegerField()),
+            ],
+            options={
+                'db_table': 'token_revocations',
+                'indexes': [models.Index(fields=['revoked_at'], name='token_revoked_at_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-18 08:06
+#
+# The milestone category totals now read the MonthlySpend rollup, so no
+# query aggregates expenses by (user, category) any more; the index only
+# slowed down every expense write.
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0011_token_revocation'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='expense',
+            name='expenses_user_cat_idx',
+        ),
+    ]
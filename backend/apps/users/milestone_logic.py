@@ -1,34 +1,72 @@
 # backend/apps/users/milestone_logic.py
 from decimal import Decimal
-from django.db.models import Sum
-from django.core.mail import send_mail
+from django.db.models import DecimalField, OuterRef, Q, Subquery, Sum
 from django.conf import settings
-from .models import User, UserMilestone, UserResponse, Category, Expense, ChildrenContribution, Milestone
+from django.core.cache import cache
+from .caching import cache_timeout, milestone_cache_key
+from .category_registry import category_registry
+from .email_outbox import queue_email
+from .models import User, UserResponse, ChildrenContribution, MonthlySpend
 
 
 # =====================================================================
 #                       HELPER FUNCTIONS
 # =====================================================================
 
-def get_category_id(name: str):
-    """Get category ID by name, return None if not exists"""
-    try:
-        return Category.objects.get(name__iexact=name).pk
-    except Category.DoesNotExist:
-        return None
+# Expense categories that feed the baby-step evaluation, keyed by the
+# name used for their totals.
+MILESTONE_CATEGORIES = {
+    'emergency': "Emergency Savings",
+    'full_emergency': "Full Emergency Savings",
+    'retirement': "Retirement Investing",
+    'children': "Children Contribution",
+    'mortgage': "Home Mortgage",
+}
 
 
-def _get_sum_for_category(user: User, category_name: str) -> Decimal:
-    """Helper: Sum of Expense.amount for a given user & category name."""
-    try:
-        category = Category.objects.get(name__iexact=category_name)
-    except Category.DoesNotExist:
-        return Decimal("0.00")
+def get_milestone_category_totals(user) -> dict:
+    """
+    Lifetime totals of every milestone category of a user in a single
+    conditional-aggregate query over the MonthlySpend rollup, so the cost
+    does not grow with the expense history. Missing categories count as 0.00.
+    """
+    category_ids = category_registry.get_ids(MILESTONE_CATEGORIES.values())
+    if not category_ids:
+        return {key: Decimal("0.00") for key in MILESTONE_CATEGORIES}
+
+    agg = MonthlySpend.objects.filter(
+        user_id=user, category_id__in=category_ids.values()
+    ).aggregate(**{
+        key: Sum('total_amount', filter=Q(category_id=category_ids[name]))
+        for key, name in MILESTONE_CATEGORIES.items()
+        if name in category_ids
+    })
+    return {key: agg.get(key) or Decimal("0.00") for key in MILESTONE_CATEGORIES}
+
 
-    agg = Expense.objects.filter(user_id=user, category_id=category).aggregate(
-        total=Sum('amount')
+def get_latest_response_with_user(user_id):
+    """
+    Fetch the latest UserResponse for a user in one query, with the User row
+    joined in and the ChildrenContribution plan total annotated as
+    `children_planned_total`. Returns None if the user has no response yet.
+    """
+    planned_total = (
+        ChildrenContribution.objects.filter(user_id=OuterRef('user_id'))
+        .order_by()
+        .values('user_id')
+        .annotate(total=Sum('total_contribution_planned'))
+        .values('total')
+    )
+    return (
+        UserResponse.objects.filter(user_id=user_id)
+        .select_related('user_id')
+        .annotate(children_planned_total=Subquery(
+            planned_total,
+            output_field=DecimalField(max_digits=12, decimal_places=2),
+        ))
+        .order_by('-submitted_at')
+        .first()
     )
-    return agg['total'] or Decimal("0.00")
 
 
 # =====================================================================
@@ -59,15 +97,9 @@ Personal Finance App
     """
     
     try:
-        send_mail(
-            subject=subject,
-            message=body,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            fail_silently=True
-        )
+        queue_email(subject, body, user.email, settings.DEFAULT_FROM_EMAIL)
     except Exception as e:
-        print(f"Failed to send email: {e}")
+        print(f"Failed to queue email: {e}")
 
 
 # =====================================================================
@@ -79,29 +111,54 @@ def evaluate_milestones(user_id):
     Evaluate and return the status of all 7 baby steps for a user.
     This is called by the API endpoint: /api/user-responses/milestones-status/?user_id=X
     Returns detailed information about each milestone for frontend display.
+    Cached until a write that feeds the baby steps bumps the user's
+    milestone version (expenses in other categories do not).
     """
-    try:
-        user = User.objects.get(user_id=user_id)
-    except User.DoesNotExist:
-        return {'error': 'User not found'}
+    key = milestone_cache_key(user_id)
+    data = cache.get(key)
+    if data is None:
+        data = compute_milestone_status(user_id)
+        cache.set(key, data, cache_timeout())
+    return data
+
+
+def compute_milestone_status(user_id):
+    """evaluate_milestones() without the cache."""
+    # Latest response, user row and children plan total in one query
+    latest_response = get_latest_response_with_user(user_id)
 
-    # Get latest user response
-    latest_response = UserResponse.objects.filter(user_id=user).order_by('-submitted_at').first()
-    
     if not latest_response:
-        return {
-            'message': 'No financial data submitted yet. Please complete the Dave Ramsey form.',
-            'milestones': []
-        }
+        return missing_response_status(user_id)
 
-    salary = user.salary or Decimal("0.00")
-    
     # Get expense sums for each category
-    emergency_sum = _get_sum_for_category(user, "Emergency Savings")
-    full_emergency_sum = _get_sum_for_category(user, "Full Emergency Savings")
-    retirement_sum = _get_sum_for_category(user, "Retirement Investing")
-    children_sum = _get_sum_for_category(user, "Children Contribution")
-    mortgage_sum = _get_sum_for_category(user, "Home Mortgage")
+    totals = get_milestone_category_totals(user_id)
+    return build_milestone_status(latest_response, totals)
+
+
+def missing_response_status(user_id):
+    """Payload for a user with no UserResponse yet (or no such user)."""
+    if not User.objects.filter(user_id=user_id).exists():
+        return {'error': 'User not found'}
+    return {
+        'message': 'No financial data submitted yet. Please complete the Dave Ramsey form.',
+        'milestones': []
+    }
+
+
+def build_milestone_status(latest_response, totals):
+    """
+    Build the baby-steps payload from the latest response (as returned by
+    get_latest_response_with_user) and get_milestone_category_totals().
+    No queries are issued here.
+    """
+    user = latest_response.user_id
+    salary = user.salary or Decimal("0.00")
+
+    emergency_sum = totals['emergency']
+    full_emergency_sum = totals['full_emergency']
+    retirement_sum = totals['retirement']
+    children_sum = totals['children']
+    mortgage_sum = totals['mortgage']
 
     milestones_status = []
 
@@ -162,10 +219,8 @@ def evaluate_milestones(user_id):
         planned_total = Decimal("0")
         progress_5 = 100
     else:
-        # Get total planned contribution from ChildrenContribution model
-        planned_total = ChildrenContribution.objects.filter(
-            user_id=user
-        ).aggregate(total=Sum('total_contribution_planned'))['total'] or Decimal("0.00")
+        # Total planned contribution, annotated onto the latest response
+        planned_total = latest_response.children_planned_total or Decimal("0.00")
 
         if planned_total == 0:
             # If no plan set, just check if any contributions exist
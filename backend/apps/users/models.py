@@ -174,7 +174,8 @@ class Category(models.Model):
 
 
 class Expense(models.Model):
-    expense_date = models.DateField(primary_key=True)
+    expense_id = models.BigAutoField(primary_key=True)
+    expense_date = models.DateField()
     user_id = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -191,6 +192,10 @@ class Expense(models.Model):
     class Meta:
         db_table = 'expenses'
         unique_together = [['user_id', 'expense_date', 'category_id']]
+        indexes = [
+            # list / month-to-date: WHERE user_id ORDER BY -expense_date, -created_at
+            models.Index(fields=['user_id', 'expense_date', 'created_at'], name='expenses_user_date_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user_id.username} - {self.category_id.name} - {self.expense_date}"
@@ -223,6 +228,10 @@ class ChildrenContribution(models.Model):
     class Meta:
         db_table = 'children_contributions'
         unique_together = [['user_id', 'child_id', 'child_name', 'parent_name']]
+        indexes = [
+            # children plan total: WHERE user_id, SUM(total_contribution_planned)
+            models.Index(fields=['user_id', 'total_contribution_planned'], name='children_user_plan_idx'),
+        ]
 
     def __str__(self):
         return f"{self.child_name} - {self.parent_name}"
@@ -314,6 +323,116 @@ class UserResponse(models.Model):
     class Meta:
         db_table = 'user_responses'
         unique_together = [['user_id', 'response_id']]
+        indexes = [
+            # latest response: WHERE user_id ORDER BY -submitted_at LIMIT 1
+            models.Index(fields=['user_id', '-submitted_at'], name='user_resp_latest_idx'),
+        ]
 
     def __str__(self):
-        return f"{self.user_id.username} - Response {self.response_id}"
\ No newline at end of file
+        return f"{self.user_id.username} - Response {self.response_id}"
+
+class MonthlySpend(models.Model):
+    """
+    Per-user, per-month, per-category rollup of Expense.amount.
+    Kept up to date by the Expense signals in signals.py and rebuilt from
+    scratch by `manage.py rebuild_monthly_spend`.
+    """
+    rollup_id = models.BigAutoField(primary_key=True)
+    user_id = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='monthly_spend'
+    )
+    month = models.DateField()  # first day of the month
+    category_id = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        related_name='monthly_spend'
+    )
+    total_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    expense_count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'monthly_spend'
+        unique_together = [['user_id', 'month', 'category_id']]
+
+    def __str__(self):
+        return f"{self.user_id_id} - {self.month:%Y-%m} - {self.category_id_id}"
+
+
+class BudgetAlertState(models.Model):
+    """
+    Highest budget threshold (75/90/100%) already notified to a user in a
+    budget period (month), so alerts only go out when a new one is crossed.
+    """
+    state_id = models.BigAutoField(primary_key=True)
+    user_id = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='budget_alert_states'
+    )
+    month = models.DateField()  # first day of the budget period
+    alert_level = models.IntegerField(default=0)
+    notified_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'budget_alert_states'
+        unique_together = [['user_id', 'month']]
+
+    def __str__(self):
+        return f"{self.user_id_id} - {self.month:%Y-%m} - {self.alert_level}%"
+
+
+class OutboundEmail(models.Model):
+    """
+    Durable email outbox. Request handlers queue messages here and
+    `manage.py send_queued_emails` delivers them in the background.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sending', 'Sending'),  # claimed by a worker until next_attempt_at
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+
+    email_id = models.BigAutoField(primary_key=True)
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254, blank=True, default='')
+    recipient = models.EmailField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.IntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'email_outbox'
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='email_outbox_due_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.recipient} - {self.subject} ({self.status})"
+
+
+class TokenRevocation(models.Model):
+    """
+    Access tokens of `user_id` issued before `revoked_at` are refused
+    (password change, account deletion). No foreign key: the row has to
+    outlive a deleted user until the tokens expire. Read by
+    authentication.TokenAccessRegistry, so every worker sees it.
+    """
+    revocation_id = models.BigAutoField(primary_key=True)
+    user_id = models.IntegerField()
+    revoked_at = models.IntegerField()  # epoch seconds, compared with the token's iat
+
+    class Meta:
+        db_table = 'token_revocations'
+        indexes = [
+            models.Index(fields=['revoked_at'], name='token_revoked_at_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.revoked_at}"
@@ -0,0 +1,31 @@
+# backend/apps/users/pagination.py
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class ListCursorPagination(CursorPagination):
+    """
+    Keyset (cursor) pagination: each page seeks from the last row of the
+    previous one, so deep pages cost the same as the first.
+    Page size comes from settings.API_PAGE_SIZE and can be overridden per
+    request with ?page_size=, up to settings.API_MAX_PAGE_SIZE.
+    """
+    page_size = settings.API_PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = settings.API_MAX_PAGE_SIZE
+
+
+class ExpenseCursorPagination(ListCursorPagination):
+    ordering = ("-expense_date", "-created_at")
+
+
+class UserMilestoneCursorPagination(ListCursorPagination):
+    ordering = ("umid",)
+
+
+class UserResponseCursorPagination(ListCursorPagination):
+    ordering = ("-submitted_at", "-response_id")
+
+
+class ChildrenContributionCursorPagination(ListCursorPagination):
+    ordering = ("-created_at", "-child_id")
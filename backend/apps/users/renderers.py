@@ -0,0 +1,79 @@
+# backend/apps/users/renderers.py
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # optional: FastJSONRenderer falls back to the stdlib encoder
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer that encodes with orjson when
+    it is installed. The bytes are the same as DRF's: compact, UTF-8,
+    Decimal as a number and dates/datetimes through DRF's own encoder
+    (orjson hands them over instead of using its own format).
+
+    Pretty-printed output (?format=json with indent, the browsable API),
+    ASCII-only settings, payloads orjson rejects (e.g. integers over 64
+    bits) and environments without orjson use the stdlib path.
+
+    Floats are where the two differ: orjson writes exponents without the
+    sign / zero padding of repr() (1e16 and 0.00001 instead of 1e+16 and
+    1e-05, same value), and NaN / Infinity become null where JSONRenderer
+    raises ValueError (strict JSON). The API's only floats are the
+    analytics change_pct values, rounded to 2 places and finite.
+    """
+    _default = encoders.JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self._default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same strict-javascript escaping of U+2028 / U+2029 as JSONRenderer
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
+        return ret
+
+
+class _ExportRenderer(BaseRenderer):
+    """
+    Lets DRF content negotiation accept ?format=csv / ?format=ndjson.
+    Export views stream their own body; this only renders the JSON error
+    payloads (401, 400, ...) returned on those URLs.
+    """
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return json.dumps(data, cls=DjangoJSONEncoder).encode(self.charset)
+
+
+class CSVRenderer(_ExportRenderer):
+    media_type = "text/csv"
+    format = "csv"
+
+
+class NDJSONRenderer(_ExportRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
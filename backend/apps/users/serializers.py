@@ -191,14 +191,27 @@ class ExpenseSerializer(serializers.ModelSerializer):
     class Meta:
         model = Expense
         fields = [
-            'expense_date', 'user_id', 'category_id', 'amount',
+            'expense_id', 'expense_date', 'user_id', 'category_id', 'amount',
             'created_at', 'user_username', 'category_name'
         ]
         extra_kwargs = {
+            'expense_id': {'read_only': True},
             'created_at': {'read_only': True}
         }
 
 
+class BulkExpenseRowSerializer(serializers.Serializer):
+    """
+    One row of POST /api/expenses/bulk/. Field checks only, no queries:
+    the view resolves user_id / category_id and the (user, date, category)
+    uniqueness for a whole chunk at once instead of once per row.
+    """
+    expense_date = serializers.DateField()
+    user_id = serializers.IntegerField(min_value=1)
+    category_id = serializers.IntegerField(min_value=1)
+    amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+
+
 class ChildrenContributionSerializer(serializers.ModelSerializer):
     user_username = serializers.CharField(source='user_id.username', read_only=True)
 
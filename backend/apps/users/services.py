@@ -1,13 +1,19 @@
 # backend/apps/users/services.py
 
+from collections import defaultdict
+from datetime import date, timedelta
 from decimal import Decimal
 
 from django.conf import settings
-from django.core.mail import send_mail
-from django.db.models import Sum
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import TruncMonth, TruncWeek
 from django.utils import timezone
 
 from .models import Expense, User
+from .email_outbox import queue_email
+from .category_registry import category_registry
+from .caching import bump_user_data_version, bump_user_milestone_version
 # from .milestone_logic import calculate_monthly_summary
 import logging
 logger = logging.getLogger(__name__)
@@ -21,6 +27,8 @@ from .models import (
     UserResponse,
     Milestone,
     UserMilestone,
+    MonthlySpend,
+    BudgetAlertState,
 )
 
 
@@ -34,41 +42,42 @@ BABY_STEP_TITLES = [
     "Baby Step 7: Build wealth and give generously",
 ]
 
-
-def _get_sum_for_category(user: User, category_name: str) -> Decimal:
-    """
-    Sum of Expense.amount for a given user & category name (case-insensitive).
-    """
-    try:
-        category = Category.objects.get(name__iexact=category_name)
-    except Category.DoesNotExist:
-        return Decimal("0.00")
-
-    agg = Expense.objects.filter(user_id=user, category_id=category).aggregate(
-        total=Sum('amount')
-    )
-    return agg['total'] or Decimal("0.00")
+# In-memory catalog of the 7 Dave Ramsey milestones, keyed by step number.
+# The rows are seeded by migration 0009 with milestone_id == step, so the
+# recalculation path never has to query the Milestone table.
+MILESTONE_CATALOG = {
+    step: title for step, title in enumerate(BABY_STEP_TITLES, start=1)
+}
 
 
-def _ensure_milestones_exist():
+def _baby_step_category_totals(user_id, category_names) -> dict:
     """
-    Make sure the 7 Dave Ramsey milestones exist in the Milestone table.
+    Lifetime totals of the given expense categories for one user, in one
+    query over the MonthlySpend rollup (kept current on every expense
+    write). Names are matched case-insensitively; missing ones are 0.00.
     """
-    for index, title in enumerate(BABY_STEP_TITLES, start=1):
-        Milestone.objects.get_or_create(
-            milestone_id=index,
-            defaults={
-                'title': title,
-                'description': title,
-            },
-        )
-
-
-def recalculate_baby_steps_and_email(user: User) -> None:
+    totals = {name: Decimal("0.00") for name in category_names}
+    category_ids = category_registry.get_ids(category_names)
+    if not category_ids:
+        return totals
+
+    agg = MonthlySpend.objects.filter(
+        user_id=user_id, category_id__in=category_ids.values()
+    ).aggregate(**{
+        f"total_{index}": Sum("total_amount", filter=Q(category_id=category_ids[name]))
+        for index, name in enumerate(category_names)
+        if name in category_ids
+    })
+    for index, name in enumerate(category_names):
+        totals[name] = agg.get(f"total_{index}") or Decimal("0.00")
+    return totals
+
+
+def recalculate_baby_steps_and_email(user: User, response_fields=None) -> None:
     """
     Core logic:
     - Read latest UserResponse (Dave Ramsey form)
-    - Read Expense table categorized by:
+    - Read the milestone expense category totals:
         "Emergency savings"
         "Full Emergency savings"
         "Retirement Investing"
@@ -77,123 +86,222 @@ def recalculate_baby_steps_and_email(user: User) -> None:
     - Decide which of the 7 steps are completed.
     - Update UserMilestone rows.
     - Send an SMTP email summarizing status.
-    """
-    _ensure_milestones_exist()
 
-    user_response = (
-        UserResponse.objects.filter(user_id=user)
-        .order_by('-submitted_at')
-        .first()
-    )
+    `response_fields` is the set of UserResponse fields that changed
+    (None = unknown, re-evaluate every step); steps that read none of them
+    keep their stored state.
+    """
+    if response_fields is None:
+        steps = set(BABY_STEP_RULES)
+    else:
+        steps = affected_baby_steps(response_fields=response_fields)
 
+    completed_flags = update_baby_steps(user, steps)
     # If no response yet, nothing to do
-    if not user_response:
+    if completed_flags is None:
         return
 
-    # Helper: salary as Decimal
-    salary = user.salary or Decimal("0.00")
+    # ---- Email summary ----
+    try:
+        _send_milestone_email(user, completed_flags)
+    except Exception:
+        # Fail silently for now to avoid breaking API calls if email is misconfigured
+        pass
+
+
+# ---- Baby step rules: (response, salary, category_sum) -> completed ----
+
+def _step1_starter_emergency_fund(response, salary, category_sum):
+    # $1,000 Emergency fund
+    return response.emergency_savings and category_sum("Emergency savings") >= Decimal("1000.00")
 
-    # ---- Step 1: $1,000 Emergency fund ----
-    emergency_sum = _get_sum_for_category(user, "Emergency savings")
-    step1_completed = (
-        user_response.emergency_savings and emergency_sum >= Decimal("1000.00")
-    )
 
-    # ---- Step 2: Debt Snowball (no non-mortgage debt) ----
-    step2_completed = not user_response.has_debt
+def _step2_debt_snowball(response, salary, category_sum):
+    # No non-mortgage debt
+    return not response.has_debt
 
-    # ---- Step 3: Full Emergency fund: 6 months of salary ----
-    full_emergency_sum = _get_sum_for_category(user, "Full Emergency savings")
+
+def _step3_full_emergency_fund(response, salary, category_sum):
+    # Full Emergency fund: 6 months of salary
     target_full_fund = salary * Decimal("6")
-    step3_completed = user_response.full_emergency_fund and full_emergency_sum >= target_full_fund
+    return response.full_emergency_fund and category_sum("Full Emergency savings") >= target_full_fund
+
 
-    # ---- Step 4: Invest 15% for retirement ----
-    retirement_sum = _get_sum_for_category(user, "Retirement Investing")
+def _step4_retirement(response, salary, category_sum):
+    # Invest 15% for retirement
     required_retirement = salary * Decimal("0.15")
-    step4_completed = (
-        user_response.retirement_investing and retirement_sum >= required_retirement
-    )
+    return response.retirement_investing and category_sum("Retirement Investing") >= required_retirement
 
-    # ---- Step 5: Children education / "No Children Savings" ----
+
+def _step5_children_education(response, salary, category_sum):
     # If has_children == False => automatically satisfied as "No Children Savings"
-    if not user_response.has_children:
-        step5_completed = True
-        step5_note = "No children – education savings not required."
-    else:
-        children_sum = _get_sum_for_category(user, "Children Contribution")
-        # Here we interpret "total_contribution_planned" as the target.
-        # You may refine this using ChildrenContribution model if needed.
-        step5_completed = children_sum > Decimal("0.00")
-        step5_note = "Children savings in progress"
-
-    # ---- Step 6: Pay off home mortgage ----
-    # Interpret as: bought_home True AND pay_off_home True => satisfied.
-    # Or if mortgage_remaining <= 0.
-    if not user_response.bought_home:
-        # If no home, treat step 6 as satisfied
-        step6_completed = True
-    else:
-        if user_response.pay_off_home:
-            step6_completed = True
-        else:
-            home_mortgage_sum = _get_sum_for_category(user, "Home Mortgage")
-            remaining = user_response.mortgage_remaining or Decimal("0.00")
-            step6_completed = home_mortgage_sum >= remaining
+    if not response.has_children:
+        return True
+    # Here we interpret "total_contribution_planned" as the target.
+    # You may refine this using ChildrenContribution model if needed.
+    return category_sum("Children Contribution") > Decimal("0.00")
+
+
+def _step6_pay_off_home(response, salary, category_sum):
+    # No home, or bought_home AND pay_off_home => satisfied.
+    # Otherwise the mortgage payments must cover mortgage_remaining.
+    if not response.bought_home or response.pay_off_home:
+        return True
+    remaining = response.mortgage_remaining or Decimal("0.00")
+    return category_sum("Home Mortgage") >= remaining
+
+
+# step -> (rule, expense categories it reads, UserResponse fields it reads,
+# reads User.salary). Step 7 is "steps 1–6 all completed".
+BABY_STEP_RULES = {
+    1: (_step1_starter_emergency_fund, {"Emergency savings"}, {"emergency_savings"}, False),
+    2: (_step2_debt_snowball, set(), {"has_debt"}, False),
+    3: (_step3_full_emergency_fund, {"Full Emergency savings"}, {"full_emergency_fund"}, True),
+    4: (_step4_retirement, {"Retirement Investing"}, {"retirement_investing"}, True),
+    5: (_step5_children_education, {"Children Contribution"}, {"has_children"}, False),
+    6: (_step6_pay_off_home, {"Home Mortgage"}, {"bought_home", "pay_off_home", "mortgage_remaining"}, False),
+}
+
+BABY_STEP_CATEGORIES = [
+    "Emergency savings",
+    "Full Emergency savings",
+    "Retirement Investing",
+    "Children Contribution",
+    "Home Mortgage",
+]
+
+BABY_STEP_RESPONSE_FIELDS = set().union(*(fields for _, _, fields, _ in BABY_STEP_RULES.values()))
+
+
+def affected_baby_steps(categories=(), response_fields=(), salary_changed=False) -> set:
+    """Steps (1–6) whose inputs include a changed category, response field or salary."""
+    categories = {name.casefold() for name in categories}
+    response_fields = set(response_fields)
+    return {
+        step
+        for step, (_, step_categories, step_fields, uses_salary) in BABY_STEP_RULES.items()
+        if {name.casefold() for name in step_categories} & categories
+        or step_fields & response_fields
+        or (uses_salary and salary_changed)
+    }
 
-    # ---- Step 7: Build wealth & give generously ----
-    # Simplified logic: if steps 1–6 all completed, mark step 7 as completed.
-    step7_completed = all(
-        [
-            step1_completed,
-            step2_completed,
-            step3_completed,
-            step4_completed,
-            step5_completed,
-            step6_completed,
-        ]
-    )
 
-    completed_flags = [
-        step1_completed,
-        step2_completed,
-        step3_completed,
-        step4_completed,
-        step5_completed,
-        step6_completed,
-        step7_completed,
+def changed_response_fields(previous, current):
+    """Baby-step fields that differ between two UserResponses (None if there was no previous one)."""
+    if previous is None:
+        return None
+    return {
+        field for field in BABY_STEP_RESPONSE_FIELDS
+        if getattr(previous, field) != getattr(current, field)
+    }
+
+
+def compute_baby_step_flags(user_response: UserResponse, salary, category_sum) -> list[bool]:
+    """
+    Completion flags of the 7 baby steps for one questionnaire answer.
+    `category_sum(name)` returns the user's total for an expense category;
+    it is only called for the categories a step actually needs.
+    """
+    salary = salary or Decimal("0.00")
+    flags = [
+        bool(rule(user_response, salary, category_sum))
+        for rule, _, _, _ in BABY_STEP_RULES.values()
     ]
+    # ---- Step 7: Build wealth & give generously ----
+    return flags + [all(flags)]
+
+
+def update_baby_steps(user: User, steps) -> list[bool] | None:
+    """
+    Re-evaluate only `steps` (subset of 1–6) for `user`, keep the stored
+    state of the others, derive step 7, and upsert the rows that changed.
+    Falls back to every step when the user has no stored state yet.
+    Returns the 7 completion flags, or None if the user has no response.
+    """
+    user_response = (
+        UserResponse.objects.filter(user_id=user)
+        .order_by('-submitted_at')
+        .first()
+    )
+    if not user_response:
+        return None
 
-    # ---- Update UserMilestone rows ----
-    for index, completed in enumerate(completed_flags, start=1):
-        milestone = Milestone.objects.get(milestone_id=index)
-        um, _ = UserMilestone.objects.get_or_create(
-            user_id=user,
-            milestone_id=milestone,
+    with transaction.atomic():
+        current = dict(
+            UserMilestone.objects.filter(user_id=user)
+            .values_list("milestone_id", "is_completed")
         )
+        if any(step not in current for step in BABY_STEP_RULES):
+            steps = set(BABY_STEP_RULES)
 
-        if completed:
-            if not um.is_completed:
-                um.is_completed = True
-                um.completed_at = timezone.now()
-                um.save()
-        else:
-            if um.is_completed:
-                # If progress regressed, mark incomplete.
-                um.is_completed = False
-                um.completed_at = None
-                um.save()
+        categories = sorted(set().union(*(BABY_STEP_RULES[step][1] for step in steps)))
+        totals = _baby_step_category_totals(user, categories) if categories else {}
+        salary = user.salary or Decimal("0.00")
 
-    # ---- Email summary ----
-    try:
-        _send_milestone_email(user, completed_flags)
-    except Exception:
-        # Fail silently for now to avoid breaking API calls if email is misconfigured
-        pass
+        flags = [
+            bool(rule(user_response, salary, totals.__getitem__)) if step in steps else current[step]
+            for step, (rule, _, _, _) in BABY_STEP_RULES.items()
+        ]
+        completed_flags = flags + [all(flags)]
+
+        changes = _milestone_changes(user, current, completed_flags, timezone.now())
+        if changes:
+            _upsert_user_milestones(changes)
+    return completed_flags
+
+
+def refresh_baby_steps_for_expenses(user: User, category_ids) -> None:
+    """
+    After expense writes in `category_ids`: re-evaluate only the steps that
+    read one of those categories. Expenses in other categories (Groceries,
+    Rent, ...) cost no milestone work at all.
+    """
+    milestone_ids = category_registry.get_ids(BABY_STEP_CATEGORIES)
+    names = [name for name, category_id in milestone_ids.items() if category_id in category_ids]
+    if not names:
+        return
+    update_baby_steps(user, affected_baby_steps(categories=names))
+    bump_user_milestone_version(user.user_id)
+
+
+def _milestone_changes(user: User, current: dict, completed_flags: list[bool], now) -> list:
+    """
+    UserMilestone rows to write for `user`, given its current
+    {milestone_id: is_completed} state: new rows, and rows whose state flipped.
+    """
+    changes = []
+    for step, completed in zip(MILESTONE_CATALOG, completed_flags):
+        if current.get(step) == completed:
+            continue
+        # New row, completed now, or progress regressed
+        changes.append(
+            UserMilestone(
+                user_id=user,
+                milestone_id_id=step,
+                is_completed=completed,
+                completed_at=now if completed else None,
+            )
+        )
+    return changes
+
+
+def _upsert_user_milestones(changes: list) -> None:
+    """Write UserMilestone rows with a single upsert (bulk_create with update_conflicts)."""
+    unique_fields = None
+    if connection.features.supports_update_conflicts_with_target:
+        unique_fields = ["user_id", "milestone_id"]
+    UserMilestone.objects.bulk_create(
+        changes,
+        update_conflicts=True,
+        update_fields=["is_completed", "completed_at"],
+        unique_fields=unique_fields,
+        batch_size=1000,
+    )
 
 
 def _send_milestone_email(user: User, completed_flags: list[bool]) -> None:
     """
-    Send a simple SMTP email summarizing current milestone status.
+    Queue a simple email summarizing current milestone status.
     Requires EMAIL_* settings configured in Django settings.
     """
     if not getattr(settings, "EMAIL_HOST", None):
@@ -216,80 +324,211 @@ def _send_milestone_email(user: User, completed_flags: list[bool]) -> None:
         + "\n\nKeep going – you're making progress!\n"
     )
 
-    send_mail(
-        subject=subject,
-        message=body,
+    queue_email(
+        subject,
+        body,
+        user.email,
         from_email=getattr(settings, "DEFAULT_FROM_EMAIL", None),
-        recipient_list=[user.email],
-        fail_silently=True,
     )
 
 
-# --------------------#Email alert for daily expense#--------------------
-def check_budget_and_send_alert(user: User):
+# --------------------#Monthly spend rollup#--------------------
+def apply_expense_to_rollup(user_id, category_id, expense_date, amount, count=1) -> None:
     """
-    Calculate current month's spending vs user's budget (salary),
-    and send an email alert when usage reaches 75%, 90%, or 100%.
-    Returns a dict with percentage and alert_level or None.
+    Add `amount` and `count` to the MonthlySpend row of the expense's
+    (user, month, category) with an atomic F() increment.
+    Pass negative values to take an expense back out.
     """
-    if not user or not user.email:
-        return None
+    key = {
+        "user_id_id": user_id,
+        "category_id_id": category_id,
+        "month": expense_date.replace(day=1),
+    }
+    delta = {
+        "total_amount": F("total_amount") + amount,
+        "expense_count": F("expense_count") + count,
+    }
 
-    # Assume salary is the monthly budget
-    budget = user.salary or Decimal("0")
-    if not budget or budget <= 0:
-        return None
+    if MonthlySpend.objects.filter(**key).update(**delta) or count < 0:
+        return
 
-    today = timezone.now().date()
-    first_day = today.replace(day=1)
+    try:
+        with transaction.atomic():
+            MonthlySpend.objects.create(
+                total_amount=amount, expense_count=count, **key
+            )
+    except IntegrityError:
+        # Another request created the row first; increment it instead.
+        MonthlySpend.objects.filter(**key).update(**delta)
 
-    total_spent = (
-        Expense.objects.filter(
-            user_id=user,
-            expense_date__gte=first_day,
-            expense_date__lte=today,
-        ).aggregate(total=Sum("amount"))["total"]
-        or Decimal("0")
-    )
 
-    percentage = int((total_spent / budget) * 100) if budget > 0 else 0
+def apply_rollup_deltas(deltas: dict) -> None:
+    """
+    Add {(user_id, category_id, month): (amount, count)} to MonthlySpend in
+    a fixed number of statements, however many groups there are: lock the
+    existing rows, bulk_update them, bulk_create the missing ones.
+    Must run inside a transaction (select_for_update).
+    """
+    if not deltas:
+        return
 
-    alert_level = 0
-    if percentage >= 100:
-        alert_level = 100
-    elif percentage >= 90:
-        alert_level = 90
-    elif percentage >= 75:
-        alert_level = 75
+    existing = {
+        (row.user_id_id, row.category_id_id, row.month): row
+        for row in MonthlySpend.objects.select_for_update().filter(
+            user_id__in={user_id for user_id, _, _ in deltas},
+            category_id__in={category_id for _, category_id, _ in deltas},
+            month__in={month for _, _, month in deltas},
+        )
+    }
 
-    if alert_level == 0:
-        return None
+    updated, missing = [], []
+    for (user_id, category_id, month), (amount, count) in deltas.items():
+        row = existing.get((user_id, category_id, month))
+        if row is None:
+            missing.append(MonthlySpend(
+                user_id_id=user_id, category_id_id=category_id, month=month,
+                total_amount=amount, expense_count=count,
+            ))
+        else:
+            row.total_amount += amount
+            row.expense_count += count
+            updated.append(row)
 
-    # Simple email body – you can style later
-    subject = f"Budget Alert: {percentage}% of your monthly budget used"
-    message = (
-        f"Hi {user.username},\n\n"
-        f"You have spent {total_spent} out of your monthly budget {budget} "
-        f"({percentage}% used).\n\n"
-        f"Threshold {alert_level}% has been reached.\n"
-        f"Please review your recent expenses in the Daily Expenses page.\n\n"
-        f"- PFM System"
-    )
+    MonthlySpend.objects.bulk_update(updated, ["total_amount", "expense_count"], batch_size=1000)
+    if not missing:
+        return
+    try:
+        with transaction.atomic():
+            MonthlySpend.objects.bulk_create(missing, batch_size=1000)
+    except IntegrityError:
+        # Another request created some of the rows first; increment them instead.
+        for row in missing:
+            apply_expense_to_rollup(
+                row.user_id_id, row.category_id_id, row.month, row.total_amount, count=row.expense_count
+            )
 
-    send_mail(
-        subject,
-        message,
-        settings.DEFAULT_FROM_EMAIL,
-        [user.email],
-        fail_silently=True,
+
+class ExpenseBulkWrite:
+    """
+    Expenses inserted with bulk_create, possibly over several chunks.
+    bulk_create does not fire the Expense signals, so the rollup deltas and
+    the affected users and categories are collected per chunk and applied
+    once by finish(): one MonthlySpend write, then one cache version bump
+    and one baby step refresh per user.
+    """
+
+    def __init__(self):
+        self.deltas = defaultdict(lambda: [Decimal("0.00"), 0])
+        self.users = {}
+        self.categories = defaultdict(set)
+
+    def add(self, expenses: list) -> None:
+        Expense.objects.bulk_create(expenses)
+        for expense in expenses:
+            key = (expense.user_id_id, expense.category_id_id, expense.expense_date.replace(day=1))
+            self.deltas[key][0] += expense.amount
+            self.deltas[key][1] += 1
+            self.users[expense.user_id_id] = expense.user_id
+            self.categories[expense.user_id_id].add(expense.category_id_id)
+
+    def finish(self) -> list:
+        """Apply what add() collected. Returns the users whose expenses were inserted."""
+        apply_rollup_deltas(self.deltas)
+        for user_id, user in self.users.items():
+            bump_user_data_version(user_id)
+            refresh_baby_steps_for_expenses(user, self.categories[user_id])
+        return list(self.users.values())
+
+
+def bulk_create_expenses(expenses: list) -> list:
+    """
+    Insert unsaved Expense objects in one go (see ExpenseBulkWrite).
+    Returns the users whose expenses were inserted.
+    """
+    write = ExpenseBulkWrite()
+    write.add(expenses)
+    return write.finish()
+
+
+def get_month_spend(user: User, day=None) -> Decimal:
+    """
+    Total spent by a user in the month containing `day` (default: today),
+    summed over the user's MonthlySpend rows for that month.
+    """
+    day = day or timezone.now().date()
+    total = MonthlySpend.objects.filter(
+        user_id=user.pk,
+        month=day.replace(day=1),
+    ).aggregate(total=Sum("total_amount"))["total"]
+    return total or Decimal("0.00")
+
+
+def rebuild_monthly_spend(user: User = None) -> int:
+    """
+    Recompute MonthlySpend from the raw expenses table, for one user or for
+    everyone. Returns the number of rollup rows written.
+    """
+    expenses = Expense.objects.all()
+    rollups = MonthlySpend.objects.all()
+    if user is not None:
+        expenses = expenses.filter(user_id=user)
+        rollups = rollups.filter(user_id=user)
+
+    grouped = (
+        expenses.annotate(month=TruncMonth("expense_date"))
+        .order_by()
+        .values("user_id", "month", "category_id")
+        .annotate(total=Sum("amount"), count=Count("pk"))
     )
 
-    return {
-        "total_spent": total_spent,
-        "budget": budget,
-        "percentage": percentage,
-        "alert_level": alert_level,
-    }
+    with transaction.atomic():
+        rollups.delete()
+        created = MonthlySpend.objects.bulk_create(
+            [
+                MonthlySpend(
+                    user_id_id=row["user_id"],
+                    month=row["month"],
+                    category_id_id=row["category_id"],
+                    total_amount=row["total"],
+                    expense_count=row["count"],
+                )
+                for row in grouped.iterator()
+            ],
+            batch_size=1000,
+        )
+    return len(created)
+
+
+# --------------------#Budget evaluation pipeline#--------------------
+def get_alert_level(percentage) -> int:
+    """Highest threshold in ALERT_THRESHOLDS reached by `percentage`, or 0."""
+    reached = [threshold for threshold in ALERT_THRESHOLDS if percentage >= threshold]
+    return max(reached, default=0)
+
+
+def claim_budget_alert(user: User, level: int, day=None) -> bool:
+    """
+    Record that `level` has been notified for the user's current budget
+    period. Returns False when that level (or a higher one) was already
+    notified, so callers only alert on a newly crossed threshold.
+    """
+    month = (day or timezone.now().date()).replace(day=1)
+
+    raised = BudgetAlertState.objects.filter(
+        user_id=user, month=month, alert_level__lt=level
+    ).update(alert_level=level, notified_at=timezone.now())
+    if raised:
+        return True
+
+    try:
+        with transaction.atomic():
+            BudgetAlertState.objects.create(user_id=user, month=month, alert_level=level)
+    except IntegrityError:
+        # A state row already holds this level or a higher one.
+        return False
+    return True
+
+
 # -----------------------------------------------------------------------#
 def calculate_monthly_summary(user: User) -> dict:
     """
@@ -304,17 +543,8 @@ def calculate_monthly_summary(user: User) -> dict:
       }
     """
 
-    today = timezone.now().date()
-    start_of_month = today.replace(day=1)
-
-    # all expenses for this user in the current month
-    qs = Expense.objects.filter(
-        user_id=user,
-        expense_date__gte=start_of_month,
-        expense_date__lte=today,
-    )
-
-    total_spent = qs.aggregate(total=Sum("amount"))["total"] or Decimal("0.00")
+    # this month's spending, read from the MonthlySpend rollup
+    total_spent = get_month_spend(user)
 
     # you can change this if your budget comes from some other field
     budget = user.salary or Decimal("0.00")
@@ -325,14 +555,7 @@ def calculate_monthly_summary(user: User) -> dict:
         percentage = 0.0
 
     # decide the alert level
-    if percentage >= 100:
-        alert_level = 100
-    elif percentage >= 90:
-        alert_level = 90
-    elif percentage >= 75:
-        alert_level = 75
-    else:
-        alert_level = 0
+    alert_level = get_alert_level(percentage)
 
     return {
         "total_spent": str(total_spent),
@@ -346,9 +569,10 @@ def calculate_monthly_summary(user: User) -> dict:
 
 def trigger_budget_alerts_for_user(user: User):
     """
-    Called after an expense is created.
-    Calculates budget summary, optionally sends email alerts,
-    and RETURNS the summary for use by views / API.
+    Budget evaluation pipeline, called once after each expense write.
+    Calculates the monthly summary once, decides the alert level once,
+    queues at most one alert email, and RETURNS the summary for use by
+    views / API.
     """
 
     # 1) Calculate summary
@@ -376,7 +600,7 @@ def trigger_budget_alerts_for_user(user: User):
     budget = summary.get("budget")
 
     # Only send alert at 75, 90, 100%
-    if level not in (75, 90, 100):
+    if level not in ALERT_THRESHOLDS:
         logger.info("No alert needed for %s (level %s).", user.email, level)
         return summary
 
@@ -404,18 +628,201 @@ def trigger_budget_alerts_for_user(user: User):
 
     message = "\n".join(message_lines)
 
-    # 5) Send email safely
+    # 5) Claim the threshold and queue the email for the outbox worker
+    # together: if queueing fails the claim rolls back, so the next expense
+    # write retries instead of the alert being lost.
     try:
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL,
-            [user.email],
-            fail_silently=False,
-        )
-        logger.info("Budget alert email sent to %s (level %s)", user.email, level)
+        with transaction.atomic():
+            # Only alert once per threshold per budget period
+            if not claim_budget_alert(user, level):
+                logger.info("Level %s already notified to %s this month.", level, user.email)
+                return summary
+            queue_email(subject, message, user.email, settings.DEFAULT_FROM_EMAIL)
+        logger.info("Budget alert email queued for %s (level %s)", user.email, level)
     except Exception:
-        logger.exception("Failed to send budget alert email to %s", user.email)
+        logger.exception("Failed to queue budget alert email for %s", user.email)
 
     # ⭐ RETURN SUMMARY — very important for dashboard
-    return summary
\ No newline at end of file
+    return summary
+
+# --------------------#Category analytics#--------------------
+ANALYTICS_PERIODS = {"month": TruncMonth, "week": TruncWeek}
+# Longest range a request may ask for: five years either way
+ANALYTICS_MAX_PERIODS = {"month": 60, "week": 260}
+
+
+def _period_start(period: str, day):
+    if period == "month":
+        return day.replace(day=1)
+    return day - timedelta(days=day.weekday())  # TruncWeek: ISO week, Monday
+
+
+def _next_period(period: str, start):
+    """Start of the following period, or None past the last representable date."""
+    if period == "month":
+        if start.month < 12:
+            return start.replace(month=start.month + 1)
+        return date(start.year + 1, 1, 1) if start.year < date.max.year else None
+    return start + timedelta(days=7) if date.max - start >= timedelta(days=7) else None
+
+
+def analytics_period_count(period: str, date_from, date_to) -> int:
+    """Number of months/weeks the range touches, without building them."""
+    start, end = _period_start(period, date_from), _period_start(period, date_to)
+    if period == "month":
+        return (end.year - start.year) * 12 + end.month - start.month + 1
+    return (end - start).days // 7 + 1
+
+
+def default_analytics_range(period: str, periods: int = 12, day=None) -> tuple:
+    """(date_from, date_to) covering the last `periods` months/weeks up to `day`."""
+    date_to = day or timezone.now().date()
+    date_from = _period_start(period, date_to)
+    for _ in range(periods - 1):
+        date_from = _period_start(period, date_from - timedelta(days=1))
+    return date_from, date_to
+
+
+def _rolling_average(values: list, window: int) -> list:
+    averages = []
+    for index in range(len(values)):
+        recent = values[max(0, index - window + 1): index + 1]
+        averages.append((sum(recent) / len(recent)).quantize(Decimal("0.01")))
+    return averages
+
+
+def _changes(values: list) -> tuple:
+    """Period-over-period deltas and percentages (None for the first period)."""
+    deltas, percentages = [None], [None]
+    for previous, current in zip(values, values[1:]):
+        deltas.append(current - previous)
+        percentages.append(
+            round(float((current - previous) / previous * 100), 2) if previous else None
+        )
+    return deltas, percentages
+
+
+def get_category_analytics(user: User, period: str, date_from, date_to, window: int = 3) -> dict:
+    """
+    Per-category spending per month or week between date_from and date_to,
+    with a trailing `window`-period rolling average and period-over-period
+    changes. The totals come from a single GROUP BY over the expenses.
+    Periods without expenses are reported as 0.
+    """
+    rows = (
+        Expense.objects.filter(
+            user_id=user.pk,
+            expense_date__gte=date_from,
+            expense_date__lte=date_to,
+        )
+        .annotate(period_start=ANALYTICS_PERIODS[period]("expense_date"))
+        .values("period_start", "category_id", "category_id__name")
+        .annotate(total=Sum("amount"))
+        .order_by()
+    )
+
+    starts = []
+    start = _period_start(period, date_from)
+    while start is not None and start <= date_to:
+        starts.append(start)
+        start = _next_period(period, start)
+    index = {start: position for position, start in enumerate(starts)}
+
+    zero = Decimal("0.00")
+    names = {}
+    totals = defaultdict(lambda: [zero] * len(starts))
+    for row in rows:
+        period_start = row["period_start"]
+        if hasattr(period_start, "date"):  # some backends return a datetime
+            period_start = period_start.date()
+        names[row["category_id"]] = row["category_id__name"]
+        totals[row["category_id"]][index[period_start]] += row["total"].quantize(zero)
+
+    def series(values):
+        deltas, percentages = _changes(values)
+        return {
+            "totals": [str(value) for value in values],
+            "rolling_average": [str(value) for value in _rolling_average(values, window)],
+            "change": [None if delta is None else str(delta) for delta in deltas],
+            "change_pct": percentages,
+        }
+
+    overall = [sum(column, zero) for column in zip(*totals.values())] or [zero] * len(starts)
+    return {
+        "period": period,
+        "date_from": date_from.isoformat(),
+        "date_to": date_to.isoformat(),
+        "window": window,
+        "periods": [start.isoformat() for start in starts],
+        "categories": [
+            {"category_id": category_id, "category_name": names[category_id], **series(values)}
+            for category_id, values in sorted(totals.items(), key=lambda item: names[item[0]])
+        ],
+        "overall": series(overall),
+    }
+
+
+# --------------------#Batch milestone recomputation#--------------------
+
+def recompute_milestones_for_users(user_ids: list) -> tuple:
+    """
+    Re-evaluate the baby steps of many users with set-based queries and
+    write the changed UserMilestone rows in bulk. No emails are sent.
+
+    Per chunk: one latest-response-per-user query, one grouped aggregate
+    of the milestone category totals (read from the MonthlySpend rollup),
+    one read of the current UserMilestone state and one bulk upsert.
+    Returns (users evaluated, UserMilestone rows written).
+    """
+    latest_response = (
+        UserResponse.objects.filter(user_id=OuterRef("user_id"))
+        .order_by("-submitted_at")
+        .values("response_id")[:1]
+    )
+    responses = (
+        UserResponse.objects.filter(user_id__in=user_ids, response_id=Subquery(latest_response))
+        .select_related("user_id")
+    )
+
+    category_ids = category_registry.get_ids(BABY_STEP_CATEGORIES)
+    totals = defaultdict(dict)
+    if category_ids:
+        rows = (
+            MonthlySpend.objects.filter(
+                user_id__in=user_ids, category_id__in=category_ids.values()
+            )
+            .values("user_id")
+            .annotate(**{
+                f"total_{index}": Sum("total_amount", filter=Q(category_id=category_ids[name]))
+                for index, name in enumerate(BABY_STEP_CATEGORIES)
+                if name in category_ids
+            })
+            .order_by()
+        )
+        for row in rows:
+            for index, name in enumerate(BABY_STEP_CATEGORIES):
+                totals[row["user_id"]][name] = row.get(f"total_{index}") or Decimal("0.00")
+
+    current = defaultdict(dict)
+    for user_id, milestone_id, is_completed in UserMilestone.objects.filter(
+        user_id__in=user_ids
+    ).values_list("user_id", "milestone_id", "is_completed"):
+        current[user_id][milestone_id] = is_completed
+
+    now = timezone.now()
+    evaluated, changes = 0, []
+    for response in responses:
+        user = response.user_id
+        user_totals = totals[user.user_id]
+        flags = compute_baby_step_flags(
+            response,
+            user.salary,
+            lambda name: user_totals.get(name, Decimal("0.00")),
+        )
+        changes.extend(_milestone_changes(user, current[user.user_id], flags, now))
+        evaluated += 1
+
+    if changes:
+        with transaction.atomic():
+            _upsert_user_milestones(changes)
+    return evaluated, len(changes)
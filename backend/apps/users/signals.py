@@ -0,0 +1,222 @@
+# backend/apps/users/signals.py
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .authentication import token_access
+from .caching import bump_global_data_version, bump_user_data_version, bump_user_milestone_version
+from .category_registry import category_registry
+from .middleware import instrument_connection
+from .models import Category, ChildrenContribution, Expense, MonthlySpend, User, UserResponse
+from .services import (
+    BABY_STEP_CATEGORIES,
+    affected_baby_steps,
+    apply_expense_to_rollup,
+    recompute_milestones_for_users,
+    refresh_baby_steps_for_expenses,
+    update_baby_steps,
+)
+
+
+def _cascaded(sender, origin) -> bool:
+    """
+    True when a post_delete comes from deleting a parent (a User or a
+    Category) rather than the row itself. The parent's own delete removes
+    the rollup, milestone and cache state those rows fed, so the per-row
+    bookkeeping is skipped - running it would re-insert UserMilestone rows
+    for a user that is being deleted.
+    """
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return origin is not None and origin_model is not sender
+
+
+# =====================================================================
+#                   MONTHLY SPEND ROLLUP MAINTENANCE
+# =====================================================================
+
+def _date_and_amount(instance):
+    """expense_date and amount as date / Decimal, even if assigned as strings."""
+    return (
+        Expense._meta.get_field("expense_date").to_python(instance.expense_date),
+        Expense._meta.get_field("amount").to_python(instance.amount),
+    )
+
+
+@receiver(pre_save, sender=Expense)
+def remember_previous_expense(sender, instance, raw=False, **kwargs):
+    """Keep the stored row's values so post_save can back them out."""
+    instance._rollup_previous = None
+    if raw or instance.pk is None:
+        return
+    instance._rollup_previous = (
+        Expense.objects.filter(pk=instance.pk)
+        .values_list("user_id", "category_id", "expense_date", "amount")
+        .first()
+    )
+
+
+@receiver(post_save, sender=Expense)
+def add_expense_to_rollup(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, "_rollup_previous", None)
+    if previous:
+        user_id, category_id, expense_date, amount = previous
+        apply_expense_to_rollup(user_id, category_id, expense_date, -amount, count=-1)
+
+    expense_date, amount = _date_and_amount(instance)
+    apply_expense_to_rollup(instance.user_id_id, instance.category_id_id, expense_date, amount)
+
+
+@receiver(post_delete, sender=Expense)
+def remove_expense_from_rollup(sender, instance, origin=None, **kwargs):
+    if _cascaded(sender, origin):
+        return  # the MonthlySpend rows cascade with the user / category
+    expense_date, amount = _date_and_amount(instance)
+    apply_expense_to_rollup(
+        instance.user_id_id, instance.category_id_id, expense_date, -amount, count=-1
+    )
+
+
+# =====================================================================
+#                   INCREMENTAL MILESTONE REFRESH
+# =====================================================================
+# Registered after the rollup receivers: the steps read MonthlySpend.
+
+@receiver(post_save, sender=Expense)
+def refresh_milestones_on_expense_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, "_rollup_previous", None)
+    if previous and previous[0] != instance.user_id_id:
+        # Expense moved to another user: refresh the old owner too
+        refresh_baby_steps_for_expenses(User.objects.get(pk=previous[0]), {previous[1]})
+        previous = None
+
+    category_ids = {instance.category_id_id}
+    if previous:
+        category_ids.add(previous[1])
+    refresh_baby_steps_for_expenses(instance.user_id, category_ids)
+
+
+@receiver(post_delete, sender=Expense)
+def refresh_milestones_on_expense_delete(sender, instance, origin=None, **kwargs):
+    if _cascaded(sender, origin):
+        return  # see refresh_milestones_on_category_delete
+    refresh_baby_steps_for_expenses(instance.user_id, {instance.category_id_id})
+
+
+@receiver(pre_delete, sender=Category)
+def remember_category_milestone_users(sender, instance, **kwargs):
+    instance._milestone_user_ids = []
+    if instance.name.casefold() in {name.casefold() for name in BABY_STEP_CATEGORIES}:
+        instance._milestone_user_ids = list(
+            MonthlySpend.objects.filter(category_id=instance)
+            .values_list("user_id", flat=True).distinct()
+        )
+
+
+@receiver(post_delete, sender=Category)
+def refresh_milestones_on_category_delete(sender, instance, **kwargs):
+    """One batch re-evaluation of the users whose milestone category went away."""
+    user_ids = getattr(instance, "_milestone_user_ids", None)
+    if user_ids:
+        # After commit: the category registry and the rollup are updated by then
+        transaction.on_commit(lambda: recompute_milestones_for_users(user_ids))
+
+
+@receiver(pre_save, sender=User)
+def remember_previous_salary(sender, instance, raw=False, **kwargs):
+    instance._previous_salary = None
+    if raw or instance.pk is None:
+        return
+    instance._previous_salary = User.objects.filter(pk=instance.pk).values_list("salary", flat=True).first()
+
+
+@receiver(post_save, sender=User)
+def refresh_milestones_on_salary_change(sender, instance, created=False, raw=False, **kwargs):
+    if created or raw:
+        return
+    if instance._previous_salary != User._meta.get_field("salary").to_python(instance.salary):
+        # Steps 3 and 4 have salary-based targets
+        update_baby_steps(instance, affected_baby_steps(salary_changed=True))
+
+
+# =====================================================================
+#                   TOKEN ACCESS (DEACTIVATION / REVOCATION)
+# =====================================================================
+
+@receiver(post_save, sender=User)
+def sync_token_access(sender, instance, created=False, raw=False, **kwargs):
+    if raw:
+        return
+    token_access.set_active(instance.user_id, instance.is_active)
+    # set_password() keeps the raw password in _password until save() ends
+    if not created and instance._password is not None:
+        # A password change logs out every existing session
+        token_access.revoke(instance.user_id)
+
+
+@receiver(post_delete, sender=User)
+def revoke_deleted_user_tokens(sender, instance, **kwargs):
+    token_access.revoke(instance.user_id)
+
+
+# =====================================================================
+#                   CATEGORY REGISTRY INVALIDATION
+# =====================================================================
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_registry(sender, **kwargs):
+    category_registry.invalidate()
+
+
+# =====================================================================
+#                   CACHED PAYLOAD INVALIDATION
+# =====================================================================
+
+@receiver(post_save, sender=Expense)
+@receiver(post_delete, sender=Expense)
+@receiver(post_save, sender=UserResponse)
+@receiver(post_delete, sender=UserResponse)
+@receiver(post_save, sender=ChildrenContribution)
+@receiver(post_delete, sender=ChildrenContribution)
+def bump_owner_data_version(sender, instance, origin=None, **kwargs):
+    if kwargs["signal"] is post_delete and _cascaded(sender, origin):
+        return  # the user is gone, or the category change bumps every user
+    bump_user_data_version(instance.user_id_id)
+
+
+@receiver(post_save, sender=UserResponse)
+@receiver(post_delete, sender=UserResponse)
+@receiver(post_save, sender=ChildrenContribution)
+@receiver(post_delete, sender=ChildrenContribution)
+def bump_owner_milestone_version(sender, instance, origin=None, **kwargs):
+    if kwargs["signal"] is post_delete and _cascaded(sender, origin):
+        return
+    # answers and the children plan total feed the milestone status
+    bump_user_milestone_version(instance.user_id_id)
+
+
+@receiver(post_save, sender=User)
+def bump_user_version_on_profile_change(sender, instance, **kwargs):
+    # salary / total_balance / username feed the dashboard and milestones
+    bump_user_data_version(instance.user_id)
+    bump_user_milestone_version(instance.user_id)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def bump_global_version_on_category_change(sender, **kwargs):
+    # category names appear in every user's expense payloads
+    bump_global_data_version()
+
+
+# =====================================================================
+#                    PER-REQUEST QUERY INSTRUMENTATION
+# =====================================================================
+
+connection_created.connect(instrument_connection, dispatch_uid="users.query_metrics")
@@ -0,0 +1,14 @@
+# backend/apps/users/testing.py
+"""Helpers shared by the test suite and the benchmark commands."""
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+def access_token(user) -> str:
+    """A signed access token for `user`, with the same claims as UserViewSet.login."""
+    refresh = RefreshToken()
+    refresh["user_id"] = user.user_id
+    refresh["email"] = user.email
+    access = refresh.access_token
+    access["user_id"] = user.user_id
+    access["email"] = user.email
+    return str(access)
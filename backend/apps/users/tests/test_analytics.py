@@ -0,0 +1,105 @@
+# backend/apps/users/tests/test_analytics.py
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase
+
+from apps.users.models import Category, Expense
+from apps.users.services import get_category_analytics
+
+from .utils import auth_client, create_user
+
+
+class CategoryAnalyticsTests(TestCase):
+    """Totals, rolling averages and changes against hand-computed values."""
+
+    def setUp(self):
+        self.user = create_user()
+        self.groceries = Category.objects.get_or_create(name="Groceries")[0]
+        self.rent = Category.objects.get_or_create(name="Rent")[0]
+        self.add(self.groceries, date(2024, 1, 10), "100.00")
+        self.add(self.groceries, date(2024, 3, 1), "50.00")
+        self.add(self.groceries, date(2024, 3, 31), "25.00")
+        self.add(self.groceries, date(2024, 4, 15), "150.00")
+        self.add(self.rent, date(2024, 2, 1), "200.00")
+        # Outside the range, and another user's spending
+        self.add(self.rent, date(2023, 12, 31), "999.00")
+        self.add(self.groceries, date(2024, 1, 10), "999.00", user=create_user(email="other@example.com"))
+
+    def add(self, category, day, amount, user=None):
+        Expense.objects.create(
+            user_id=user or self.user, category_id=category, expense_date=day, amount=Decimal(amount),
+        )
+
+    def test_monthly_series(self):
+        data = get_category_analytics(self.user, "month", date(2024, 1, 1), date(2024, 4, 30), window=2)
+
+        self.assertEqual(data["periods"], ["2024-01-01", "2024-02-01", "2024-03-01", "2024-04-01"])
+        groceries, rent = data["categories"]
+        self.assertEqual(groceries, {
+            "category_id": self.groceries.category_id,
+            "category_name": "Groceries",
+            "totals": ["100.00", "0.00", "75.00", "150.00"],
+            "rolling_average": ["100.00", "50.00", "37.50", "112.50"],
+            "change": [None, "-100.00", "75.00", "75.00"],
+            "change_pct": [None, -100.0, None, 100.0],
+        })
+        self.assertEqual(rent, {
+            "category_id": self.rent.category_id,
+            "category_name": "Rent",
+            "totals": ["0.00", "200.00", "0.00", "0.00"],
+            "rolling_average": ["0.00", "100.00", "100.00", "0.00"],
+            "change": [None, "200.00", "-200.00", "0.00"],
+            "change_pct": [None, None, -100.0, None],
+        })
+        self.assertEqual(data["overall"], {
+            "totals": ["100.00", "200.00", "75.00", "150.00"],
+            "rolling_average": ["100.00", "150.00", "137.50", "112.50"],
+            "change": [None, "100.00", "-125.00", "75.00"],
+            "change_pct": [None, 100.0, -62.5, 100.0],
+        })
+
+    def test_weekly_series_only_counts_the_range(self):
+        # 2024-01-01 is a Monday; the 2024-01-02 expense is before date_from
+        self.add(self.rent, date(2024, 1, 2), "5.00")
+        self.add(self.rent, date(2024, 1, 4), "10.00")
+        self.add(self.rent, date(2024, 1, 16), "30.00")
+
+        data = get_category_analytics(self.user, "week", date(2024, 1, 3), date(2024, 1, 20), window=3)
+
+        self.assertEqual(data["periods"], ["2024-01-01", "2024-01-08", "2024-01-15"])
+        self.assertEqual([row["category_name"] for row in data["categories"]], ["Groceries", "Rent"])
+        groceries, rent = data["categories"]
+        self.assertEqual(groceries["totals"], ["0.00", "100.00", "0.00"])
+        self.assertEqual(rent["totals"], ["10.00", "0.00", "30.00"])
+        self.assertEqual(rent["rolling_average"], ["10.00", "5.00", "13.33"])
+
+    def test_no_expenses(self):
+        data = get_category_analytics(self.user, "month", date(2020, 1, 1), date(2020, 2, 29))
+
+        self.assertEqual(data["categories"], [])
+        self.assertEqual(data["overall"]["totals"], ["0.00", "0.00"])
+        self.assertEqual(data["overall"]["change_pct"], [None, None])
+
+
+class CategoryAnalyticsViewTests(TestCase):
+
+    def setUp(self):
+        self.client = auth_client(create_user())
+
+    def get(self, query):
+        return self.client.get(f"/api/expenses/analytics/?{query}")
+
+    def test_range_at_the_end_of_the_calendar(self):
+        for period in ("month", "week"):
+            with self.subTest(period=period):
+                response = self.get(f"period={period}&date_from=9999-01-01&date_to=9999-12-31")
+                self.assertEqual(response.status_code, 200, response.content)
+                self.assertEqual(response.json()["periods"][-1], {"month": "9999-12-01", "week": "9999-12-27"}[period])
+
+    def test_range_is_capped(self):
+        self.assertEqual(self.get("period=week&date_from=2020-01-06&date_to=2024-12-29").status_code, 200)
+        self.assertEqual(self.get("period=week&date_from=2020-01-06&date_to=2024-12-30").status_code, 400)
+        self.assertEqual(self.get("period=month&date_from=2020-01-01&date_to=2024-12-31").status_code, 200)
+        self.assertEqual(self.get("period=month&date_from=2020-01-01&date_to=2025-01-01").status_code, 400)
+        self.assertEqual(self.get("period=week&date_from=0001-01-01&date_to=2025-01-01").status_code, 400)
@@ -0,0 +1,50 @@
+# backend/apps/users/tests/test_authentication.py
+import time
+from unittest import mock
+
+from django.test import TestCase
+
+from apps.users.authentication import TokenAccessRegistry
+from apps.users.models import TokenRevocation
+
+from .utils import auth_client, create_user
+
+
+class TokenRevocationTests(TestCase):
+    """Revocations are stored in the database, so every worker refuses the token."""
+
+    def setUp(self):
+        self.user = create_user()
+        self.issued_at = int(time.time()) - 10
+        # Another worker: its own process-local registry, reloaded on every check
+        self.other_worker = TokenAccessRegistry(ttl=0)
+        self.assertTrue(self.other_worker.allows(self.user.user_id, self.issued_at))
+
+    def test_password_change_revokes_for_every_worker(self):
+        self.user.set_password("new-pass")
+        self.user.save()
+
+        self.assertFalse(self.other_worker.allows(self.user.user_id, self.issued_at))
+        self.assertTrue(self.other_worker.allows(self.user.user_id, int(time.time()) + 1))
+
+    def test_delete_revokes_for_every_worker(self):
+        user_id = self.user.user_id
+        self.user.delete()
+
+        self.assertFalse(self.other_worker.allows(user_id, self.issued_at))
+
+    def test_profile_save_keeps_tokens(self):
+        self.user.city = "Ottawa"
+        self.user.save()
+
+        self.assertFalse(TokenRevocation.objects.exists())
+        self.assertTrue(self.other_worker.allows(self.user.user_id, self.issued_at))
+
+    def test_revoked_token_is_refused(self):
+        client = auth_client(self.user)
+        with mock.patch("apps.users.authentication.token_access", self.other_worker):
+            self.assertEqual(client.get("/api/expenses/").status_code, 200)
+
+            # Recorded by another worker, after the token was issued
+            TokenRevocation.objects.create(user_id=self.user.user_id, revoked_at=int(time.time()) + 1)
+            self.assertEqual(client.get("/api/expenses/").status_code, 401)
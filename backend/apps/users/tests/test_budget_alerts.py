@@ -0,0 +1,41 @@
+# backend/apps/users/tests/test_budget_alerts.py
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+from django.test import TestCase
+
+from apps.users.models import BudgetAlertState, Category, Expense, OutboundEmail
+from apps.users.services import trigger_budget_alerts_for_user
+
+from .utils import create_user
+
+
+class BudgetAlertTests(TestCase):
+    """The threshold claim and the queued email are committed together."""
+
+    def setUp(self):
+        self.user = create_user(salary=Decimal("1000.00"), email_notification=True)
+        Expense.objects.create(
+            user_id=self.user, category_id=Category.objects.get_or_create(name="Groceries")[0],
+            expense_date=date.today(), amount=Decimal("800.00"),
+        )
+
+    def test_alert_queued_once_per_threshold(self):
+        trigger_budget_alerts_for_user(self.user)
+        trigger_budget_alerts_for_user(self.user)
+
+        self.assertEqual(OutboundEmail.objects.filter(recipient=self.user.email).count(), 1)
+        self.assertEqual(BudgetAlertState.objects.get(user_id=self.user).alert_level, 75)
+
+    def test_failed_queue_releases_the_claim(self):
+        with mock.patch("apps.users.services.queue_email", side_effect=RuntimeError("outbox down")):
+            summary = trigger_budget_alerts_for_user(self.user)
+
+        self.assertEqual(summary["alert_level"], 75)
+        self.assertFalse(BudgetAlertState.objects.filter(user_id=self.user).exists())
+        self.assertFalse(OutboundEmail.objects.exists())
+
+        # The next expense write retries the alert
+        trigger_budget_alerts_for_user(self.user)
+        self.assertEqual(OutboundEmail.objects.filter(recipient=self.user.email).count(), 1)
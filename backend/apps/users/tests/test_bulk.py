@@ -0,0 +1,126 @@
+# backend/apps/users/tests/test_bulk.py
+import json
+from collections import Counter
+from datetime import date, timedelta
+
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.users import services
+from apps.users.models import Category, Expense, MonthlySpend
+from apps.users.views import ExpenseViewSet
+
+from .utils import auth_client, create_user, milestone_categories
+
+
+class BulkExpenseTests(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.client = auth_client(self.user)
+        self.categories = milestone_categories() + [
+            Category.objects.get_or_create(name=name)[0] for name in ("Groceries", "Rent", "Utilities")
+        ]
+
+    def rows(self, count, start=date(2024, 1, 1)):
+        # Stays within one month: the rollup work does not grow with the row count
+        per_day = len(self.categories)
+        return [
+            {
+                "expense_date": (start + timedelta(days=n // per_day)).isoformat(),
+                "category_id": self.categories[n % per_day].category_id,
+                "amount": "10.00",
+            }
+            for n in range(count)
+        ]
+
+    def post(self, rows):
+        return self.client.post("/api/expenses/bulk/", json.dumps(rows), content_type="application/json")
+
+    def test_query_count_does_not_grow_with_rows(self):
+        counts = []
+        for count, start in ((16, date(2024, 1, 1)), (200, date(2024, 3, 1))):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.post(self.rows(count, start))
+            self.assertEqual(response.status_code, 201, response.content)
+            self.assertEqual(response.json(), {"created": count})
+            counts.append(len(queries.captured_queries))
+        self.assertEqual(counts[0], counts[1])
+
+        self.assertEqual(Expense.objects.filter(user_id=self.user).count(), 216)
+        march = MonthlySpend.objects.filter(user_id=self.user, month=date(2024, 3, 1))
+        self.assertEqual(sum(row.expense_count for row in march), 200)
+
+    def test_rollup_query_count_does_not_grow_with_months(self):
+        counts = []
+        for months, start in ((1, date(2024, 1, 1)), (6, date(2025, 1, 1))):
+            rows = [
+                {**row, "expense_date": date(start.year, month, 1 + n).isoformat()}
+                for month in range(1, months + 1)
+                for n, row in enumerate(self.rows(len(self.categories)))
+            ]
+            # Every (category, month) rollup row exists already: the update path
+            for row in rows:
+                services.apply_expense_to_rollup(
+                    self.user.user_id, row["category_id"], date.fromisoformat(row["expense_date"]), 1, count=1
+                )
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self.post(rows).status_code, 201)
+            counts.append(sum("monthly_spend" in query["sql"] for query in queries.captured_queries))
+        # SELECT ... FOR UPDATE, one bulk UPDATE, and the budget alert reading the month
+        self.assertEqual(counts, [3, 3])
+
+        june = MonthlySpend.objects.get(user_id=self.user, month=date(2025, 6, 1), category_id=self.categories[0])
+        self.assertEqual((june.total_amount, june.expense_count), (11, 2))
+
+    def test_chunks_refresh_once_per_user(self):
+        other = create_user(email="other@example.com")
+        rows = self.rows(10) + [{**row, "user_id": other.user_id} for row in self.rows(10)]
+
+        with mock.patch.object(ExpenseViewSet, "bulk_chunk_size", 3), \
+                mock.patch.object(services, "refresh_baby_steps_for_expenses") as refresh, \
+                mock.patch.object(services, "bump_user_data_version") as bump:
+            response = self.post(rows)
+
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(sorted(call.args[0].pk for call in refresh.call_args_list), [self.user.pk, other.pk])
+        self.assertEqual(sorted(call.args[0] for call in bump.call_args_list), [self.user.pk, other.pk])
+        self.assertEqual(
+            {row.category_id_id: row.expense_count for row in MonthlySpend.objects.filter(user_id=other)},
+            dict(Counter(row["category_id"] for row in self.rows(10))),
+        )
+
+    def test_duplicate_inside_upload(self):
+        rows = self.rows(3)
+        response = self.post(rows + [rows[1]])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["errors"][3], {
+            "non_field_errors": ["The fields user_id, expense_date, category_id must make a unique set."],
+        })
+        self.assertFalse(Expense.objects.exists())
+
+    def test_duplicate_of_stored_expense(self):
+        self.assertEqual(self.post(self.rows(2)).status_code, 201)
+
+        response = self.post(self.rows(3))
+
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()["errors"]
+        self.assertIn("non_field_errors", errors[0])
+        self.assertEqual(errors[2], {})
+        self.assertEqual(Expense.objects.count(), 2)
+
+    def test_unknown_category(self):
+        rows = self.rows(2)
+        rows[1]["category_id"] = 999999
+
+        response = self.post(rows)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["errors"][1], {
+            "category_id": ['Invalid pk "999999" - object does not exist.'],
+        })
+        self.assertFalse(Expense.objects.exists())
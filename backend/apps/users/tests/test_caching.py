@@ -0,0 +1,90 @@
+# backend/apps/users/tests/test_caching.py
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase, override_settings
+
+from apps.users.caching import get_data_versions, milestone_cache_key
+from apps.users.checks import check_conditional_get_cache
+from apps.users.models import Expense
+from apps.users.services import refresh_baby_steps_for_expenses
+
+from .utils import auth_client, create_user, milestone_categories, seed_user_data
+
+
+class VersionBumpTests(TestCase):
+    """Version keys move only once the write that invalidates them commits."""
+
+    def setUp(self):
+        cache.clear()
+        self.categories = milestone_categories()
+        self.user = create_user()
+
+    def test_expense_write_bumps_after_commit(self):
+        before = get_data_versions(self.user.user_id)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                seed_user_data(self.user, 1, self.categories)
+                self.assertEqual(get_data_versions(self.user.user_id), before)
+        self.assertEqual(get_data_versions(self.user.user_id), before)
+
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(get_data_versions(self.user.user_id), before)
+
+    def test_rolled_back_write_keeps_version(self):
+        before = get_data_versions(self.user.user_id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    seed_user_data(self.user, 1, self.categories)
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        self.assertFalse(Expense.objects.exists())
+        self.assertEqual(get_data_versions(self.user.user_id), before)
+
+    def test_milestone_refresh_bumps_after_commit(self):
+        seed_user_data(self.user, 4, self.categories)
+        with self.captureOnCommitCallbacks(execute=True):
+            before = milestone_cache_key(self.user.user_id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                refresh_baby_steps_for_expenses(self.user, {category.pk for category in self.categories})
+                self.assertEqual(milestone_cache_key(self.user.user_id), before)
+        self.assertNotEqual(milestone_cache_key(self.user.user_id), before)
+
+
+class ConditionalGetTests(TestCase):
+    """304s need version keys shared by every worker (settings.CONDITIONAL_GET)."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user()
+        self.client = auth_client(self.user)
+
+    def test_revalidation_answers_304(self):
+        first = self.client.get("/api/expenses/monthly-summary/")
+        self.assertIn("ETag", first.headers)
+
+        second = self.client.get("/api/expenses/monthly-summary/", HTTP_IF_NONE_MATCH=first.headers["ETag"])
+        self.assertEqual(second.status_code, 304)
+
+    @override_settings(CONDITIONAL_GET=False)
+    def test_disabled_without_shared_cache(self):
+        first = self.client.get("/api/expenses/monthly-summary/")
+        self.assertNotIn("ETag", first.headers)
+
+        second = self.client.get("/api/expenses/monthly-summary/", HTTP_IF_NONE_MATCH='"anything"')
+        self.assertEqual(second.status_code, 200)
+
+    @override_settings(CONDITIONAL_GET=True)
+    def test_deploy_check_warns_on_process_local_cache(self):
+        self.assertEqual([warning.id for warning in check_conditional_get_cache(None)], ["users.W001"])
+
+    @override_settings(CONDITIONAL_GET=False)
+    def test_deploy_check_silent_when_disabled(self):
+        self.assertEqual(check_conditional_get_cache(None), [])
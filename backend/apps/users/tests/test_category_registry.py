@@ -0,0 +1,66 @@
+# backend/apps/users/tests/test_category_registry.py
+from unittest import mock
+
+from django.test import TestCase
+
+from apps.users.category_registry import CategoryRegistry, category_registry
+from apps.users.models import Category
+
+
+class CategoryRegistryTests(TestCase):
+
+    def setUp(self):
+        self.groceries = Category.objects.get_or_create(name="Groceries")[0]
+        self.registry = CategoryRegistry(ttl=None, miss_reload_interval=0)
+
+    def created_by_another_worker(self, name):
+        # bulk_create sends no post_save, like a save in another process
+        Category.objects.bulk_create([Category(name=name)])
+        return Category.objects.get(name=name).category_id
+
+    def test_hit_is_served_from_memory(self):
+        self.assertEqual(self.registry.get_id("Groceries"), self.groceries.category_id)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.registry.get_id("GROCERIES"), self.groceries.category_id)
+            self.assertEqual(self.registry.get_ids(["groceries"]), {"groceries": self.groceries.category_id})
+
+    def test_miss_reloads(self):
+        self.assertIsNone(self.registry.get_id("Rent"))
+        rent_id = self.created_by_another_worker("Rent")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.registry.get_ids(["Groceries", "Rent"]), {
+                "Groceries": self.groceries.category_id, "Rent": rent_id,
+            })
+
+    def test_miss_reloads_at_most_once_per_interval(self):
+        self.registry.miss_reload_interval = 60
+        self.registry.get_id("Groceries")
+        self.created_by_another_worker("Rent")
+
+        with self.assertNumQueries(0):
+            self.assertIsNone(self.registry.get_id("Rent"))
+
+        with mock.patch("apps.users.category_registry.time.monotonic", return_value=self.registry._loaded_at + 61):
+            self.assertIsNotNone(self.registry.get_id("Rent"))
+
+    def test_ttl_reloads(self):
+        self.registry.ttl = 60
+        self.registry.get_id("Groceries")
+        Category.objects.filter(pk=self.groceries.pk).update(name="Groceries and food")
+
+        self.assertEqual(self.registry.get_id("Groceries"), self.groceries.category_id)
+        with mock.patch("apps.users.category_registry.time.monotonic", return_value=self.registry._loaded_at + 61):
+            self.assertIsNone(self.registry.get_id("Groceries"))
+
+    def test_category_save_and_delete_invalidate(self):
+        category_registry.get_id("Groceries")
+
+        rent = Category.objects.create(name="Rent")
+        self.assertIsNone(category_registry._ids)
+        self.assertEqual(category_registry.get_id("Rent"), rent.category_id)
+
+        rent.delete()
+        self.assertIsNone(category_registry._ids)
+        self.assertIsNone(category_registry.get_id("Rent"))
@@ -0,0 +1,94 @@
+# backend/apps/users/tests/test_commands.py
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.users.management.commands import recompute_milestones
+from apps.users.management.commands.generate_synthetic_data import synthetic_users
+from apps.users.models import Expense, MonthlySpend, UserMilestone, UserResponse
+from apps.users.services import BABY_STEP_RULES, update_baby_steps
+
+from .utils import create_user, milestone_categories, seed_user_data
+
+
+class GenerateSyntheticDataTests(TestCase):
+    def generate(self, **options):
+        call_command(
+            "generate_synthetic_data", users=3, expenses=20, months=2, seed=7,
+            stdout=StringIO(), **options,
+        )
+
+    def test_rerun_with_clear(self):
+        self.generate()
+        self.generate(clear=True)
+
+        users = synthetic_users("synthetic")
+        self.assertEqual(users.count(), 3)
+        self.assertEqual(Expense.objects.filter(user_id__in=users).count(), 60)
+        self.assertEqual(
+            sum(MonthlySpend.objects.filter(user_id__in=users).values_list("expense_count", flat=True)), 60
+        )
+        # No rows left behind by the deleted users
+        self.assertEqual(Expense.objects.count(), 60)
+        self.assertFalse(UserMilestone.objects.exclude(user_id__in=users).exists())
+
+
+class InlineExecutor:
+    """
+    Stands in for the command's ProcessPoolExecutor: pool workers open
+    their own connections and cannot see the test database, so the chunks
+    run in this process through the same worker entry point.
+    """
+
+    def __init__(self, max_workers, initializer):
+        initializer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, fn, iterable):
+        return map(fn, iterable)
+
+
+class RecomputeMilestonesTests(TestCase):
+    """Serial and pooled runs write what update_baby_steps would."""
+
+    def setUp(self):
+        categories = milestone_categories()
+        self.users = []
+        for n in range(5):
+            user = create_user(email=f"recompute-{n}@example.com", salary=Decimal(1000 * n))
+            seed_user_data(user, n + 1, categories)
+            UserResponse.objects.create(
+                user_id=user, salary_confirmed=True, has_debt=bool(n % 2), emergency_savings=True,
+                full_emergency_fund=True, retirement_investing=bool(n % 3), has_children=False,
+            )
+            self.users.append(user)
+        create_user(email="no-answer@example.com")
+
+    def milestones(self):
+        rows = list(UserMilestone.objects.values_list("user_id", "milestone_id", "is_completed", "completed_at"))
+        UserMilestone.objects.all().delete()
+        return {(user_id, step, completed, completed_at is not None) for user_id, step, completed, completed_at in rows}
+
+    def recompute(self, **options):
+        call_command("recompute_milestones", chunk_size=2, stdout=StringIO(), **options)
+        return self.milestones()
+
+    def test_serial_and_workers_match_update_baby_steps(self):
+        self.milestones()
+        for user in self.users:
+            update_baby_steps(user, set(BABY_STEP_RULES))
+        expected = self.milestones()
+        self.assertEqual(len(expected), 7 * len(self.users))
+        self.assertEqual({completed for _, _, completed, _ in expected}, {True, False})
+
+        self.assertEqual(self.recompute(), expected)
+        with mock.patch.object(recompute_milestones, "ProcessPoolExecutor", InlineExecutor):
+            self.assertEqual(self.recompute(workers=2), expected)
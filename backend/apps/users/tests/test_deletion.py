@@ -0,0 +1,57 @@
+# backend/apps/users/tests/test_deletion.py
+from django.test import TestCase
+
+from apps.users.models import (
+    Category, Expense, MonthlySpend, User, UserMilestone, UserResponse,
+)
+
+from apps.users.services import BABY_STEP_RULES, update_baby_steps
+
+from .utils import create_user, milestone_categories, seed_user_data
+
+
+class CascadeDeleteTests(TestCase):
+    """Deleting a user or a category must not run per-expense signal work."""
+
+    def setUp(self):
+        self.categories = milestone_categories()
+        self.user = create_user()
+        seed_user_data(self.user, 10, self.categories)
+        self.other = create_user(email="other@example.com")
+        seed_user_data(self.other, 5, self.categories)
+        for user in (self.user, self.other):
+            update_baby_steps(user, set(BABY_STEP_RULES))
+
+    def test_delete_user_with_expenses_and_responses(self):
+        self.assertTrue(UserMilestone.objects.filter(user_id=self.user).exists())
+
+        self.user.delete()
+
+        self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
+        for model in (Expense, UserResponse, UserMilestone, MonthlySpend):
+            self.assertFalse(model.objects.filter(user_id=self.user.pk).exists(), model.__name__)
+        # The other user's data is untouched
+        self.assertEqual(Expense.objects.filter(user_id=self.other).count(), 5)
+
+    def test_delete_users_queryset(self):
+        User.objects.filter(pk__in=[self.user.pk, self.other.pk]).delete()
+
+        self.assertFalse(Expense.objects.exists())
+        self.assertFalse(UserMilestone.objects.exists())
+
+    def test_delete_category_refreshes_affected_users_once(self):
+        category = self.categories[0]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            category.delete()
+
+        self.assertFalse(Expense.objects.filter(category_id=category.pk).exists())
+        self.assertFalse(MonthlySpend.objects.filter(category_id=category.pk).exists())
+        for user in (self.user, self.other):
+            stored = list(
+                UserMilestone.objects.filter(user_id=user)
+                .order_by("milestone_id").values_list("is_completed", flat=True)
+            )
+            # The batch refresh left the same state a full re-evaluation computes
+            self.assertEqual(stored, update_baby_steps(user, set(BABY_STEP_RULES)))
+        self.assertTrue(Category.objects.exists())
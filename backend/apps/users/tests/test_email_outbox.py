@@ -0,0 +1,62 @@
+# backend/apps/users/tests/test_email_outbox.py
+from datetime import timedelta
+from unittest import mock
+
+from django.core import mail
+from django.core.mail import EmailMessage
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.users.email_outbox import queue_email, send_queued_emails
+from apps.users.models import OutboundEmail
+
+
+class SendQueuedEmailsTests(TestCase):
+    """The batch is claimed and committed before any SMTP traffic."""
+
+    def setUp(self):
+        self.email = queue_email("Subject", "Body", "user@example.com")
+
+    def test_sends_outside_the_claim_transaction(self):
+        # Savepoints open around the test itself; a claim transaction would add one
+        depth = len(connection.savepoint_ids)
+        seen = []
+
+        def send(message, *args, **kwargs):
+            seen.append((len(connection.savepoint_ids), OutboundEmail.objects.get(pk=self.email.pk).status))
+            return 1
+
+        with mock.patch.object(EmailMessage, "send", send):
+            counts = send_queued_emails()
+
+        self.assertEqual(seen, [(depth, "sending")])
+        self.assertEqual(counts, {"sent": 1, "retried": 0, "failed": 0})
+        self.assertEqual(OutboundEmail.objects.get(pk=self.email.pk).status, "sent")
+
+    def test_claimed_email_is_not_sent_twice(self):
+        with mock.patch.object(EmailMessage, "send", side_effect=lambda *a, **k: send_queued_emails()):
+            send_queued_emails()
+
+        self.assertEqual(OutboundEmail.objects.get(pk=self.email.pk).attempts, 1)
+
+    def test_failure_returns_email_to_pending(self):
+        with mock.patch.object(EmailMessage, "send", side_effect=OSError("refused")):
+            counts = send_queued_emails(max_attempts=3)
+
+        email = OutboundEmail.objects.get(pk=self.email.pk)
+        self.assertEqual(counts["retried"], 1)
+        self.assertEqual((email.status, email.attempts, email.last_error), ("pending", 1, "refused"))
+        self.assertGreater(email.next_attempt_at, timezone.now())
+
+    @override_settings(EMAIL_OUTBOX_CLAIM_TIMEOUT=60)
+    def test_expired_claim_is_sent_again(self):
+        # A worker claimed the email and died
+        OutboundEmail.objects.filter(pk=self.email.pk).update(
+            status="sending", next_attempt_at=timezone.now() + timedelta(seconds=60)
+        )
+        self.assertEqual(send_queued_emails()["sent"], 0)
+
+        OutboundEmail.objects.filter(pk=self.email.pk).update(next_attempt_at=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(send_queued_emails()["sent"], 1)
+        self.assertEqual(len(mail.outbox), 1)
@@ -0,0 +1,86 @@
+# backend/apps/users/tests/test_export.py
+import csv
+import io
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+
+from apps.users.models import Category, Expense
+
+from .utils import auth_client, create_user
+
+
+class ExpenseExportTests(TestCase):
+    """The export streams the list endpoint's rows: same filters, same fields."""
+
+    def setUp(self):
+        self.user = create_user()
+        self.other = create_user(email="other@example.com")
+        self.categories = [Category.objects.get_or_create(name=name)[0] for name in ("Groceries", "Rent", "Utilities")]
+        # Three expenses per day, so chunk boundaries fall inside a date
+        for n in range(7):
+            for index, category in enumerate(self.categories):
+                Expense.objects.create(
+                    user_id=self.user, category_id=category, expense_date=date(2024, 1, 1) + timedelta(days=n),
+                    amount=Decimal("10.05") * (n + 1) + index,
+                )
+        Expense.objects.create(
+            user_id=self.other, category_id=self.categories[0], expense_date=date(2024, 1, 3), amount=Decimal("1.00"),
+        )
+        self.client = auth_client(self.user)
+
+    def listed(self, **filters):
+        response = self.client.get("/api/expenses/", {"page_size": 500, **filters})
+        self.assertEqual(response.status_code, 200, response.content)
+        return {row["expense_id"]: row for row in response.json()["results"]}
+
+    def exported(self, export_format="ndjson", **filters):
+        response = self.client.get("/api/expenses/export/", {"format": export_format, **filters})
+        self.assertEqual(response.status_code, 200)
+        return b"".join(response.streaming_content).decode()
+
+    def ndjson_rows(self, **filters):
+        return [json.loads(line) for line in self.exported(**filters).splitlines()]
+
+    def test_same_rows_as_list(self):
+        cases = [
+            {},
+            {"category_id": self.categories[1].category_id},
+            {"date_from": "2024-01-03", "date_to": "2024-01-05"},
+            {"category_id": self.categories[0].category_id, "date_from": "2024-01-06"},
+            {"user_id": self.other.user_id},
+        ]
+        for filters in cases:
+            with self.subTest(**filters):
+                rows = self.ndjson_rows(**filters)
+                self.assertTrue(rows)
+                self.assertEqual({row["expense_id"]: row for row in rows}, self.listed(**filters))
+                self.assertEqual(
+                    [row["expense_date"] for row in rows], sorted((row["expense_date"] for row in rows), reverse=True)
+                )
+
+    def test_scoped_to_the_user(self):
+        rows = self.ndjson_rows()
+        self.assertEqual(len(rows), 21)
+        self.assertEqual({row["user_id"] for row in rows}, {self.user.user_id})
+
+    def test_csv_formats_like_list_rows(self):
+        listed = self.listed(category_id=self.categories[2].category_id)
+        rows = list(csv.DictReader(io.StringIO(self.exported("csv", category_id=self.categories[2].category_id))))
+
+        self.assertEqual(len(rows), len(listed))
+        for row in rows:
+            expected = listed[int(row["expense_id"])]
+            self.assertEqual(row, {field: str(value) for field, value in expected.items()})
+        self.assertEqual(rows[0]["amount"], "72.35")
+        self.assertEqual(rows[0]["expense_date"], "2024-01-07")
+
+    def test_chunk_boundaries(self):
+        everything = sorted(self.listed())
+        for chunk_size in (1, 2, 3, 4, 7, 21, 22):
+            with self.subTest(chunk_size=chunk_size), override_settings(EXPORT_CHUNK_SIZE=chunk_size):
+                ids = [row["expense_id"] for row in self.ndjson_rows()]
+                self.assertEqual(len(ids), len(set(ids)))
+                self.assertEqual(sorted(ids), everything)
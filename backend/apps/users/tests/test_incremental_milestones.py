@@ -0,0 +1,98 @@
+# backend/apps/users/tests/test_incremental_milestones.py
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.users import services
+from apps.users.category_registry import category_registry
+from apps.users.models import Category, Expense, UserMilestone, UserResponse
+from apps.users.services import BABY_STEP_RULES, refresh_baby_steps_for_expenses, update_baby_steps
+
+from .utils import auth_client, create_user
+
+
+class IncrementalMilestoneTests(TestCase):
+    """Expense and answer changes re-evaluate only the steps that read them."""
+
+    def setUp(self):
+        self.user = create_user(salary=Decimal("1000.00"))
+        self.categories = {
+            name: Category.objects.get_or_create(name=name)[0]
+            for name in services.BABY_STEP_CATEGORIES + ["Groceries"]
+        }
+        self.response = UserResponse.objects.create(
+            user_id=self.user, salary_confirmed=True, has_debt=True, emergency_savings=True,
+            full_emergency_fund=True, retirement_investing=True, has_children=True,
+            bought_home=True, pay_off_home=False, mortgage_remaining=Decimal("500.00"),
+        )
+        update_baby_steps(self.user, set(BABY_STEP_RULES))
+        category_registry.get_ids(services.BABY_STEP_CATEGORIES)
+        self.days = (date(2024, 1, 1) + timedelta(days=n) for n in range(1000))
+
+    def spend(self, category, amount):
+        return Expense.objects.create(
+            user_id=self.user, category_id=self.categories[category],
+            expense_date=next(self.days), amount=Decimal(amount),
+        )
+
+    def answer(self, **fields):
+        UserResponse.objects.filter(pk=self.response.pk).update(**fields)
+        services.recalculate_baby_steps_and_email(self.user, response_fields=set(fields))
+
+    def raise_salary(self, salary):
+        self.user.salary = salary
+        self.user.save()
+
+    def stored(self) -> dict:
+        return dict(UserMilestone.objects.filter(user_id=self.user).values_list("milestone_id", "is_completed"))
+
+    def test_other_category_does_no_milestone_work(self):
+        with self.assertNumQueries(0):
+            refresh_baby_steps_for_expenses(self.user, {self.categories["Groceries"].category_id})
+
+        with CaptureQueriesContext(connection) as queries:
+            self.spend("Groceries", "50.00")
+        self.assertFalse([query for query in queries.captured_queries if "user_milestone" in query["sql"]])
+
+    def test_answer_change_evaluates_only_its_steps(self):
+        rules = {
+            step: (mock.Mock(wraps=rule), categories, fields, uses_salary)
+            for step, (rule, categories, fields, uses_salary) in BABY_STEP_RULES.items()
+        }
+        with mock.patch.dict(BABY_STEP_RULES, rules):
+            response = auth_client(self.user).patch(
+                f"/api/user-responses/{self.response.response_id}/",
+                json.dumps({"has_debt": False}), content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual([step for step, (rule, *_) in rules.items() if rule.called], [2])
+        self.assertTrue(self.stored()[2])
+
+    def test_incremental_matches_full_evaluation(self):
+        changes = [
+            lambda: self.spend("Emergency savings", "1000.00"),
+            lambda: self.spend("Full Emergency savings", "6000.00"),
+            lambda: self.spend("Retirement Investing", "150.00"),
+            lambda: self.spend("Children Contribution", "10.00"),
+            lambda: self.spend("Home Mortgage", "499.99"),
+            lambda: self.spend("Home Mortgage", "0.01"),
+            lambda: self.spend("Groceries", "80.00"),
+            lambda: self.answer(has_debt=False),
+            lambda: self.answer(mortgage_remaining=Decimal("600.00")),
+            lambda: self.raise_salary(Decimal("2000.00")),
+            lambda: Expense.objects.filter(category_id=self.categories["Emergency savings"]).delete(),
+        ]
+        for number, change in enumerate(changes):
+            change()
+            incremental = self.stored()
+            update_baby_steps(self.user, set(BABY_STEP_RULES))
+            self.assertEqual(incremental, self.stored(), f"after change {number}")
+
+        # The sequence went through completing and regressing steps
+        self.assertEqual(self.stored(), {1: False, 2: True, 3: False, 4: False, 5: True, 6: False, 7: False})
@@ -0,0 +1,67 @@
+# backend/apps/users/tests/test_middleware.py
+import gzip
+from datetime import date
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from apps.users.middleware import ThresholdGZipMiddleware
+
+from .utils import auth_client, create_user, milestone_categories
+
+
+@override_settings(
+    QUERY_COUNT_WARNING_THRESHOLD=50,
+    QUERY_COUNT_WARNING_THRESHOLDS={("GET", "expense-list"): 0},
+)
+class QueryThresholdTests(TestCase):
+    """Per-view query thresholds apply to one HTTP method of a URL name."""
+
+    def setUp(self):
+        self.user = create_user()
+        self.client = auth_client(self.user)
+
+    def test_get_uses_its_threshold(self):
+        with self.assertLogs("apps.users.middleware", "WARNING") as logs:
+            self.client.get("/api/expenses/")
+        self.assertIn("GET /api/expenses/ ran", logs.output[0])
+
+    def test_post_on_same_url_uses_default(self):
+        category = milestone_categories()[0]
+        with self.assertNoLogs("apps.users.middleware", "WARNING"):
+            response = self.client.post(
+                "/api/expenses/",
+                {"user_id": self.user.user_id, "category_id": category.pk,
+                 "amount": "12.50", "expense_date": date.today().isoformat()},
+                content_type="application/json",
+            )
+        self.assertEqual(response.status_code, 201)
+
+
+@override_settings(GZIP_MIN_SIZE=1024)
+class ThresholdGZipTests(SimpleTestCase):
+    """Bodies under GZIP_MIN_SIZE stay plain, larger ones are compressed."""
+
+    def respond(self, response):
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="gzip")
+        return ThresholdGZipMiddleware(lambda request: response)(request)
+
+    def test_under_threshold_is_plain(self):
+        body = b"a" * 1023
+        response = self.respond(HttpResponse(body))
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response.content, body)
+
+    def test_over_threshold_is_compressed(self):
+        body = b"a" * 1024
+        response = self.respond(HttpResponse(body))
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), body)
+
+    def test_streaming_is_compressed(self):
+        response = self.respond(StreamingHttpResponse([b"a" * 10]))
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(b"".join(response.streaming_content)), b"a" * 10)
@@ -0,0 +1,66 @@
+# backend/apps/users/tests/test_migrations.py
+from datetime import date, timedelta
+from importlib import import_module
+from unittest import mock
+
+from django.db import connection
+from django.db.migrations.exceptions import IrreversibleError
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+backfill = import_module("apps.users.migrations.0008_expense_surrogate_key")
+swap = import_module("apps.users.migrations.0010_expense_primary_key")
+
+
+class ExpenseSurrogateKeyMigrationTests(TransactionTestCase):
+    """0008 backfills expense_id online; 0010 catches up and swaps the key."""
+
+    before = [("users", "0007_hot_query_indexes")]
+    online = [("users", "0009_seed_baby_step_milestones")]
+    after = [("users", "0010_expense_primary_key")]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        self.migrate(self.after)
+
+    def seed(self, apps, count, start):
+        User = apps.get_model("users", "User")
+        Category = apps.get_model("users", "Category")
+        Expense = apps.get_model("users", "Expense")
+        user = User.objects.first() or User.objects.create(email="mig@example.com", password="x")
+        category = Category.objects.get_or_create(name="Groceries")[0]
+        for n in range(count):
+            Expense.objects.create(
+                expense_date=start + timedelta(days=n), user_id=user, category_id=category, amount=1,
+            )
+
+    def test_backfill_and_swap(self):
+        apps = self.migrate(self.before)
+        self.seed(apps, 7, date(2024, 1, 1))
+
+        with mock.patch.object(backfill, "BATCH_SIZE", 3):
+            apps = self.migrate(self.online)
+        Expense = apps.get_model("users", "Expense")
+        self.assertEqual(sorted(Expense.objects.values_list("expense_id", flat=True)), list(range(1, 8)))
+
+        # Written behind the keyset cursor while 0008 ran: no expense_id yet
+        self.seed(apps, 2, date(2023, 1, 1))
+        self.assertEqual(Expense.objects.filter(expense_id__isnull=True).count(), 2)
+
+        apps = self.migrate(self.after)
+        Expense = apps.get_model("users", "Expense")
+        ids = list(Expense.objects.order_by("expense_id").values_list("expense_id", flat=True))
+        self.assertEqual(ids, list(range(1, 10)))
+        self.assertEqual(Expense._meta.pk.name, "expense_id")
+
+    def test_swap_is_irreversible_on_mysql(self):
+        operation = swap.Migration.operations[-1]
+        schema_editor = mock.Mock(connection=mock.Mock(vendor="mysql"))
+
+        with self.assertRaises(IrreversibleError):
+            operation.database_backwards("users", schema_editor, None, None)
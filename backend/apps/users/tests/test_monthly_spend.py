@@ -0,0 +1,85 @@
+# backend/apps/users/tests/test_monthly_spend.py
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase
+
+from apps.users.models import Category, Expense, MonthlySpend
+from apps.users.services import rebuild_monthly_spend
+
+from .utils import create_user
+
+
+class MonthlySpendSignalTests(TestCase):
+    """Expense writes keep MonthlySpend in step, without a rebuild."""
+
+    def setUp(self):
+        self.user = create_user()
+        self.groceries = Category.objects.get_or_create(name="Groceries")[0]
+        self.rent = Category.objects.get_or_create(name="Rent")[0]
+        self.expense = Expense.objects.create(
+            user_id=self.user, category_id=self.groceries, expense_date=date(2024, 1, 10), amount=Decimal("40.00"),
+        )
+
+    def rollup(self, user=None):
+        """{(month, category_id): (total, count)}, leaving out emptied rows."""
+        return {
+            (row.month, row.category_id_id): (row.total_amount, row.expense_count)
+            for row in MonthlySpend.objects.filter(user_id=user or self.user)
+            if row.expense_count
+        }
+
+    def assertRollup(self, expected, user=None):
+        self.assertEqual(self.rollup(user), expected)
+        # Same as recomputing it from the expenses table
+        rebuild_monthly_spend(user or self.user)
+        self.assertEqual(self.rollup(user), expected)
+
+    def test_create(self):
+        Expense.objects.create(
+            user_id=self.user, category_id=self.groceries, expense_date=date(2024, 1, 20), amount="2.50",
+        )
+        Expense.objects.create(
+            user_id=self.user, category_id=self.rent, expense_date=date(2024, 2, 1), amount=Decimal("900.00"),
+        )
+
+        self.assertRollup({
+            (date(2024, 1, 1), self.groceries.category_id): (Decimal("42.50"), 2),
+            (date(2024, 2, 1), self.rent.category_id): (Decimal("900.00"), 1),
+        })
+
+    def test_update_amount(self):
+        self.expense.amount = Decimal("15.25")
+        self.expense.save()
+
+        self.assertRollup({(date(2024, 1, 1), self.groceries.category_id): (Decimal("15.25"), 1)})
+
+    def test_move_to_another_month(self):
+        self.expense.expense_date = date(2024, 3, 5)
+        self.expense.save()
+
+        self.assertRollup({(date(2024, 3, 1), self.groceries.category_id): (Decimal("40.00"), 1)})
+
+    def test_move_to_another_category(self):
+        self.expense.category_id = self.rent
+        self.expense.save()
+
+        self.assertRollup({(date(2024, 1, 1), self.rent.category_id): (Decimal("40.00"), 1)})
+
+    def test_move_to_another_user(self):
+        other = create_user(email="other@example.com")
+        self.expense.user_id = other
+        self.expense.save()
+
+        self.assertRollup({})
+        self.assertRollup({(date(2024, 1, 1), self.groceries.category_id): (Decimal("40.00"), 1)}, user=other)
+
+    def test_delete(self):
+        Expense.objects.create(
+            user_id=self.user, category_id=self.groceries, expense_date=date(2024, 1, 11), amount=Decimal("10.00"),
+        )
+        self.expense.delete()
+        self.assertRollup({(date(2024, 1, 1), self.groceries.category_id): (Decimal("10.00"), 1)})
+
+        Expense.objects.filter(user_id=self.user).delete()
+        self.assertRollup({})
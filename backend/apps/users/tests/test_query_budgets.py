@@ -0,0 +1,205 @@
+# backend/apps/users/tests/test_query_budgets.py
+"""
+Query budgets of the API endpoints. Every request runs with a cold cache,
+so cached endpoints are measured on their slow path, and for a user with 1
+and with 10 rows of each kind: a count that grows with the data is an N+1.
+"""
+import json
+import re
+from datetime import date
+
+from django.core.cache import cache
+from django.test import TransactionTestCase, TestCase
+
+from apps.users.authentication import token_access
+from apps.users.category_registry import category_registry
+from apps.users.milestone_logic import MILESTONE_CATEGORIES
+from apps.users.models import Category, Expense, Milestone, UserResponse
+from apps.users.services import BABY_STEP_RULES, BABY_STEP_TITLES, update_baby_steps
+
+from .utils import auth_client, create_user, milestone_categories, seed_user_data
+
+SIZES = (1, 10)
+
+
+class QueryBudgetMixin:
+
+    def seed(self):
+        # TransactionTestCase flushes the rows migration 0009 seeded
+        for step, title in enumerate(BABY_STEP_TITLES, start=1):
+            Milestone.objects.get_or_create(milestone_id=step, defaults={"title": title, "description": title})
+        self.categories = milestone_categories()
+        self.other_category = Category.objects.get_or_create(name="Groceries")[0]
+        self.users = []
+        for size in SIZES:
+            user = create_user(email=f"budget-{size}@example.com", password="budget-pass")
+            seed_user_data(user, size, self.categories)
+            update_baby_steps(user, set(BABY_STEP_RULES))
+            self.users.append(user)
+        # Warm, like a running worker
+        category_registry.get_ids(MILESTONE_CATEGORIES.values())
+        for user in self.users:
+            token_access.allows(user.user_id, None)
+
+    def request(self, user, method, path, data=None):
+        cache.clear()
+        kwargs = {}
+        if data is not None:
+            kwargs = {"data": json.dumps(data), "content_type": "application/json"}
+        response = getattr(auth_client(user), method)(path, **kwargs)
+        if response.streaming:
+            b"".join(response.streaming_content)
+        self.assertLess(response.status_code, 400, getattr(response, "content", b"")[:500])
+        return response
+
+
+class QueryBudgetTests(QueryBudgetMixin, TestCase):
+
+    def setUp(self):
+        self.seed()
+
+    def assertBudget(self, budget, method, path, data=None):
+        """`path` and `data` are callables of the user when they depend on it."""
+        for user in self.users:
+            args = (path(user) if callable(path) else path, data(user) if callable(data) else data)
+            # Commit callbacks (cache version bumps) run as they would in production
+            with self.subTest(user=user.email), self.assertNumQueries(budget), \
+                    self.captureOnCommitCallbacks(execute=True):
+                self.request(user, method, *args)
+
+    def expense(self, user):
+        return Expense.objects.filter(user_id=user).order_by("expense_id").first()
+
+    # ----------------------------- USERS -----------------------------
+
+    def test_user_list(self):
+        self.assertBudget(1, "get", "/api/users/")
+
+    def test_user_detail(self):
+        self.assertBudget(1, "get", lambda user: f"/api/users/{user.user_id}/")
+
+    def test_register(self):
+        emails = iter(["new-1@example.com", "new-2@example.com"])
+        self.assertBudget(2, "post", "/api/users/register/", lambda user: {
+            "email": next(emails), "password": "new-pass", "username": "New",
+            "first_name": "New", "last_name": "User", "country": "Canada",
+            "province_state": "Ontario", "city": "Toronto", "postal_code": "M5V 2T6",
+            "phone_number": "416-555-0100",
+        })
+
+    def test_login(self):
+        self.assertBudget(1, "post", "/api/users/login/", lambda user: {
+            "email": user.email, "password": "budget-pass",
+        })
+
+    def test_dashboard(self):
+        self.assertBudget(5, "get", "/api/users/dashboard/")
+
+    # ---------------------------- EXPENSES ---------------------------
+
+    def test_category_list(self):
+        self.assertBudget(1, "get", "/api/categories/")
+
+    def test_expense_list(self):
+        self.assertBudget(1, "get", "/api/expenses/")
+
+    def test_expense_detail(self):
+        self.assertBudget(1, "get", lambda user: f"/api/expenses/{self.expense(user).expense_id}/")
+
+    def test_expense_create(self):
+        self.assertBudget(9, "post", "/api/expenses/", lambda user: {
+            "expense_date": "2000-01-01", "user_id": user.user_id,
+            "category_id": self.other_category.category_id, "amount": "10.00",
+        })
+
+    def test_expense_create_milestone_category(self):
+        # + re-evaluation of the baby step reading that category
+        self.assertBudget(14, "post", "/api/expenses/", lambda user: {
+            "expense_date": "2000-01-01", "user_id": user.user_id,
+            "category_id": self.categories[0].category_id, "amount": "10.00",
+        })
+
+    def test_expense_update(self):
+        self.assertBudget(11, "patch", lambda user: f"/api/expenses/{self.expense(user).expense_id}/", {
+            "amount": "30.00",
+        })
+
+    def test_expense_delete(self):
+        self.assertBudget(8, "delete", lambda user: f"/api/expenses/{self.expense(user).expense_id}/")
+
+    def test_expense_bulk(self):
+        rows = iter([date(2001, 1, 1), date(2002, 1, 1)])
+        self.assertBudget(11, "post", "/api/expenses/bulk/", lambda user: [
+            {"expense_date": next(rows).isoformat(), "user_id": user.user_id,
+             "category_id": self.other_category.category_id, "amount": "10.00"},
+        ])
+
+    def test_expense_export(self):
+        self.assertBudget(1, "get", "/api/expenses/export/?format=csv")
+
+    def test_monthly_summary(self):
+        self.assertBudget(2, "get", "/api/expenses/monthly-summary/")
+
+    def test_expense_analytics(self):
+        self.assertBudget(1, "get", "/api/expenses/analytics/?period=week")
+
+    # --------------------- CHILDREN / MILESTONES ---------------------
+
+    def test_children_list(self):
+        self.assertBudget(1, "get", lambda user: f"/api/children-contributions/?user_id={user.user_id}")
+
+    def test_children_create(self):
+        self.assertBudget(2, "post", "/api/children-contributions/", lambda user: {
+            "user_id": user.user_id, "child_name": "New", "parent_name": "Budget",
+            "total_contribution_planned": "500.00",
+        })
+
+    def test_milestone_list(self):
+        self.assertBudget(1, "get", "/api/milestones/")
+
+    def test_user_milestone_list(self):
+        self.assertBudget(1, "get", "/api/user-milestones/")
+
+    def test_user_response_list(self):
+        self.assertBudget(1, "get", lambda user: f"/api/user-responses/?user_id={user.user_id}")
+
+    def test_user_response_create(self):
+        self.assertBudget(10, "post", "/api/user-responses/", lambda user: {
+            "user_id": user.user_id, "salary_confirmed": True, "has_debt": True, "debt_amount": "100.00",
+        })
+
+    def test_user_response_update(self):
+        latest = lambda user: UserResponse.objects.filter(user_id=user).latest("submitted_at")
+        self.assertBudget(8, "patch", lambda user: f"/api/user-responses/{latest(user).response_id}/", {
+            "has_debt": True, "debt_amount": "100.00",
+        })
+
+    def test_milestones_status(self):
+        self.assertBudget(2, "get", lambda user: f"/api/user-responses/milestones-status/?user_id={user.user_id}")
+
+
+class AsyncQueryBudgetTests(QueryBudgetMixin, TransactionTestCase):
+    """
+    The async views query from worker threads with their own connections,
+    which assertNumQueries does not see: the count comes from the
+    QueryMetricsMiddleware Server-Timing header, which follows the request
+    into those threads. Committed data, so those connections can read it.
+    """
+
+    def setUp(self):
+        self.seed()
+
+    def assertBudget(self, budget, path):
+        for user in self.users:
+            with self.subTest(user=user.email):
+                response = self.request(user, "get", path(user) if callable(path) else path)
+                count = int(re.search(r'desc="(\d+) queries"', response["Server-Timing"]).group(1))
+                self.assertEqual(count, budget)
+
+    def test_async_dashboard(self):
+        self.assertBudget(5, "/api/async/users/dashboard/")
+
+    def test_async_milestones_status(self):
+        self.assertBudget(
+            2, lambda user: f"/api/async/user-responses/milestones-status/?user_id={user.user_id}"
+        )
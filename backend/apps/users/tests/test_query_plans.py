@@ -0,0 +1,75 @@
+# backend/apps/users/tests/test_query_plans.py
+"""
+The hot queries use their indexes. Each check runs the real code path,
+captures the SQL it issues and EXPLAINs that statement, so the check
+follows the code when a query changes shape.
+"""
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.users.milestone_logic import get_latest_response_with_user, get_milestone_category_totals
+from apps.users.models import MonthlySpend
+from apps.users.services import BABY_STEP_RULES, update_baby_steps
+
+from .utils import auth_client, create_user, milestone_categories, seed_user_data
+
+
+def user_indexes(model):
+    """Indexes of `model` whose first column is the user: any of them serves WHERE user_id."""
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+    return [name for name, info in constraints.items() if info["index"] and info["columns"][:1] == ["user_id_id"]]
+
+
+class HotQueryPlanTests(TestCase):
+
+    def setUp(self):
+        self.categories = milestone_categories()
+        self.users = [create_user(email=f"plan-{n}@example.com") for n in range(3)]
+        for user in self.users:
+            seed_user_data(user, 20, self.categories)
+            update_baby_steps(user, set(BABY_STEP_RULES))
+        self.user = self.users[0]
+
+    def explain(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}")
+            return "\n".join(" ".join(map(str, row)) for row in cursor.fetchall())
+
+    def plan(self, run, table):
+        """EXPLAIN output of the one query `run()` issues against `table`."""
+        with CaptureQueriesContext(connection) as queries:
+            run()
+        source = f"FROM {connection.ops.quote_name(table)}"
+        statements = [query["sql"] for query in queries if source in query["sql"]]
+        self.assertEqual(len(statements), 1, statements)
+        return self.explain(statements[0])
+
+    def assertUsesIndex(self, run, table, *indexes):
+        """The query `run()` issues against `table` uses every one of `indexes`."""
+        plan = self.plan(run, table)
+        for index in indexes:
+            self.assertIn(index, plan)
+
+    def test_expense_list(self):
+        client = auth_client(self.user)
+        self.assertUsesIndex(lambda: client.get("/api/expenses/"), "expenses", "expenses_user_date_idx")
+
+    def test_expense_date_range(self):
+        client = auth_client(self.user)
+        params = {"date_from": date.today().replace(day=1).isoformat(), "date_to": date.today().isoformat()}
+        self.assertUsesIndex(lambda: client.get("/api/expenses/", params), "expenses", "expenses_user_date_idx")
+
+    def test_milestone_category_totals(self):
+        # Reads the MonthlySpend rollup, not the expenses
+        plan = self.plan(lambda: get_milestone_category_totals(self.user), "monthly_spend")
+        self.assertTrue(any(index in plan for index in user_indexes(MonthlySpend)), plan)
+
+    def test_latest_response_and_children_total(self):
+        self.assertUsesIndex(
+            lambda: get_latest_response_with_user(self.user.user_id), "user_responses",
+            "user_resp_latest_idx", "children_user_plan_idx",
+        )
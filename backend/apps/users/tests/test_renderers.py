@@ -0,0 +1,48 @@
+# backend/apps/users/tests/test_renderers.py
+import unittest
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from rest_framework.renderers import JSONRenderer
+
+from apps.users.renderers import FastJSONRenderer, orjson
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    """Same bytes as DRF's JSONRenderer, except for the documented float cases."""
+
+    payload = {
+        "next": "http://testserver/api/expenses/?cursor=cD0yMDI0LTAxLTEw",
+        "previous": None,
+        "results": [
+            {
+                "expense_id": 12, "expense_date": date(2024, 1, 10), "amount": Decimal("1234.50"),
+                "created_at": datetime(2024, 1, 10, 8, 30, 15, 123456, tzinfo=timezone.utc),
+                "user_username": "Zoë\u2028\u2029 \"quoted\" </script>", "category_name": "Groceries",
+                "is_completed": True, "milestone_details": {"milestone_id": 1, "title": "Starter fund"},
+            },
+        ],
+        "periods": ["2024-01-01", "2024-02-01"],
+        "change_pct": [None, -62.5, 100.0, 0.33, 12345.67],
+        "counts": {1: 3, "2": 4},
+    }
+
+    def test_same_bytes_as_json_renderer(self):
+        self.assertEqual(FastJSONRenderer().render(self.payload), JSONRenderer().render(self.payload))
+
+    def test_indented_output_uses_json_renderer(self):
+        context = {"indent": 2}
+        self.assertEqual(
+            FastJSONRenderer().render(self.payload, "application/json", context),
+            JSONRenderer().render(self.payload, "application/json", context),
+        )
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_float_differences(self):
+        self.assertEqual(JSONRenderer().render([1e16, 1e-05]), b"[1e+16,1e-05]")
+        self.assertEqual(FastJSONRenderer().render([1e16, 1e-05]), b"[1e16,0.00001]")
+
+        with self.assertRaises(ValueError):
+            JSONRenderer().render([float("nan")])
+        self.assertEqual(FastJSONRenderer().render([float("nan"), float("inf")]), b"[null,null]")
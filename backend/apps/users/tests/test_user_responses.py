@@ -0,0 +1,33 @@
+# backend/apps/users/tests/test_user_responses.py
+from django.test import TestCase
+
+from apps.users.models import UserResponse
+
+from .utils import auth_client, create_user
+
+
+class UserResponseListTests(TestCase):
+    """The finance form loads one user's latest response, not every response."""
+
+    def setUp(self):
+        self.user = create_user()
+        self.other = create_user(email="other@example.com")
+        self.first = UserResponse.objects.create(user_id=self.user, salary_confirmed=False)
+        self.latest = UserResponse.objects.create(user_id=self.user, salary_confirmed=True)
+        UserResponse.objects.create(user_id=self.other, salary_confirmed=True)
+
+    def test_filter_by_user_latest_first(self):
+        response = auth_client(self.user).get("/api/user-responses/", {"user_id": self.user.user_id})
+
+        self.assertEqual(response.status_code, 200)
+        ids = [row["response_id"] for row in response.json()["results"]]
+        self.assertEqual(ids, [self.latest.response_id, self.first.response_id])
+
+    def test_page_size_one_is_the_current_response(self):
+        response = auth_client(self.user).get(
+            "/api/user-responses/", {"user_id": self.user.user_id, "page_size": 1}
+        )
+
+        body = response.json()
+        self.assertEqual([row["response_id"] for row in body["results"]], [self.latest.response_id])
+        self.assertIsNotNone(body["next"])
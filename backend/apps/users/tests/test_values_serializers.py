@@ -0,0 +1,55 @@
+# backend/apps/users/tests/test_values_serializers.py
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework import viewsets
+
+from apps.users.models import UserResponse
+from apps.users.services import BABY_STEP_RULES, update_baby_steps
+from apps.users.views import (
+    ChildrenContributionViewSet,
+    ExpenseViewSet,
+    UserMilestoneViewSet,
+    UserResponseViewSet,
+)
+
+from .utils import auth_client, create_user, milestone_categories, seed_user_data
+
+
+class ValuesSerializerParityTests(TestCase):
+    """The values() list path renders the same bytes as the ModelSerializer."""
+
+    def setUp(self):
+        self.user = create_user()
+        seed_user_data(self.user, 3, milestone_categories())
+        UserResponse.objects.create(
+            user_id=self.user, salary_confirmed=True, has_debt=True, debt_amount=Decimal("1234.50"),
+            emergency_savings_amount=Decimal("0.10"), pay_off_home=False,
+        )
+        update_baby_steps(self.user, set(BABY_STEP_RULES))
+        self.client = auth_client(self.user)
+
+    def assertSameBody(self, viewset, path):
+        cache.clear()
+        fast = self.client.get(path)
+        cache.clear()
+        with mock.patch.object(viewset, "list", viewsets.ModelViewSet.list):
+            model = self.client.get(path)
+
+        self.assertEqual(fast.status_code, 200, fast.content)
+        self.assertTrue(fast.json()["results"])
+        self.assertEqual(fast.content, model.content)
+
+    def test_expenses(self):
+        self.assertSameBody(ExpenseViewSet, "/api/expenses/")
+
+    def test_user_milestones(self):
+        self.assertSameBody(UserMilestoneViewSet, "/api/user-milestones/")
+
+    def test_user_responses(self):
+        self.assertSameBody(UserResponseViewSet, f"/api/user-responses/?user_id={self.user.user_id}")
+
+    def test_children_contributions(self):
+        self.assertSameBody(ChildrenContributionViewSet, f"/api/children-contributions/?user_id={self.user.user_id}")
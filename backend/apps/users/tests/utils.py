@@ -0,0 +1,46 @@
+# backend/apps/users/tests/utils.py
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.test import Client
+
+from apps.users.milestone_logic import MILESTONE_CATEGORIES
+from apps.users.models import Category, ChildrenContribution, Expense, User, UserResponse
+from apps.users.testing import access_token
+
+
+def create_user(email="user@example.com", password="test-pass", **fields):
+    defaults = {
+        "username": "Test", "first_name": "Test", "last_name": "User",
+        "phone_number": "416-555-0100", "country": "Canada", "province_state": "Ontario",
+        "city": "Toronto", "postal_code": "M5V 2T6", "salary": Decimal("5000.00"),
+    }
+    defaults.update(fields)
+    return User.objects.create_user(email=email, password=password, **defaults)
+
+
+def milestone_categories() -> list:
+    return [Category.objects.get_or_create(name=name)[0] for name in MILESTONE_CATEGORIES.values()]
+
+
+def seed_user_data(user, size, categories):
+    """`size` expenses (cycling through `categories`), children and responses."""
+    today = date.today()
+    expenses = [
+        Expense.objects.create(
+            user_id=user, category_id=categories[n % len(categories)],
+            expense_date=today - timedelta(days=n), amount=Decimal("25.00"),
+        )
+        for n in range(size)
+    ]
+    for _ in range(size):
+        ChildrenContribution.objects.create(
+            user_id=user, child_name="Child", parent_name="Test",
+            total_contribution_planned=Decimal("1000.00"),
+        )
+        UserResponse.objects.create(user_id=user, salary_confirmed=True, has_children=True)
+    return expenses
+
+
+def auth_client(user) -> Client:
+    return Client(HTTP_AUTHORIZATION=f"Bearer {access_token(user)}")
@@ -5,6 +5,7 @@ from .views import (
     ChildrenContributionViewSet, MilestoneViewSet,
     UserMilestoneViewSet, UserResponseViewSet
 )
+from . import async_views
 
 router = DefaultRouter()
 router.register(r'users', UserViewSet, basename='user')
@@ -16,5 +17,8 @@ router.register(r'user-milestones', UserMilestoneViewSet, basename='user-milesto
 router.register(r'user-responses', UserResponseViewSet, basename='user-response')
 
 urlpatterns = [
+    # Async variants, concurrent when served through config/asgi.py
+    path('async/users/dashboard/', async_views.dashboard, name='async-dashboard'),
+    path('async/user-responses/milestones-status/', async_views.milestones_status, name='async-milestones-status'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
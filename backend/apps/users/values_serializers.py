@@ -0,0 +1,104 @@
+# backend/apps/users/values_serializers.py
+from rest_framework import serializers
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.response import Response
+
+from .serializers import (
+    ChildrenContributionSerializer,
+    ExpenseSerializer,
+    UserMilestoneSerializer,
+    UserResponseSerializer,
+)
+
+
+class ValuesSerializer:
+    """
+    Read-only fast path for list endpoints.
+
+    Built from an existing ModelSerializer: every readable field becomes a
+    values() lookup (dotted sources and nested serializers turn into
+    joins) plus that field's own to_representation(). Rows are serialized
+    without instantiating models or walking DRF's per-field attribute
+    lookup, and the output matches the ModelSerializer field for field.
+    Write paths keep using the ModelSerializer.
+    """
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        self._plan = self._build_plan(serializer_class(), prefix="")
+        self.lookups = sorted(set(self._collect_lookups(self._plan)))
+
+    def _build_plan(self, serializer, prefix):
+        plan = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if field.source == "*" or isinstance(field, serializers.SerializerMethodField):
+                raise ValueError(f"{type(serializer).__name__}.{name} cannot be read from values()")
+
+            lookup = prefix + field.source.replace(".", "__")
+            if isinstance(field, serializers.BaseSerializer):
+                # Nested serializer over a foreign key: join its columns in
+                plan.append((name, lookup, self._build_plan(field, prefix=lookup + "__")))
+            elif isinstance(field, serializers.RelatedField):
+                if not isinstance(field, PrimaryKeyRelatedField) or field.pk_field is not None:
+                    raise ValueError(f"{type(serializer).__name__}.{name}: unsupported related field")
+                plan.append((name, lookup, None))  # values() already gives the pk
+            else:
+                plan.append((name, lookup, field.to_representation))
+        return plan
+
+    def _collect_lookups(self, plan):
+        for _, lookup, converter in plan:
+            if isinstance(converter, list):
+                yield lookup
+                yield from self._collect_lookups(converter)
+            else:
+                yield lookup
+
+    def _to_representation(self, plan, row):
+        data = {}
+        for name, lookup, converter in plan:
+            value = row[lookup]
+            if value is None:
+                data[name] = None
+            elif isinstance(converter, list):
+                data[name] = self._to_representation(converter, row)
+            elif converter is None:
+                data[name] = value
+            else:
+                data[name] = converter(value)
+        return data
+
+    def project(self, queryset):
+        """The queryset as values() rows carrying every lookup this serializer needs."""
+        return queryset.values(*self.lookups)
+
+    def to_representation(self, row) -> dict:
+        return self._to_representation(self._plan, row)
+
+    def serialize(self, rows) -> list:
+        return [self._to_representation(self._plan, row) for row in rows]
+
+
+expense_values = ValuesSerializer(ExpenseSerializer)
+children_contribution_values = ValuesSerializer(ChildrenContributionSerializer)
+user_milestone_values = ValuesSerializer(UserMilestoneSerializer)
+user_response_values = ValuesSerializer(UserResponseSerializer)
+
+
+class ValuesListMixin:
+    """
+    ModelViewSet mixin: list() serializes through `values_serializer`
+    instead of the ModelSerializer. Pagination runs on the values() rows;
+    the cursor ordering field must be one of the serializer's fields.
+    """
+    values_serializer = None
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.values_serializer.project(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.values_serializer.serialize(page))
+        return Response(self.values_serializer.serialize(queryset))
@@ -1,12 +1,20 @@
 # backend/apps/users/views.py
 
+import codecs
+import copy
+import csv
+import json
 from decimal import Decimal
+from itertools import islice
 
-from datetime import date, timedelta
+from datetime import date
 
 
-from django.db.models import Sum
-from django.utils import timezone
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
@@ -16,6 +24,7 @@ from rest_framework.viewsets import ModelViewSet
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 
 from .models import (
     User,
@@ -32,6 +41,7 @@ from .serializers import (
     LoginSerializer,
     CategorySerializer,
     ExpenseSerializer,
+    BulkExpenseRowSerializer,
     ChildrenContributionSerializer,
     MilestoneSerializer,
     UserMilestoneSerializer,
@@ -39,11 +49,207 @@ from .serializers import (
     JWTLoginSerializer,
 )
 
-from .services import recalculate_baby_steps_and_email
-from .services import check_budget_and_send_alert
+from .services import recalculate_baby_steps_and_email, changed_response_fields
 from .services import trigger_budget_alerts_for_user
+from .services import get_month_spend
+from .services import calculate_monthly_summary
+from .services import ExpenseBulkWrite
+from .services import (
+    ANALYTICS_MAX_PERIODS,
+    ANALYTICS_PERIODS,
+    analytics_period_count,
+    default_analytics_range,
+    get_category_analytics,
+)
 from .milestone_logic import evaluate_milestones
-from drf_spectacular.utils import extend_schema, OpenApiParameter
+from .caching import cache_timeout, milestone_validators, user_cache_key, user_payload_validators
+from .conditional import conditional
+from .renderers import CSVRenderer, NDJSONRenderer
+from .values_serializers import (
+    ValuesListMixin,
+    expense_values,
+    children_contribution_values,
+    user_milestone_values,
+    user_response_values,
+)
+from .pagination import (
+    ExpenseCursorPagination,
+    UserMilestoneCursorPagination,
+    UserResponseCursorPagination,
+    ChildrenContributionCursorPagination,
+)
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
+
+
+# =====================================================================
+#                       DASHBOARD HELPERS
+# =====================================================================
+
+def get_recent_expenses(user, limit=5):
+    """Serialized data of the user's most recent expenses."""
+    recent_expenses_qs = (
+        Expense.objects.filter(user_id=user.pk)
+        .select_related("user_id", "category_id")
+        .order_by("-expense_date")[:limit]
+    )
+    return ExpenseSerializer(recent_expenses_qs, many=True).data
+
+
+def build_dashboard_payload(user, recent_expenses, monthly_expenses, milestone_status):
+    """
+    Assemble the dashboard payload. Shared by the sync dashboard action and
+    the async dashboard view, which load the three inputs concurrently.
+    """
+    # Use Decimal defaults in case fields are null
+    total_balance = user.total_balance or Decimal("0")
+    monthly_income = user.salary or Decimal("0")
+
+    # ---- savings rate (% of income not spent) ----
+    if monthly_income > 0:
+        savings_rate = float(
+            (monthly_income - monthly_expenses) / monthly_income * 100
+        )
+    else:
+        savings_rate = 0.0
+
+    return {
+        "total_balance": str(total_balance),
+        "monthly_income": str(monthly_income),
+        "monthly_expenses": str(monthly_expenses),
+        "savings_rate": round(savings_rate, 2),
+        "recent_expenses": recent_expenses,
+        "milestone_status": milestone_status,
+    }
+
+
+# =====================================================================
+#                   CONDITIONAL GET VALIDATORS
+# =====================================================================
+
+def dashboard_validators(request):
+    return user_payload_validators("dashboard", request.user.user_id)
+
+
+def monthly_summary_validators(request):
+    if not request.user.is_authenticated:
+        return None, None
+    return user_payload_validators("monthly-summary", request.user.user_id)
+
+
+def milestone_status_validators(request):
+    user_id = request.query_params.get("user_id")
+    if not user_id:
+        return None, None
+    return milestone_validators(user_id)
+
+
+# =====================================================================
+#                       BULK INGESTION HELPERS
+# =====================================================================
+
+def build_bulk_expenses(rows, users, categories, seen):
+    """
+    Expense objects for one validated chunk of bulk rows.
+
+    `users` / `categories` map ids resolved by earlier chunks; the ids this
+    chunk adds cost one in_bulk query each. Uniqueness of (user, date,
+    category) is checked against `seen` (earlier rows of the upload) and
+    with one query against the table. Returns (expenses, errors), errors
+    being per-row dicts like ListSerializer.errors, or None when all is valid.
+    """
+    for model, resolved, field in ((User, users, "user_id"), (Category, categories, "category_id")):
+        missing = {row[field] for row in rows} - resolved.keys()
+        if missing:
+            resolved.update(model.objects.in_bulk(missing))
+
+    keys = [(row["user_id"], row["expense_date"], row["category_id"]) for row in rows]
+    known = [key for key in keys if key[0] in users and key[2] in categories]
+    stored = set()
+    if known:
+        stored = set(
+            Expense.objects.filter(
+                user_id__in={key[0] for key in known},
+                expense_date__in={key[1] for key in known},
+                category_id__in={key[2] for key in known},
+            ).values_list("user_id", "expense_date", "category_id")
+        )
+
+    # Same messages as PrimaryKeyRelatedField and UniqueTogetherValidator
+    errors, expenses = [], []
+    for row, key in zip(rows, keys):
+        row_errors = {}
+        for field, resolved in (("user_id", users), ("category_id", categories)):
+            if row[field] not in resolved:
+                row_errors[field] = [f'Invalid pk "{row[field]}" - object does not exist.']
+        if not row_errors and (key in stored or key in seen):
+            row_errors["non_field_errors"] = [
+                "The fields user_id, expense_date, category_id must make a unique set."
+            ]
+        seen.add(key)
+        errors.append(row_errors)
+        expenses.append(Expense(
+            user_id=users.get(row["user_id"]),
+            category_id=categories.get(row["category_id"]),
+            expense_date=row["expense_date"],
+            amount=row["amount"],
+        ) if not row_errors else None)
+
+    if any(errors):
+        return [], errors
+    return expenses, None
+
+
+# =====================================================================
+#                       EXPENSE EXPORT HELPERS
+# =====================================================================
+
+EXPORT_FIELDS = [
+    "expense_id", "expense_date", "user_id", "category_id", "amount",
+    "created_at", "user_username", "category_name",
+]
+
+
+def iter_expense_rows(queryset, chunk_size):
+    """
+    Yield the queryset's expenses as serialized dicts (same fields and
+    formatting as the list endpoint), newest first, one keyset-paginated
+    query per chunk. Unlike iterator(), this keeps memory flat on MySQL
+    too, where mysqlclient buffers whole result sets.
+    """
+    queryset = expense_values.project(queryset.order_by("-expense_date", "-expense_id"))
+    last = None
+    while True:
+        chunk = queryset
+        if last is not None:
+            chunk = chunk.filter(
+                Q(expense_date__lt=last["expense_date"])
+                | Q(expense_date=last["expense_date"], expense_id__lt=last["expense_id"])
+            )
+        rows = list(chunk[:chunk_size])
+        for row in rows:
+            yield expense_values.to_representation(row)
+        if len(rows) < chunk_size:
+            return
+        last = rows[-1]
+
+
+class _Echo:
+    """File-like object whose write() returns the line, for csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        yield writer.writerow([row[field] for field in EXPORT_FIELDS])
+
+
+def stream_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row) + "\n"
 
 
 # =====================================================================
@@ -109,67 +315,32 @@ class UserViewSet(viewsets.ModelViewSet):
         url_path="dashboard",
         permission_classes=[IsAuthenticated],
     )
+    @conditional(dashboard_validators)
     def dashboard(self, request):
         """
         Return very basic dashboard numbers for the logged-in user.
+        Cached per user; writes to the user's data bump the cache version.
+        Polls with a current ETag / Last-Modified get 304 Not Modified.
         """
         user = request.user  # this is your custom User model instance
 
-        # Use Decimal defaults in case fields are null
-        total_balance = user.total_balance or Decimal("0")
-        monthly_income = user.salary or Decimal("0")
-        
-        # ---- current month date range ----
-        today = timezone.now().date()
-        start_of_month = today.replace(day=1)
-
-        # simple "next month" calculation
-        if start_of_month.month == 12:
-            next_month = start_of_month.replace(
-                year=start_of_month.year + 1,
-                month=1
-            )
-        else:
-            next_month = start_of_month.replace(month=start_of_month.month + 1)
-            
-            # ---- recent expenses (last 5) ----
-        recent_expenses_qs = (
-            Expense.objects.filter(user_id=user)
-            .select_related("category_id")
-            .order_by("-expense_date")[:5]
-        )
-        recent_expenses = ExpenseSerializer(recent_expenses_qs, many=True).data
+        key = user_cache_key("dashboard", user.user_id)
+        data = cache.get(key)
+        if data is None:
+            data = self._build_dashboard(user)
+            cache.set(key, data, cache_timeout())
+        return Response(data)
 
-        # ---- sum this month's expenses ----
-        monthly_expenses = (
-            Expense.objects.filter(
-                user_id=user,
-                expense_date__gte=start_of_month,
-                expense_date__lt=next_month,
-            ).aggregate(total=Sum("amount"))["total"]
-            or Decimal("0")
+    def _build_dashboard(self, user):
+        """Compute the dashboard payload (uncached)."""
+        return build_dashboard_payload(
+            user,
+            recent_expenses=get_recent_expenses(user),
+            # ---- sum this month's expenses (MonthlySpend rollup) ----
+            monthly_expenses=get_month_spend(user),
+            # ---- milestone / baby steps status ----
+            milestone_status=evaluate_milestones(user.user_id),
         )
-        
-        # ---- savings rate (% of income not spent) ----
-        if monthly_income > 0:
-            savings_rate = float(
-                (monthly_income - monthly_expenses) / monthly_income * 100
-            )
-        else:
-            savings_rate = 0.0
-            
-        # ---- milestone / baby steps status ----
-        milestone_status = evaluate_milestones(user.user_id)
-
-        data = {
-            "total_balance": str(total_balance),
-            "monthly_income": str(monthly_income),
-             "monthly_expenses": str(monthly_expenses),
-             "savings_rate": round(savings_rate, 2),
-             "recent_expenses": recent_expenses,
-             "milestone_status": milestone_status,
-        }
-        return Response(data)
     
        
 # =====================================================================
@@ -185,8 +356,11 @@ class CategoryViewSet(viewsets.ModelViewSet):
 #                       EXPENSE VIEWSET
 # =====================================================================
 
-class ExpenseViewSet(viewsets.ModelViewSet):
+class ExpenseViewSet(ValuesListMixin, viewsets.ModelViewSet):
     serializer_class = ExpenseSerializer
+    values_serializer = expense_values
+    pagination_class = ExpenseCursorPagination
+    bulk_chunk_size = 500
 
     def get_queryset(self):
         """
@@ -203,7 +377,7 @@ class ExpenseViewSet(viewsets.ModelViewSet):
         if user_id:
             qs = qs.filter(user_id__user_id=user_id)
         elif self.request.user.is_authenticated:
-            qs = qs.filter(user_id=self.request.user)
+            qs = qs.filter(user_id=self.request.user.pk)
 
         category_id = self.request.query_params.get("category_id")
         if category_id:
@@ -217,25 +391,170 @@ class ExpenseViewSet(viewsets.ModelViewSet):
         if date_to:
             qs = qs.filter(expense_date__lte=date_to)
 
-        # Most recent first
+        # Most recent first (same ordering as ExpenseCursorPagination)
         return qs.order_by("-expense_date", "-created_at")
 
 
     def perform_create(self, serializer):
         """
-        When a new expense is created, also check budget and send alerts.
+        When a new expense is created, run the budget evaluation pipeline once.
         """
         expense = serializer.save()
-        # Trigger budget/overspend alert email (FR-7)
-        check_budget_and_send_alert(expense.user_id)
+        # Budget/overspend alert email (FR-7)
         # expense.user_id is a FK to User object, not just an int
         trigger_budget_alerts_for_user(expense.user_id)
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request):
+        """
+        Create many expenses in one request.
+        Body is either a JSON array of expenses or a CSV file
+        (Content-Type: text/csv) with a header row using the same field names.
+        user_id defaults to the authenticated user when a row omits it.
+        Rows are validated and inserted in chunks inside one transaction,
+        with a fixed number of queries per chunk (not per row); budget
+        alerts and milestones are recalculated once per affected user.
+        """
+        if request.content_type.startswith("text/csv"):
+            rows = csv.DictReader(codecs.iterdecode(request.stream or [], "utf-8"))
+        else:
+            rows = request.data
+            if not isinstance(rows, list):
+                return Response(
+                    {"detail": "Expected a JSON array of expenses."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        rows = iter(rows)
+        created = 0
+        write = ExpenseBulkWrite()
+        users, categories, seen = {}, {}, set()
+        try:
+            with transaction.atomic():
+                while True:
+                    chunk = list(islice(rows, self.bulk_chunk_size))
+                    if not chunk:
+                        break
+                    for row in chunk:
+                        if isinstance(row, dict):
+                            row.setdefault("user_id", request.user.pk)
+
+                    serializer = BulkExpenseRowSerializer(data=chunk, many=True)
+                    errors = None
+                    if serializer.is_valid():
+                        expenses, errors = build_bulk_expenses(
+                            serializer.validated_data, users, categories, seen
+                        )
+                    else:
+                        errors = serializer.errors
+                    if errors:
+                        transaction.set_rollback(True)
+                        return Response(
+                            {"row_offset": created, "errors": errors},
+                            status=status.HTTP_400_BAD_REQUEST,
+                        )
+
+                    write.add(expenses)
+                    created += len(expenses)
+                # Rollup, cache versions and milestones once for the whole upload
+                affected_users = write.finish()
+        except IntegrityError as exc:
+            # e.g. duplicate rows inside the same upload
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        for user in affected_users:
+            trigger_budget_alerts_for_user(user)
+
+        return Response({"created": created}, status=status.HTTP_201_CREATED)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="export",
+        renderer_classes=[CSVRenderer, NDJSONRenderer, JSONRenderer],
+    )
+    def export(self, request):
+        """
+        Stream the full expense history as CSV (default) or NDJSON:
+        /api/expenses/export/?format=csv|ndjson
+        Accepts the same filters as the list endpoint. Rows are fetched
+        in chunks of settings.EXPORT_CHUNK_SIZE, so memory stays flat.
+        """
+        export_format = request.query_params.get("format", "csv")
+        if export_format not in ("csv", "ndjson"):
+            return Response(
+                {"detail": "format must be csv or ndjson."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        rows = iter_expense_rows(self.get_queryset(), settings.EXPORT_CHUNK_SIZE)
+        if export_format == "csv":
+            response = StreamingHttpResponse(stream_csv(rows), content_type="text/csv")
+        else:
+            response = StreamingHttpResponse(stream_ndjson(rows), content_type="application/x-ndjson")
+        response["Content-Disposition"] = f'attachment; filename="expenses.{export_format}"'
+        return response
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(name="period", type=str, enum=list(ANALYTICS_PERIODS), required=False),
+            OpenApiParameter(name="date_from", type=str, required=False, description="YYYY-MM-DD"),
+            OpenApiParameter(name="date_to", type=str, required=False, description="YYYY-MM-DD"),
+            OpenApiParameter(name="window", type=int, required=False, description="Rolling average periods"),
+        ]
+    )
+    @action(detail=False, methods=["get"], url_path="analytics")
+    def analytics(self, request):
+        """
+        Per-category monthly/weekly spending totals for the authenticated
+        user, with rolling averages and period-over-period changes.
+        Defaults to the last 12 periods up to today and a 3-period window;
+        at most ANALYTICS_MAX_PERIODS periods per request. Cached per user
+        and range.
+        """
+        period = request.query_params.get("period", "month")
+        if period not in ANALYTICS_PERIODS:
+            return Response(
+                {"detail": f"period must be one of {', '.join(ANALYTICS_PERIODS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        default_from, default_to = default_analytics_range(period)
+        try:
+            date_from = date.fromisoformat(request.query_params.get("date_from", default_from.isoformat()))
+            date_to = date.fromisoformat(request.query_params.get("date_to", default_to.isoformat()))
+            window = int(request.query_params.get("window", 3))
+        except ValueError:
+            return Response(
+                {"detail": "date_from/date_to must be YYYY-MM-DD and window an integer."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if date_from > date_to or window < 1:
+            return Response(
+                {"detail": "date_from must not be after date_to, and window must be positive."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if analytics_period_count(period, date_from, date_to) > ANALYTICS_MAX_PERIODS[period]:
+            return Response(
+                {"detail": f"date range must span at most {ANALYTICS_MAX_PERIODS[period]} {period}s."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        user = request.user
+        key = user_cache_key("analytics", user.user_id, period, date_from, date_to, window)
+        data = cache.get(key)
+        if data is None:
+            data = get_category_analytics(user, period, date_from, date_to, window)
+            cache.set(key, data, cache_timeout())
+        return Response(data)
+
     @action(detail=False, methods=["get"], url_path="monthly-summary")
+    @conditional(monthly_summary_validators)
     def monthly_summary(self, request):
         """
         Returns this month's spending vs budget for the authenticated user.
         Used by the Daily Expenses page to show 75/90/100% alerts visually.
+        Polls with a current ETag / Last-Modified get 304 Not Modified.
         """
         user = request.user
         if not user.is_authenticated:
@@ -244,35 +563,9 @@ class ExpenseViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_401_UNAUTHORIZED,
             )
 
-        today = timezone.now().date()
-        first_day = today.replace(day=1)
-
-        total_spent = (
-            Expense.objects.filter(
-                user_id=user,
-                expense_date__gte=first_day,
-                expense_date__lte=today,
-            ).aggregate(total=Sum("amount"))["total"]
-            or Decimal("0")
-        )
-
-        budget = user.salary or Decimal("0")
-        percentage = int((total_spent / budget) * 100) if budget > 0 else 0
-
-        alert_level = 0
-        if percentage >= 100:
-            alert_level = 100
-        elif percentage >= 90:
-            alert_level = 90
-        elif percentage >= 75:
-            alert_level = 75
-
-        data = {
-            "total_spent": str(total_spent),
-            "budget": str(budget),
-            "percentage": percentage,
-            "alert_level": alert_level,
-        }
+        # Same summary the budget pipeline uses on expense writes
+        data = calculate_monthly_summary(user)
+        data["percentage"] = int(data["percentage"])
         return Response(data, status=status.HTTP_200_OK)
 
 
@@ -291,12 +584,14 @@ class ExpenseViewSet(viewsets.ModelViewSet):
     ]
 )
 
-class ChildrenContributionViewSet(viewsets.ModelViewSet):
+class ChildrenContributionViewSet(ValuesListMixin, viewsets.ModelViewSet):
     serializer_class = ChildrenContributionSerializer
+    values_serializer = children_contribution_values
+    pagination_class = ChildrenContributionCursorPagination
 
     def get_queryset(self):
         user_id = self.request.query_params.get("user_id")
-        qs = ChildrenContribution.objects.all()
+        qs = ChildrenContribution.objects.all().select_related("user_id")
 
         if user_id:
             qs = qs.filter(user_id=user_id)
@@ -312,21 +607,49 @@ class MilestoneViewSet(viewsets.ModelViewSet):
     serializer_class = MilestoneSerializer
 
 
-class UserMilestoneViewSet(viewsets.ModelViewSet):
+class UserMilestoneViewSet(ValuesListMixin, viewsets.ModelViewSet):
     queryset = UserMilestone.objects.all().select_related("user_id", "milestone_id")
     serializer_class = UserMilestoneSerializer
+    values_serializer = user_milestone_values
+    pagination_class = UserMilestoneCursorPagination
 
 
 # =====================================================================
 #                       USER RESPONSE VIEWSET
 # =====================================================================
 
-class UserResponseViewSet(viewsets.ModelViewSet):
-    queryset = UserResponse.objects.all().select_related("user_id")
+@extend_schema_view(
+    list=extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="user_id",
+                type=int,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Filter responses by user"
+            )
+        ]
+    )
+)
+class UserResponseViewSet(ValuesListMixin, viewsets.ModelViewSet):
     serializer_class = UserResponseSerializer
+    values_serializer = user_response_values
+    pagination_class = UserResponseCursorPagination
+
+    def get_queryset(self):
+        user_id = self.request.query_params.get("user_id")
+        qs = UserResponse.objects.all().select_related("user_id")
+
+        # Latest first (UserResponseCursorPagination, user_resp_latest_idx),
+        # so ?user_id=&page_size=1 is the user's current answers
+        if user_id:
+            qs = qs.filter(user_id=user_id)
+
+        return qs
 
     # Check milestone progress
     @action(detail=False, methods=["get"], url_path="milestones-status")
+    @conditional(milestone_status_validators)
     def milestone_status(self, request):
         user_id = request.query_params.get("user_id")
         data = evaluate_milestones(user_id)
@@ -334,10 +657,21 @@ class UserResponseViewSet(viewsets.ModelViewSet):
 
     # When user submits Dave Ramsey form
     def perform_create(self, serializer):
+        previous = (
+            UserResponse.objects.filter(user_id=serializer.validated_data["user_id"])
+            .order_by("-submitted_at")
+            .first()
+        )
         instance = serializer.save()
-        recalculate_baby_steps_and_email(instance.user_id)
+        # Only the steps reading a changed answer are re-evaluated
+        recalculate_baby_steps_and_email(
+            instance.user_id, response_fields=changed_response_fields(previous, instance)
+        )
 
     # When the user updates the finance form
     def perform_update(self, serializer):
+        previous = copy.copy(serializer.instance)
         instance = serializer.save()
-        recalculate_baby_steps_and_email(instance.user_id)
+        recalculate_baby_steps_and_email(
+            instance.user_id, response_fields=changed_response_fields(previous, instance)
+        )
@@ -31,6 +31,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'apps.users.middleware.QueryMetricsMiddleware',
+    'apps.users.middleware.ThresholdGZipMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -60,6 +62,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'config.wsgi.application'
+ASGI_APPLICATION = 'config.asgi.application'
 
 # Database
 DATABASES = {
@@ -70,12 +73,48 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD', default='fullstack_password'),
         'HOST': config('DB_HOST', default='localhost'),
         'PORT': config('DB_PORT', default='3306'),
+        # Keep connections open between requests (seconds; 0 closes them
+        # after every request). The async views' worker threads reuse theirs
+        # the same way (apps/users/async_views.py).
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {
             'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
         },
     }
 }
 
+# Cache: per-process locmem by default. Point CACHE_BACKEND / CACHE_LOCATION
+# at a shared backend (e.g. django.core.cache.backends.redis.RedisCache,
+# redis://redis:6379/1) so every worker sees the same entries.
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='pfm-default'),
+    }
+}
+
+# Seconds a cached per-user payload (dashboard, ...) may live. The cache
+# version keys expire after the same time, which bounds how long a worker
+# with a process-local cache can miss another worker's write.
+USER_PAYLOAD_CACHE_TIMEOUT = config('USER_PAYLOAD_CACHE_TIMEOUT', default=300, cast=int)
+
+# Backends whose entries are only visible to the process that wrote them
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+# 304 Not Modified on the polled endpoints. Their ETags come from the cache
+# version keys, so every worker must share them: on by default only with a
+# shared CACHE_BACKEND (`check --deploy` warns otherwise). Set it to True
+# explicitly for a single-process server.
+CONDITIONAL_GET = config(
+    'CONDITIONAL_GET',
+    default=CACHES['default']['BACKEND'] not in PROCESS_LOCAL_CACHE_BACKENDS,
+    cast=bool,
+)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -104,17 +143,67 @@ AUTH_USER_MODEL = 'users.User'
 
 # REST Framework
 REST_FRAMEWORK = {
+    # JWT without the per-request User query (apps/users/authentication.py)
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.users.authentication.ClaimsJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # orjson-backed, same bytes as DRF's JSONRenderer (apps/users/renderers.py)
+    "DEFAULT_RENDERER_CLASSES": (
+        "apps.users.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
 }
 
+# Seconds before a worker reloads its category name -> id map
+# (apps/users/category_registry.py); signals update the current worker at
+# once and a lookup miss reloads it. Empty = only reload on those.
+CATEGORY_REGISTRY_TTL = config('CATEGORY_REGISTRY_TTL', default=60, cast=lambda v: int(v) if v else None)
+
+# Cursor pagination for the list endpoints (apps/users/pagination.py)
+API_PAGE_SIZE = config('API_PAGE_SIZE', default=50, cast=int)
+API_MAX_PAGE_SIZE = config('API_MAX_PAGE_SIZE', default=500, cast=int)
+
+# Rows fetched per query by the streaming expense export
+EXPORT_CHUNK_SIZE = config('EXPORT_CHUNK_SIZE', default=2000, cast=int)
+
+# Responses smaller than this many bytes are sent uncompressed
+# (apps.users.middleware.ThresholdGZipMiddleware)
+GZIP_MIN_SIZE = config('GZIP_MIN_SIZE', default=1024, cast=int)
 
 
+
+# Per-request SQL metrics (apps/users/middleware.py): Server-Timing header,
+# one log line per request, and a warning when a view exceeds its query
+# threshold. Per-view limits are keyed by (HTTP method, URL name), e.g.
+# {('GET', 'user-dashboard'): 5}: a list and a create share a URL name but
+# not a query count.
+QUERY_METRICS_ENABLED = config('QUERY_METRICS_ENABLED', default=True, cast=bool)
+QUERY_COUNT_WARNING_THRESHOLD = config('QUERY_COUNT_WARNING_THRESHOLD', default=20, cast=int)
+QUERY_COUNT_WARNING_THRESHOLDS = {
+    ('GET', 'user-dashboard'): 10,
+    ('GET', 'user-response-milestones-status'): 5,
+    ('GET', 'expense-list'): 5,
+}
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'apps.users.middleware': {
+            'handlers': ['console'],
+            'level': config('QUERY_METRICS_LOG_LEVEL', default='INFO'),
+            'propagate': False,
+        },
+    },
+}
+
 # JWT Settings
 SIMPLE_JWT = {
     "USER_ID_FIELD": "user_id",
@@ -123,6 +212,10 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
 }
 
+# Seconds before a worker reloads the deactivated users and revoked tokens
+# (apps/users/authentication.py); signals update the current worker at once.
+TOKEN_ACCESS_TTL = config('TOKEN_ACCESS_TTL', default=60, cast=int)
+
 # CORS Settings
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
@@ -155,4 +248,12 @@ EMAIL_HOST_USER = "musfiqur.rahman1620@gmail.com"
 EMAIL_HOST_PASSWORD = "wfez zlod wwml zqxf"
 
 # From address used in send_mail when 'from_email=None'
-DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
\ No newline at end of file
+DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
+
+# Email outbox worker (manage.py send_queued_emails)
+EMAIL_OUTBOX_BATCH_SIZE = config('EMAIL_OUTBOX_BATCH_SIZE', default=50, cast=int)
+EMAIL_OUTBOX_MAX_ATTEMPTS = config('EMAIL_OUTBOX_MAX_ATTEMPTS', default=5, cast=int)
+EMAIL_OUTBOX_RETRY_DELAY = config('EMAIL_OUTBOX_RETRY_DELAY', default=60, cast=int)  # seconds, doubled per attempt
+# Seconds a worker's claim on a batch lasts; after that another worker may
+# send the batch again, so keep it well above the time to send one batch.
+EMAIL_OUTBOX_CLAIM_TIMEOUT = config('EMAIL_OUTBOX_CLAIM_TIMEOUT', default=300, cast=int)
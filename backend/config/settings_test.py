@@ -0,0 +1,35 @@
+# backend/config/settings_test.py
+"""
+Fast, self-contained settings profile: in-memory SQLite, local cache and
+email, cheap password hashing. Used by the test suite, including the
+query budgets in apps/users/tests/test_query_budgets.py:
+
+    python manage.py test apps.users --settings=config.settings_test
+"""
+import os
+
+os.environ.setdefault('DB_HOST', 'localhost')
+
+from .settings import *  # noqa: E402,F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'pfm-test',
+    }
+}
+
+# Tests run in one process, so the local cache is shared by every request
+CONDITIONAL_GET = True
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+
+LOGGING['loggers']['apps.users.middleware']['level'] = 'WARNING'  # noqa: F405
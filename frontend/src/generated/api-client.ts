@@ -573,6 +573,11 @@ export interface UserMilestonesDestroyParams {
 
 export type UserMilestonesDestroyData = any;
 
+export interface UserResponsesListParams {
+  /** Filter responses by user */
+  user_id?: number;
+}
+
 export type UserResponsesListData = UserResponse[];
 
 export type UserResponsesCreateData = UserResponse;
@@ -1454,10 +1459,14 @@ export class Api<
      * @request GET:/api/user-responses/
      * @secure
      */
-    userResponsesList: (params: RequestParams = {}) =>
+    userResponsesList: (
+      query: UserResponsesListParams,
+      params: RequestParams = {},
+    ) =>
       this.request<UserResponsesListData, any>({
         path: `/api/user-responses/`,
         method: "GET",
+        query: query,
         secure: true,
         format: "json",
         ...params,
@@ -863,6 +863,12 @@ export interface operations {
     };
   };
   user_responses_list: {
+    parameters: {
+      query?: {
+        /** @description Filter responses by user */
+        user_id?: number;
+      };
+    };
     responses: {
       200: {
         content: {
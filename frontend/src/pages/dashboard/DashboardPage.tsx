@@ -188,7 +188,7 @@ const DashboardPage: React.FC = () => {
                 <ul className="mb-0">
                   {recentExpenses.map((exp) => (
                     <li
-                      key={`${exp.expense_date}-${exp.category_id}-${exp.amount}`}
+                      key={exp.expense_id}
                     >
                       {exp.expense_date} – {exp.category_name} – $
                       {Number(exp.amount).toFixed(2)}
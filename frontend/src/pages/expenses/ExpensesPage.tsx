@@ -2,6 +2,7 @@
 import React, { useEffect, useState } from "react";
 import {
   fetchExpensesForUser,
+  fetchMoreExpenses,
   fetchMonthlySummary,
   fetchCategories,
   createExpense,
@@ -36,6 +37,9 @@ const getCurrentUserId = (): number | null => {
 
 const ExpensesPage: React.FC = () => {
   const [expenses, setExpenses] = useState<Expense[]>([]);
+  // `next` link of the last loaded page; null once the history is exhausted
+  const [nextPage, setNextPage] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [summary, setSummary] = useState<MonthlySummary | null>(null);
   const [categories, setCategories] = useState<Category[]>([]);
   const [userId, setUserId] = useState<number | null>(null);
@@ -74,14 +78,30 @@ const ExpensesPage: React.FC = () => {
 
   // Helper: reload expenses + summary (used on first load and after create / filter)
   const reloadData = async (uId: number, filters: ExpenseFilters = {}) => {
-    const [expensesData, summaryData] = await Promise.all([
+    const [expensesPage, summaryData] = await Promise.all([
       fetchExpensesForUser(uId, filters),
       fetchMonthlySummary(),
     ]);
-    setExpenses(expensesData);
+    setExpenses(expensesPage.results);
+    setNextPage(expensesPage.next);
     setSummary(summaryData);
   };
 
+  // Append the next page of history ("Load more")
+  const handleLoadMore = async () => {
+    if (!nextPage) return;
+    try {
+      setLoadingMore(true);
+      const page = await fetchMoreExpenses(nextPage);
+      setExpenses((current) => [...current, ...page.results]);
+      setNextPage(page.next);
+    } catch (err) {
+      console.error("Failed to load more expenses", err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // Initial load
   useEffect(() => {
     const load = async () => {
@@ -100,14 +120,15 @@ const ExpensesPage: React.FC = () => {
         setUserId(currentUserId);
 
         // Load categories, expenses, and summary in parallel
-        const [cats, expensesData, summaryData] = await Promise.all([
+        const [cats, expensesPage, summaryData] = await Promise.all([
           fetchCategories(),
           fetchExpensesForUser(currentUserId),
           fetchMonthlySummary(),
         ]);
 
         setCategories(cats);
-        setExpenses(expensesData);
+        setExpenses(expensesPage.results);
+        setNextPage(expensesPage.next);
         setSummary(summaryData);
 
         // Pre-select first category in form if none chosen yet
@@ -475,7 +496,7 @@ const ExpensesPage: React.FC = () => {
                 </thead>
                 <tbody>
                   {expenses.map((exp) => (
-                    <tr key={`${exp.expense_date}-${exp.category_id}`}>
+                    <tr key={exp.expense_id}>
                       <td>
                         {new Date(exp.expense_date).toLocaleDateString()}
                       </td>
@@ -491,6 +512,19 @@ const ExpensesPage: React.FC = () => {
               </table>
             </div>
           )}
+
+          {nextPage && (
+            <div className="d-grid mt-3">
+              <button
+                type="button"
+                className="btn btn-outline-primary"
+                onClick={handleLoadMore}
+                disabled={loadingMore}
+              >
+                {loadingMore ? "Loading..." : "Load more"}
+              </button>
+            </div>
+          )}
         </div>
       </div>
     </div>
@@ -14,3 +14,23 @@ export const apiClient = new Api({
     };
   },
 });
+
+/** Envelope returned by the cursor-paginated list endpoints. */
+export interface CursorPage<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
+/**
+ * Fetch the page a `next` (or `previous`) link of a cursor-paginated list
+ * points to. Lists load one page at a time; screens call this for
+ * "load more" instead of downloading the whole history up front.
+ */
+export async function fetchPage<T>(url: string): Promise<CursorPage<T>> {
+  const token = localStorage.getItem("access");
+  const res = await apiClient.instance.get<CursorPage<T>>(url, {
+    headers: token ? { Authorization: `Bearer ${token}` } : {},
+  });
+  return res.data;
+}
@@ -1,5 +1,5 @@
 // services/children.service.ts
-import { apiClient } from "./apiClient";
+import { apiClient, CursorPage } from "./apiClient";
 import type { ChildrenContribution, PatchedChildrenContribution } from "../generated/api-client";
 
 export const childrenService = {
@@ -8,7 +8,8 @@ export const childrenService = {
     const res = await apiClient.api.childrenContributionsList({
       user_id: userId,
     });
-    return res.data;
+    // A user's children fit in the first page (API_PAGE_SIZE rows)
+    return (res.data as unknown as CursorPage<ChildrenContribution>).results;
   },
 
   /** Create a new child contribution */
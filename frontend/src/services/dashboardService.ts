@@ -2,6 +2,7 @@
 import axios from "axios";
 
 export interface DashboardExpense {
+  expense_id: number;
   expense_date: string;
   user_id: number;
   category_id: number;
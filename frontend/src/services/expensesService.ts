@@ -1,5 +1,6 @@
 // frontend/src/services/expensesService.ts
 import axios from "axios";
+import { CursorPage, fetchPage } from "./apiClient";
 
 const BASE_URL = "http://localhost:8000/api"; // change to http://backend:8000/api if needed in Docker
 
@@ -19,7 +20,8 @@ api.interceptors.request.use((config) => {
 
 /** Matches your Expense model / serializer */
 export interface Expense {
-  expense_date: string; // primary key (YYYY-MM-DD)
+  expense_id: number; // primary key
+  expense_date: string; // YYYY-MM-DD
   user_id: number;
   category_id: number;
   amount: string;
@@ -50,13 +52,14 @@ export interface ExpenseFilters {
 }
 
 /**
- * Get all expenses for a specific user, with optional filters.
+ * Get the first page of a user's expenses (most recent first), with
+ * optional filters. Pass the page's `next` link to fetchMoreExpenses.
  * Backend: GET /api/expenses/?user_id={userId}&date_from=...&date_to=...&category_id=...
  */
 export async function fetchExpensesForUser(
   userId: number,
   filters: ExpenseFilters = {}
-): Promise<Expense[]> {
+): Promise<CursorPage<Expense>> {
   const params: any = {
     user_id: userId,
   };
@@ -71,10 +74,18 @@ export async function fetchExpensesForUser(
     params.category_id = filters.category_id;
   }
 
-  const response = await api.get<Expense[]>("/expenses/", { params });
+  const response = await api.get<CursorPage<Expense>>("/expenses/", { params });
   return response.data;
 }
 
+/**
+ * Get the next page of expenses.
+ * Backend: the `next` link of the previous page (same filters, cursor-paginated)
+ */
+export async function fetchMoreExpenses(next: string): Promise<CursorPage<Expense>> {
+  return fetchPage<Expense>(next);
+}
+
 /**
  * Create a new daily expense.
  * Backend: POST /api/expenses/
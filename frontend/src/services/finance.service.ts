@@ -1,12 +1,12 @@
-import { apiClient } from "./apiClient";
+import { apiClient, CursorPage } from "./apiClient";
 import type { UserResponse } from "../generated/api-client";
 
 export const financeService = {
   async getResponseForUser(userId: number): Promise<UserResponse | null> {
-    const res = await apiClient.api.userResponsesList();
-    const all = res.data ?? [];
-    const existing = all.find((r) => r.user_id === userId) ?? null;
-    return existing;
+    // Filtered server-side and latest first: the first row is the current one
+    const res = await apiClient.api.userResponsesList({ user_id: userId });
+    const page = res.data as unknown as CursorPage<UserResponse>;
+    return page.results[0] ?? null;
   },
 
   async saveResponseForUser(